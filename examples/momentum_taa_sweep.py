@@ -0,0 +1,94 @@
+import os
+
+import pandas as pd
+import pytz
+
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.dynamic import DynamicUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.trading.backtest import BacktestTradingSession
+from qstrader.trading.sweep import ParameterSweep
+
+from momentum_taa import TopNMomentumAlphaModel
+
+
+# Duration of the backtests
+start_dt = pd.Timestamp('1998-12-22 14:30:00', tz=pytz.UTC)
+burn_in_dt = pd.Timestamp('1999-12-22 14:30:00', tz=pytz.UTC)
+end_dt = pd.Timestamp('2020-12-31 23:59:00', tz=pytz.UTC)
+
+# This utilises the SPDR US sector ETFs, all beginning with XL
+strategy_symbols = ['XL%s' % sector for sector in "BCEFIKPUVY"]
+assets = ['EQ:%s' % symbol for symbol in strategy_symbols]
+
+
+def create_universe():
+    """
+    Create the dynamic universe of sector ETFs, with XLC
+    only included from the first date of its price data.
+
+    Returns
+    -------
+    `DynamicUniverse`
+        The sector ETF universe.
+    """
+    asset_dates = {asset: start_dt for asset in assets}
+    asset_dates['EQ:XLC'] = pd.Timestamp('2018-06-19 00:00:00', tz=pytz.UTC)
+    return DynamicUniverse(asset_dates)
+
+
+def create_session(params, data_handler):
+    """
+    Create the top-N momentum backtest for a single parameter
+    combination, sharing the already loaded data handler.
+
+    Parameters
+    ----------
+    params : `dict`
+        The 'mom_lookback', 'mom_top_n' and 'rebalance_weekday' parameters.
+    data_handler : `DataHandler`
+        The data handler shared by all of the backtests.
+
+    Returns
+    -------
+    `BacktestTradingSession`
+        The (not yet run) backtest trading session.
+    """
+    universe = create_universe()
+    momentum = MomentumSignal(start_dt, universe, lookbacks=[params['mom_lookback']])
+    signals = SignalsCollection({'momentum': momentum}, data_handler)
+    alpha_model = TopNMomentumAlphaModel(
+        signals, params['mom_lookback'], params['mom_top_n'], universe, data_handler
+    )
+    return BacktestTradingSession(
+        start_dt,
+        end_dt,
+        universe,
+        alpha_model,
+        signals=signals,
+        rebalance='weekly',
+        rebalance_weekday=params['rebalance_weekday'],
+        long_only=True,
+        cash_buffer_percentage=0.01,
+        burn_in_dt=burn_in_dt,
+        data_handler=data_handler
+    )
+
+
+if __name__ == "__main__":
+    # Load the CSV data once, to be shared by every backtest
+    csv_dir = os.environ.get('QSTRADER_CSV_DATA_DIR', '.')
+    data_source = CSVDailyBarDataSource(csv_dir, Equity, csv_symbols=strategy_symbols)
+    data_handler = BacktestDataHandler(create_universe(), data_sources=[data_source])
+
+    param_grid = {
+        'mom_lookback': [63, 126, 252],
+        'mom_top_n': [2, 3, 4],
+        'rebalance_weekday': ['MON', 'WED', 'FRI']
+    }
+    sweep = ParameterSweep(create_session, param_grid, data_handler=data_handler)
+    results = sweep.run()
+    print(results.sort_values('sharpe', ascending=False).to_string())
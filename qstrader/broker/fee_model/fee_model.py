@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 
 class FeeModel(object):
     """
@@ -26,3 +28,36 @@ class FeeModel(object):
         raise NotImplementedError(
             "Should implement calc_total_cost()"
         )
+
+    def calc_total_costs(self, assets, quantities, considerations, broker=None):
+        """
+        Calculate the total of any commission and/or tax for each
+        of a batch of trades. By default this calculates the total
+        cost of each trade separately, which fee models may override
+        with a vectorised calculation.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol string of each trade.
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `np.ndarray`
+            The total commission and tax of each trade.
+        """
+        return np.array(
+            [
+                self.calc_total_cost(asset, quantity, consideration, broker)
+                for asset, quantity, consideration in zip(
+                    assets, quantities.tolist(), considerations.tolist()
+                )
+            ],
+            dtype=np.float64
+        )
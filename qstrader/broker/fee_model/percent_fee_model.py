@@ -1,3 +1,5 @@
+import numpy as np
+
 from qstrader.broker.fee_model.fee_model import FeeModel
 
 
@@ -92,3 +94,29 @@ class PercentFeeModel(FeeModel):
         commission = self._calc_commission(asset, quantity, consideration, broker)
         tax = self._calc_tax(asset, quantity, consideration, broker)
         return commission + tax
+
+    def calc_total_costs(self, assets, quantities, considerations, broker=None):
+        """
+        Calculate the total of any commission and/or tax for
+        each of a batch of trades in a single vectorised operation.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol string of each trade.
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `np.ndarray`
+            The total commission and tax of each trade.
+        """
+        abs_considerations = np.abs(considerations)
+        commissions = self.commission_pct * abs_considerations
+        taxes = self.tax_pct * abs_considerations
+        return commissions + taxes
@@ -1,3 +1,5 @@
+import numpy as np
+
 from qstrader.broker.fee_model.fee_model import FeeModel
 
 
@@ -79,3 +81,26 @@ class ZeroFeeModel(FeeModel):
         commission = self._calc_commission(asset, quantity, consideration, broker)
         tax = self._calc_tax(asset, quantity, consideration, broker)
         return commission + tax
+
+    def calc_total_costs(self, assets, quantities, considerations, broker=None):
+        """
+        Calculate the total of any commission and/or tax
+        for each of a batch of trades.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol string of each trade.
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `np.ndarray`
+            The zero-cost total commission and tax of each trade.
+        """
+        return np.zeros(len(considerations), dtype=np.float64)
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+
+
+class OrderBook(object):
+    """
+    Holds the open orders of a single portfolio that are awaiting
+    execution by a simulated brokerage, in order of submission.
+
+    As backtests are single-threaded the orders are held in an
+    ordered dictionary keyed by order ID, rather than a lock-based
+    thread-safe queue. This allows orders to be looked up and
+    cancelled by ID, while all orders are drained in a single
+    operation by swapping out the dictionary.
+    """
+
+    def __init__(self):
+        self.orders = OrderedDict()
+
+    def __len__(self):
+        return len(self.orders)
+
+    def __iter__(self):
+        return iter(list(self.orders.values()))
+
+    def __contains__(self, order_id):
+        return order_id in self.orders
+
+    def submit_order(self, order):
+        """
+        Add an order to the end of the order book.
+
+        Parameters
+        ----------
+        order : `Order`
+            The Order instance to submit.
+        """
+        if order.order_id in self.orders:
+            raise ValueError(
+                "Order with ID '%s' is already open and cannot be "
+                "submitted again." % order.order_id
+            )
+        self.orders[order.order_id] = order
+
+    def submit_orders(self, orders):
+        """
+        Add many orders to the end of the order book, in order.
+
+        Parameters
+        ----------
+        orders : `list[Order]`
+            The Order instances to submit.
+        """
+        for order in orders:
+            self.submit_order(order)
+
+    def drain(self):
+        """
+        Remove all open orders from the order book at once.
+
+        Returns
+        -------
+        `list[Order]`
+            The open orders, in order of submission.
+        """
+        orders = list(self.orders.values())
+        self.orders = OrderedDict()
+        return orders
+
+    def get_order(self, order_id):
+        """
+        Obtain an open order by its order ID.
+
+        Parameters
+        ----------
+        order_id : `str`
+            The order ID of the open order.
+
+        Returns
+        -------
+        `Order`
+            The open Order instance.
+        """
+        if order_id not in self.orders:
+            raise KeyError(
+                "Order with ID '%s' is not open." % order_id
+            )
+        return self.orders[order_id]
+
+    def cancel_order(self, order_id):
+        """
+        Remove an open order from the order book, such
+        that it is not executed.
+
+        Parameters
+        ----------
+        order_id : `str`
+            The order ID of the open order.
+
+        Returns
+        -------
+        `Order`
+            The cancelled Order instance.
+        """
+        if order_id not in self.orders:
+            raise KeyError(
+                "Order with ID '%s' is not open and cannot be "
+                "cancelled." % order_id
+            )
+        return self.orders.pop(order_id)
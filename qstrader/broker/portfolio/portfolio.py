@@ -6,7 +6,9 @@ import pandas as pd
 
 from qstrader import settings
 from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.position_book import PositionBook
 from qstrader.broker.portfolio.position_handler import PositionHandler
+from qstrader.broker.portfolio.position_totals import PositionTotals
 
 
 class Portfolio(object):
@@ -16,6 +18,13 @@ class Portfolio(object):
     It also contains a list of positions in assets, encapsulated
     by a PositionHandler instance.
 
+    The total market value and unrealised P&L of the positions are
+    maintained as running totals, to which the change in value of a
+    position is applied as its asset is transacted or marked to
+    market. After a vectorised revaluation of all positions the
+    change in value of every position is applied from a single
+    snapshot of the position handler.
+
     Parameters
     ----------
     start_dt : datetime
@@ -28,6 +37,9 @@ class Portfolio(object):
         An identifier for the portfolio.
     name: str, optional
         The human-readable name of the portfolio.
+    columnar_positions: bool, optional
+        Whether to hold the positions in a columnar PositionBook
+        rather than a PositionHandler of Position instances.
     """
 
     def __init__(
@@ -36,7 +48,8 @@ class Portfolio(object):
         starting_cash=0.0,
         currency="USD",
         portfolio_id=None,
-        name=None
+        name=None,
+        columnar_positions=False
     ):
         """
         Initialise the Portfolio object with a PositionHandler,
@@ -50,7 +63,16 @@ class Portfolio(object):
         self.portfolio_id = portfolio_id
         self.name = name
 
-        self.pos_handler = PositionHandler()
+        self.totals = PositionTotals(
+            self._position_contributions,
+            self._all_position_contributions,
+            self._recalculate_total
+        )
+        self.pos_handler = (
+            PositionBook(on_mutable_access=self.totals.invalidate)
+            if columnar_positions else
+            PositionHandler(on_mutable_access=self.totals.invalidate)
+        )
         self.history = []
 
         self.logger = logging.getLogger('Portfolio')
@@ -88,12 +110,71 @@ class Portfolio(object):
             )
         )
 
+    def _position_contributions(self, asset):
+        """
+        Obtain the contribution of the position in an
+        asset to each of the maintained totals.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+
+        Returns
+        -------
+        `dict{str: float}`
+            The contributions keyed by total, which is
+            empty if the asset is not held.
+        """
+        position = self.pos_handler.view_positions().get(asset)
+        if position is None:
+            return {}
+        return {
+            'market_value': position.market_value,
+            'unrealised_pnl': position.unrealised_pnl
+        }
+
+    def _all_position_contributions(self):
+        """
+        Obtain the contributions of all positions to each of
+        the maintained totals in a single vectorised operation.
+
+        Returns
+        -------
+        `dict{str: dict{str: float}}`
+            The contribution of each asset, keyed by total.
+        """
+        assets, market_values, unrealised_pnls = (
+            self.pos_handler.position_values()
+        )
+        return {
+            'market_value': dict(zip(assets, market_values.tolist())),
+            'unrealised_pnl': dict(zip(assets, unrealised_pnls.tolist()))
+        }
+
+    def _recalculate_total(self, key):
+        """
+        Fully recalculate a maintained total from the positions.
+
+        Parameters
+        ----------
+        key : `str`
+            The key of the total, either 'market_value'
+            or 'unrealised_pnl'.
+
+        Returns
+        -------
+        `float`
+            The recalculated total.
+        """
+        return getattr(self.pos_handler, 'total_%s' % key)()
+
     @property
     def total_market_value(self):
         """
         Obtain the total market value of the portfolio excluding cash.
         """
-        return self.pos_handler.total_market_value()
+        return self.totals.get('market_value')
 
     @property
     def total_equity(self):
@@ -107,7 +188,7 @@ class Portfolio(object):
         """
         Calculate the sum of all the positions' unrealised P&Ls.
         """
-        return self.pos_handler.total_unrealised_pnl()
+        return self.totals.get('unrealised_pnl')
 
     @property
     def total_realised_pnl(self):
@@ -228,6 +309,7 @@ class Portfolio(object):
                 )
 
         self.pos_handler.transact_position(txn)
+        self.totals.update_position(txn.asset)
 
         self.cash -= txn_total_cost
 
@@ -281,7 +363,7 @@ class Portfolio(object):
             The portfolio holdings.
         """
         holdings = {}
-        for asset, pos in self.pos_handler.positions.items():
+        for asset, pos in self.pos_handler.view_positions().items():
             holdings[asset] = {
                 "quantity": pos.net_quantity,
                 "market_value": pos.market_value,
@@ -298,7 +380,7 @@ class Portfolio(object):
         Update the market value of the asset to the current
         trade price and date.
         """
-        if asset not in self.pos_handler.positions:
+        if asset not in self.pos_handler.view_positions():
             return
         else:
             if current_price < 0.0:
@@ -318,10 +400,46 @@ class Portfolio(object):
                     )
                 )
 
-            self.pos_handler.positions[asset].update_current_price(
-                current_price, current_dt
+            self.pos_handler.update_current_price(
+                asset, current_price, current_dt
+            )
+            self.totals.mark_position(asset)
+
+    def update_market_values(self, prices, current_dt):
+        """
+        Update the market values of all held assets to the
+        current trade prices and date, revaluing every position
+        in a single vectorised operation.
+
+        Parameters
+        ----------
+        prices : `dict{str: float}`
+            The current trade price of (at least) every held asset.
+        current_dt : `pd.Timestamp`
+            The current trade date.
+        """
+        if current_dt < self.current_dt:
+            raise ValueError(
+                'Current trade date of %s is earlier than '
+                'current date %s of the portfolio. Cannot update '
+                'positions.' % (current_dt, self.current_dt)
+            )
+
+        negative = [
+            asset for asset in self.pos_handler.held_assets()
+            if prices[asset] < 0.0
+        ]
+        if negative:
+            raise ValueError(
+                'Current trade price of %s is negative for '
+                'asset %s. Cannot update position.' % (
+                    prices[negative[0]], negative[0]
+                )
             )
 
+        self.pos_handler.update_current_prices(prices, current_dt)
+        self.totals.revalue_positions()
+
     def history_to_df(self):
         """
         Creates a Pandas DataFrame of the Portfolio history.
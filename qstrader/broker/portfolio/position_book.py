@@ -0,0 +1,436 @@
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+from qstrader.broker.portfolio.position import Position
+
+
+# Default number of positions preallocated by the position book
+DEFAULT_POSITION_CAPACITY = 16
+
+# The per-position float64 columns held by the position book
+POSITION_COLUMNS = [
+    'current_price',
+    'buy_quantity',
+    'sell_quantity',
+    'avg_bought',
+    'avg_sold',
+    'buy_commission',
+    'sell_commission'
+]
+
+
+def _column_property(column):
+    """
+    Create a property of a PositionView, which reads and
+    writes the position's row of a position book column.
+
+    Parameters
+    ----------
+    column : `str`
+        The name of the position book column.
+
+    Returns
+    -------
+    `property`
+        The column property.
+    """
+    def fget(self):
+        return float(getattr(self.book, column)[self.book.rows[self.asset]])
+
+    def fset(self, value):
+        getattr(self.book, column)[self.book.rows[self.asset]] = value
+
+    return property(fget, fset)
+
+
+class PositionView(Position):
+    """
+    A lightweight facade over a single row of a PositionBook,
+    providing the full Position API. The state of the position
+    is read from, and written to, the columns of the book, such
+    that the Position accounting logic is shared.
+
+    Parameters
+    ----------
+    book : `PositionBook`
+        The position book holding the position.
+    asset : `str`
+        The Asset symbol string.
+    """
+
+    def __init__(self, book, asset):
+        self.book = book
+        self.asset = asset
+
+    current_price = _column_property('current_price')
+    avg_bought = _column_property('avg_bought')
+    avg_sold = _column_property('avg_sold')
+    buy_commission = _column_property('buy_commission')
+    sell_commission = _column_property('sell_commission')
+
+    # The quantities are returned as an int wherever the
+    # equivalent Position would hold an int, such that the
+    # quantities of any subsequent orders are unchanged
+    @property
+    def buy_quantity(self):
+        quantity = float(self.book.buy_quantity[self.book.rows[self.asset]])
+        return int(quantity) if quantity.is_integer() else quantity
+
+    @buy_quantity.setter
+    def buy_quantity(self, value):
+        self.book.buy_quantity[self.book.rows[self.asset]] = value
+
+    @property
+    def sell_quantity(self):
+        quantity = float(self.book.sell_quantity[self.book.rows[self.asset]])
+        return 0 if quantity == 0.0 else quantity
+
+    @sell_quantity.setter
+    def sell_quantity(self, value):
+        self.book.sell_quantity[self.book.rows[self.asset]] = value
+
+    @property
+    def current_dt(self):
+        return self.book.current_dts[self.book.rows[self.asset]]
+
+    @current_dt.setter
+    def current_dt(self, value):
+        self.book.current_dts[self.book.rows[self.asset]] = value
+
+
+class PositionBook(object):
+    """
+    A columnar alternative to the PositionHandler, which stores the
+    quantities, average prices and commissions of every position in
+    aligned, preallocated float64 arrays with a row per position.
+
+    Portfolio totals are calculated as array reductions and all
+    positions can be marked to market in a single vectorised
+    operation, while each position remains accessible via a
+    PositionView facade providing the Position API.
+
+    Parameters
+    ----------
+    capacity : `int`, optional
+        The number of positions initially preallocated.
+    on_mutable_access : `callable`, optional
+        Called whenever the positions are handed out for modification,
+        such as to invalidate any totals maintained by a Portfolio.
+    """
+
+    def __init__(
+        self, capacity=DEFAULT_POSITION_CAPACITY, on_mutable_access=None
+    ):
+        if capacity < 1:
+            raise ValueError(
+                "Position book capacity '%s' must be a positive "
+                "integer." % capacity
+            )
+        for column in POSITION_COLUMNS:
+            setattr(self, column, np.zeros(int(capacity), dtype=np.float64))
+        self.current_dts = []
+        self.assets = []
+        self.rows = {}
+        self._positions = OrderedDict()
+        self.size = 0
+        self.on_mutable_access = on_mutable_access
+
+    @property
+    def positions(self):
+        """
+        The ordered dictionary of the PositionView facades of the
+        current positions, which may be modified by the caller.
+
+        As the positions may subsequently be modified the
+        on_mutable_access callable is notified.
+        """
+        if self.on_mutable_access is not None:
+            self.on_mutable_access()
+        return self._positions
+
+    def _grow(self):
+        """
+        Double the preallocated capacity of the columns.
+        """
+        for column in POSITION_COLUMNS:
+            values = getattr(self, column)
+            grown = np.zeros(2 * len(values), dtype=np.float64)
+            grown[:self.size] = values[:self.size]
+            setattr(self, column, grown)
+
+    def _open_position(self, transaction):
+        """
+        Append a row for a new position opened by the transaction.
+
+        Parameters
+        ----------
+        transaction : `Transaction`
+            The transaction opening the position.
+        """
+        position = Position.open_from_transaction(transaction)
+        if self.size == len(self.current_price):
+            self._grow()
+        row = self.size
+        for column in POSITION_COLUMNS:
+            getattr(self, column)[row] = getattr(position, column)
+        self.current_dts.append(position.current_dt)
+        self.assets.append(position.asset)
+        self.rows[position.asset] = row
+        self._positions[position.asset] = PositionView(self, position.asset)
+        self.size += 1
+
+    def _close_position(self, asset):
+        """
+        Remove the row of a closed position, shifting the subsequent
+        rows such that the positions remain in order of creation.
+
+        Parameters
+        ----------
+        asset : `str`
+            The Asset symbol string.
+        """
+        row = self.rows.pop(asset)
+        for column in POSITION_COLUMNS:
+            values = getattr(self, column)
+            values[row:self.size - 1] = values[row + 1:self.size]
+        del self.current_dts[row]
+        del self.assets[row]
+        del self._positions[asset]
+        for shifted_asset in self.assets[row:]:
+            self.rows[shifted_asset] -= 1
+        self.size -= 1
+
+    def held_assets(self):
+        """
+        Obtain the symbols of the currently held assets.
+
+        Returns
+        -------
+        `list[str]`
+            The held asset symbols, in order of position creation.
+        """
+        return list(self.assets)
+
+    def view_positions(self):
+        """
+        Obtain a read-only view of the PositionView facades of the
+        current positions, in order of position creation.
+
+        Returns
+        -------
+        `MappingProxyType`
+            The read-only ordered mapping of the PositionView facades.
+        """
+        return MappingProxyType(self._positions)
+
+    def transact_position(self, transaction):
+        """
+        Execute the transaction and update the appropriate
+        position for the transaction's asset accordingly.
+        """
+        asset = transaction.asset
+        if asset in self.rows:
+            self._positions[asset].transact(transaction)
+        else:
+            self._open_position(transaction)
+
+        # If the position has zero quantity remove it
+        if self._positions[asset].net_quantity == 0:
+            self._close_position(asset)
+
+    def update_current_price(self, asset, price, dt):
+        """
+        Mark a single held position to market.
+
+        Parameters
+        ----------
+        asset : `str`
+            The Asset symbol string.
+        price : `float`
+            The current price of the asset.
+        dt : `pd.Timestamp`
+            The timestamp of the current price.
+        """
+        self._positions[asset].update_current_price(price, dt)
+
+    def update_current_prices(self, prices, dt):
+        """
+        Mark all positions to market in a single vectorised
+        operation from a snapshot of the current prices.
+
+        Parameters
+        ----------
+        prices : `dict{str: float}`
+            The current price of (at least) every held asset.
+        dt : `pd.Timestamp`
+            The timestamp of the current prices.
+        """
+        if self.size == 0:
+            return
+
+        latest_dt = max(self.current_dts)
+        if dt < latest_dt:
+            raise ValueError(
+                'Supplied update time of "%s" is earlier than '
+                'the current time of "%s".' % (dt, latest_dt)
+            )
+
+        current_prices = np.array(
+            [prices[asset] for asset in self.assets], dtype=np.float64
+        )
+        non_positive = current_prices <= 0.0
+        if non_positive.any():
+            row = np.argmax(non_positive)
+            raise ValueError(
+                'Market price "%s" of asset "%s" must be positive to '
+                'update the position.' % (current_prices[row], self.assets[row])
+            )
+
+        self.current_price[:self.size] = current_prices
+        self.current_dts = [dt] * self.size
+
+    def _net_quantities(self):
+        """
+        Calculate the net quantity of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The net quantities.
+        """
+        return self.buy_quantity[:self.size] - self.sell_quantity[:self.size]
+
+    def _avg_prices(self, net_quantities):
+        """
+        Calculate the average price paid on the long or short
+        side of each position, including commission.
+
+        Parameters
+        ----------
+        net_quantities : `np.ndarray`
+            The net quantity of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The average prices.
+        """
+        buy_quantity = self.buy_quantity[:self.size]
+        sell_quantity = self.sell_quantity[:self.size]
+        long_avg = np.divide(
+            self.avg_bought[:self.size] * buy_quantity + self.buy_commission[:self.size],
+            buy_quantity, out=np.zeros(self.size), where=net_quantities > 0
+        )
+        short_avg = np.divide(
+            self.avg_sold[:self.size] * sell_quantity - self.sell_commission[:self.size],
+            sell_quantity, out=np.zeros(self.size), where=net_quantities < 0
+        )
+        return np.where(
+            net_quantities > 0, long_avg,
+            np.where(net_quantities < 0, short_avg, 0.0)
+        )
+
+    def _unrealised_pnls(self):
+        """
+        Calculate the unrealised P&L of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The unrealised P&Ls.
+        """
+        net_quantities = self._net_quantities()
+        return (
+            self.current_price[:self.size] - self._avg_prices(net_quantities)
+        ) * net_quantities
+
+    def _realised_pnls(self):
+        """
+        Calculate the realised P&L of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The realised P&Ls.
+        """
+        net_quantities = self._net_quantities()
+        buy_quantity = self.buy_quantity[:self.size]
+        sell_quantity = self.sell_quantity[:self.size]
+        buy_commission = self.buy_commission[:self.size]
+        sell_commission = self.sell_commission[:self.size]
+        avg_diff = self.avg_sold[:self.size] - self.avg_bought[:self.size]
+
+        is_long = (net_quantities > 0) & (sell_quantity != 0)
+        is_short = (net_quantities < 0) & (buy_quantity != 0)
+        long_pnl = (
+            (avg_diff * sell_quantity) -
+            (np.divide(
+                sell_quantity, buy_quantity,
+                out=np.zeros(self.size), where=is_long
+            ) * buy_commission) -
+            sell_commission
+        )
+        short_pnl = (
+            (avg_diff * buy_quantity) -
+            (np.divide(
+                buy_quantity, sell_quantity,
+                out=np.zeros(self.size), where=is_short
+            ) * sell_commission) -
+            buy_commission
+        )
+        flat_pnl = (
+            (
+                self.avg_sold[:self.size] * sell_quantity -
+                self.avg_bought[:self.size] * buy_quantity
+            ) - (buy_commission + sell_commission)
+        )
+        return np.where(
+            is_long, long_pnl,
+            np.where(
+                is_short, short_pnl,
+                np.where(net_quantities == 0, flat_pnl, 0.0)
+            )
+        )
+
+    def position_values(self):
+        """
+        Calculate the market value and unrealised P&L of every
+        position in a single vectorised operation.
+
+        Returns
+        -------
+        `tuple(list[str], np.ndarray, np.ndarray)`
+            The held asset symbols, along with the aligned
+            market values and unrealised P&Ls.
+        """
+        return (
+            list(self.assets),
+            self.current_price[:self.size] * self._net_quantities(),
+            self._unrealised_pnls()
+        )
+
+    def total_market_value(self):
+        """
+        Calculate the sum of all the positions' market values.
+        """
+        return float(np.sum(self.current_price[:self.size] * self._net_quantities()))
+
+    def total_unrealised_pnl(self):
+        """
+        Calculate the sum of all the positions' unrealised P&Ls.
+        """
+        return float(np.sum(self._unrealised_pnls()))
+
+    def total_realised_pnl(self):
+        """
+        Calculate the sum of all the positions' realised P&Ls.
+        """
+        return float(np.sum(self._realised_pnls()))
+
+    def total_pnl(self):
+        """
+        Calculate the sum of all the positions' P&Ls.
+        """
+        return float(np.sum(self._realised_pnls() + self._unrealised_pnls()))
@@ -1,4 +1,7 @@
 from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
 
 from qstrader.broker.portfolio.position import Position
 
@@ -7,47 +10,236 @@ class PositionHandler(object):
     """
     A class that keeps track of, and updates, the current
     list of Position instances stored in a Portfolio entity.
+
+    Alongside the Position instances the net quantities, average
+    prices and current prices of the positions are held in aligned
+    arrays, such that all positions can be marked to market in a
+    single vectorised operation. The arrays are rebuilt from the
+    Position instances whenever these may have been modified, while
+    the prices of a vectorised revaluation are only written back to
+    the Position instances once these are next accessed.
+
+    Iteration that does not modify the positions should use the
+    read-only view_positions, which does not require the aligned
+    arrays to be rebuilt.
+
+    Parameters
+    ----------
+    on_mutable_access : `callable`, optional
+        Called whenever the positions are handed out for modification,
+        such as to invalidate any totals maintained by a Portfolio.
     """
 
-    def __init__(self):
+    def __init__(self, on_mutable_access=None):
         """
         Initialise the PositionHandler object to generate
         an ordered dictionary containing the current positions.
         """
-        self.positions = OrderedDict()
+        self.on_mutable_access = on_mutable_access
+        self._positions = OrderedDict()
+        self.assets = []
+        self.net_quantities = np.empty(0, dtype=np.float64)
+        self.avg_prices = np.empty(0, dtype=np.float64)
+        self.current_prices = np.empty(0, dtype=np.float64)
+        self.current_dt = None
+        self.asset_rows = {}
+        self._arrays_stale = False
+        self._prices_pending = False
+
+    @property
+    def positions(self):
+        """
+        The ordered dictionary of the current Position instances,
+        which are brought up to date with any vectorised revaluation.
+
+        As the Position instances may be modified by the caller
+        the aligned arrays are subsequently rebuilt prior to use,
+        and the on_mutable_access callable is notified.
+        """
+        self._write_back_prices()
+        self._arrays_stale = True
+        if self.on_mutable_access is not None:
+            self.on_mutable_access()
+        return self._positions
+
+    def view_positions(self):
+        """
+        Obtain a read-only view of the current Position instances,
+        which are brought up to date with any vectorised revaluation.
+
+        The Position instances must not be modified via the view, such
+        that the aligned arrays remain valid.
+
+        Returns
+        -------
+        `MappingProxyType`
+            The read-only ordered mapping of the Position instances.
+        """
+        self._write_back_prices()
+        return MappingProxyType(self._positions)
+
+    def _write_back_prices(self):
+        """
+        Update the Position instances with the prices of the
+        latest vectorised revaluation.
+        """
+        if not self._prices_pending:
+            return
+        for asset, price in zip(self.assets, self.current_prices.tolist()):
+            position = self._positions[asset]
+            position.current_price = price
+            position.current_dt = self.current_dt
+        self._prices_pending = False
+
+    def _rebuild_arrays(self):
+        """
+        Rebuild the aligned position arrays from the
+        Position instances, if these may have changed.
+        """
+        if not self._arrays_stale:
+            return
+        positions = list(self._positions.values())
+        self.assets = list(self._positions.keys())
+        self.asset_rows = {asset: row for row, asset in enumerate(self.assets)}
+        self.net_quantities = np.array(
+            [pos.net_quantity for pos in positions], dtype=np.float64
+        )
+        self.avg_prices = np.array(
+            [pos.avg_price for pos in positions], dtype=np.float64
+        )
+        self.current_prices = np.array(
+            [pos.current_price for pos in positions], dtype=np.float64
+        )
+        self.current_dt = max(
+            (pos.current_dt for pos in positions), default=None
+        )
+        self._arrays_stale = False
+
+    def held_assets(self):
+        """
+        Obtain the symbols of the currently held assets, without
+        bringing the Position instances up to date.
+
+        Returns
+        -------
+        `list[str]`
+            The held asset symbols, in order of position creation.
+        """
+        return list(self._positions.keys())
 
     def transact_position(self, transaction):
         """
         Execute the transaction and update the appropriate
         position for the transaction's asset accordingly.
         """
+        self._write_back_prices()
+        self._arrays_stale = True
+        positions = self._positions
         asset = transaction.asset
-        if asset in self.positions:
-            self.positions[asset].transact(transaction)
+        if asset in positions:
+            positions[asset].transact(transaction)
         else:
             position = Position.open_from_transaction(transaction)
-            self.positions[asset] = position
+            positions[asset] = position
 
         # If the position has zero quantity remove it
-        if self.positions[asset].net_quantity == 0:
-            del self.positions[asset]
+        if positions[asset].net_quantity == 0:
+            del positions[asset]
+
+    def update_current_price(self, asset, price, dt):
+        """
+        Mark a single held position to market, updating its
+        row of the aligned arrays in place.
+
+        Parameters
+        ----------
+        asset : `str`
+            The Asset symbol string.
+        price : `float`
+            The current price of the asset.
+        dt : `pd.Timestamp`
+            The timestamp of the current price.
+        """
+        self._write_back_prices()
+        self._positions[asset].update_current_price(price, dt)
+        if not self._arrays_stale:
+            self.current_prices[self.asset_rows[asset]] = price
+            if dt is not None:
+                self.current_dt = dt if self.current_dt is None else max(
+                    self.current_dt, dt
+                )
+
+    def update_current_prices(self, prices, dt):
+        """
+        Mark all positions to market in a single vectorised
+        operation from a snapshot of the current prices.
+
+        Parameters
+        ----------
+        prices : `dict{str: float}`
+            The current price of (at least) every held asset.
+        dt : `pd.Timestamp`
+            The timestamp of the current prices.
+        """
+        self._rebuild_arrays()
+        if not self.assets:
+            return
+
+        if self.current_dt is not None and dt < self.current_dt:
+            raise ValueError(
+                'Supplied update time of "%s" is earlier than '
+                'the current time of "%s".' % (dt, self.current_dt)
+            )
+
+        current_prices = np.array(
+            [prices[asset] for asset in self.assets], dtype=np.float64
+        )
+        non_positive = current_prices <= 0.0
+        if non_positive.any():
+            index = np.argmax(non_positive)
+            raise ValueError(
+                'Market price "%s" of asset "%s" must be positive to '
+                'update the position.' % (
+                    current_prices[index], self.assets[index]
+                )
+            )
+
+        self.current_prices = current_prices
+        self.current_dt = dt
+        self._prices_pending = True
+
+    def position_values(self):
+        """
+        Calculate the market value and unrealised P&L of every
+        position in a single vectorised operation.
+
+        Returns
+        -------
+        `tuple(list[str], np.ndarray, np.ndarray)`
+            The held asset symbols, along with the aligned
+            market values and unrealised P&Ls.
+        """
+        self._rebuild_arrays()
+        return (
+            list(self.assets),
+            self.current_prices * self.net_quantities,
+            (self.current_prices - self.avg_prices) * self.net_quantities
+        )
 
     def total_market_value(self):
         """
         Calculate the sum of all the positions' market values.
         """
-        return sum(
-            pos.market_value
-            for asset, pos in self.positions.items()
-        )
+        self._rebuild_arrays()
+        return float(np.sum(self.current_prices * self.net_quantities))
 
     def total_unrealised_pnl(self):
         """
         Calculate the sum of all the positions' unrealised P&Ls.
         """
-        return sum(
-            pos.unrealised_pnl
-            for asset, pos in self.positions.items()
+        self._rebuild_arrays()
+        return float(
+            np.sum((self.current_prices - self.avg_prices) * self.net_quantities)
         )
 
     def total_realised_pnl(self):
@@ -56,7 +248,7 @@ class PositionHandler(object):
         """
         return sum(
             pos.realised_pnl
-            for asset, pos in self.positions.items()
+            for asset, pos in self._positions.items()
         )
 
     def total_pnl(self):
@@ -65,5 +257,5 @@ class PositionHandler(object):
         """
         return sum(
             pos.total_pnl
-            for asset, pos in self.positions.items()
+            for asset, pos in self.view_positions().items()
         )
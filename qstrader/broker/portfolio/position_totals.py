@@ -0,0 +1,197 @@
+import math
+
+import numpy as np
+
+from qstrader import settings
+
+
+# Relative and absolute tolerances of the debug cross-check
+DEBUG_TOTALS_RTOL = 1e-9
+DEBUG_TOTALS_ATOL = 1e-6
+
+
+class PositionTotals(object):
+    """
+    Maintains the totals of the positions of a portfolio, such as
+    the total market value, such that these are read in constant
+    time rather than by iterating over every position on each access.
+
+    The contribution of each position to every total is stored and
+    each total is held as a plain running sum of the finite
+    contributions. When a position is transacted, marked to market
+    or revalued as part of a batch only its change in contribution
+    is applied. A total with no remaining contributions is reset to
+    exactly zero and non-finite contributions (such as a NaN price)
+    are held separately to the running sum.
+
+    Only after the positions have been handed out for modification,
+    when any of them may have changed unobserved, are the totals
+    rebuilt from the contributions of all positions on their next use.
+
+    If the DEBUG_TOTALS setting is enabled every read is
+    cross-checked against a full recalculation.
+
+    Parameters
+    ----------
+    contributions : `callable`
+        Obtains the contribution of the position in an asset to each
+        total, which is empty if the asset is not held.
+    all_contributions : `callable`
+        Obtains the contributions of all positions, as a dictionary
+        of the contribution of each asset keyed by total.
+    recalculate : `callable`
+        Fully recalculates a total from the positions, given its key.
+    """
+
+    def __init__(self, contributions, all_contributions, recalculate):
+        self.contributions = contributions
+        self.all_contributions = all_contributions
+        self.recalculate = recalculate
+        self.position_contributions = {}
+        self.totals = {}
+        self.non_finite = {}
+        self.stale = False
+
+    def invalidate(self):
+        """
+        Invalidate every total, such that the contributions of all
+        positions are rebuilt on the next use of the totals.
+        """
+        self.stale = True
+
+    def _rebuild(self):
+        """
+        Rebuild the contributions and running sums of every
+        total from the contributions of all positions.
+        """
+        self.position_contributions = {}
+        self.totals = {}
+        self.non_finite = {}
+        self.stale = False
+        for key, contributions in self.all_contributions().items():
+            for asset, value in contributions.items():
+                self._apply_contribution(key, asset, value)
+
+    def _apply_contribution(self, key, asset, value):
+        """
+        Replace the contribution of a position to a total, applying
+        the change to the running sum of the total.
+
+        Parameters
+        ----------
+        key : `str` or `tuple`
+            The key of the total.
+        asset : `str` or `tuple`
+            The asset of the position.
+        value : `float` or `None`
+            The new contribution, or None if the asset is not held.
+        """
+        contributions = self.position_contributions.setdefault(key, {})
+        previous = contributions.pop(asset, None)
+        if value is not None:
+            contributions[asset] = value
+        if previous == value:
+            return
+
+        total = self.totals.get(key, 0.0)
+        non_finite = self.non_finite.setdefault(key, {})
+        if previous is not None:
+            if math.isfinite(previous):
+                total -= previous
+            else:
+                del non_finite[asset]
+        if value is not None:
+            if math.isfinite(value):
+                total += value
+            else:
+                non_finite[asset] = value
+        self.totals[key] = total if contributions else 0.0
+
+    def update_position(self, asset):
+        """
+        Apply the change in the contributions of a position that has
+        been transacted, which may have opened or closed it.
+
+        Parameters
+        ----------
+        asset : `str` or `tuple`
+            The asset of the position.
+        """
+        if self.stale:
+            return
+        contributions = self.contributions(asset)
+        for key in list(self.position_contributions.keys()):
+            if key not in contributions:
+                self._apply_contribution(key, asset, None)
+        for key, value in contributions.items():
+            self._apply_contribution(key, asset, value)
+
+    def mark_position(self, asset):
+        """
+        Apply the change in the contributions of a position
+        whose price or FX rate has changed.
+
+        Parameters
+        ----------
+        asset : `str` or `tuple`
+            The asset of the position.
+        """
+        self.update_position(asset)
+
+    def revalue_positions(self):
+        """
+        Apply the change in the contributions of every position after
+        a batch revaluation, from a single vectorised snapshot of the
+        contributions of all positions.
+        """
+        if self.stale:
+            return
+        for key, contributions in self.all_contributions().items():
+            for asset, value in contributions.items():
+                self._apply_contribution(key, asset, value)
+
+    def get(self, key):
+        """
+        Obtain the current value of a total.
+
+        Parameters
+        ----------
+        key : `str` or `tuple`
+            The key of the total.
+
+        Returns
+        -------
+        `float`
+            The current value of the total.
+        """
+        if self.stale:
+            self._rebuild()
+        total = self.totals.get(key, 0.0)
+        non_finite = self.non_finite.get(key)
+        if non_finite:
+            total += sum(non_finite.values())
+        if settings.DEBUG_TOTALS:
+            self._check_total(key, total)
+        return total
+
+    def _check_total(self, key, total):
+        """
+        Cross-check a maintained total against a full recalculation,
+        raising a ValueError if these differ.
+
+        Parameters
+        ----------
+        key : `str` or `tuple`
+            The key of the total.
+        total : `float`
+            The maintained value of the total.
+        """
+        recalculated = self.recalculate(key)
+        if not np.isclose(
+            total, recalculated,
+            rtol=DEBUG_TOTALS_RTOL, atol=DEBUG_TOTALS_ATOL, equal_nan=True
+        ):
+            raise ValueError(
+                "Maintained portfolio total '%s' of %s differs from the "
+                "recalculated total of %s." % (key, total, recalculated)
+            )
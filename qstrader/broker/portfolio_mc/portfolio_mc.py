@@ -9,6 +9,7 @@ from qstrader import settings
 from qstrader.broker.portfolio_mc.portfolio_event_mc import PortfolioEvent_MC
 from qstrader.broker.portfolio_mc.position_handler_mc import PositionHandler_MC
 from qstrader.broker.portfolio_mc.position_handler_cash_mc import PositionHandler_Cash_MC
+from qstrader.broker.portfolio.position_totals import PositionTotals
 from qstrader.broker.transaction.transaction_leg_cash import Transaction_Leg_Cash
 from qstrader.broker.transaction.transaction_leg_stock import Transaction_Leg_Stock
 
@@ -34,8 +35,17 @@ class Portfolio_MC(object):
         self.portfolio_id = portfolio_id
         self.name = name
 
-        self.pos_handler = PositionHandler_MC()
-        self.pos_cash_handler = PositionHandler_Cash_MC()
+        self.totals = PositionTotals(
+            self._position_contributions,
+            self._all_position_contributions,
+            self._recalculate_total
+        )
+        self.pos_handler = PositionHandler_MC(
+            on_mutable_access=self.totals.invalidate
+        )
+        self.pos_cash_handler = PositionHandler_Cash_MC(
+            on_mutable_access=self.totals.invalidate
+        )
         self.history = []
 
         self.logger = logging.getLogger('Portfolio')
@@ -60,7 +70,7 @@ class Portfolio_MC(object):
                 self.base_currency, self.starting_cash, self.current_dt,
                 1.0, uuid.uuid4().hex, commission=0.0
             )
-            self.pos_cash_handler.transact_cash_position(txn_one)
+            self._transact_cash_position(txn_one)
 
         if self.starting_cash > 0.0:
             self.history.append(
@@ -81,17 +91,77 @@ class Portfolio_MC(object):
             )
         )
 
+    ##TC - The totals are maintained as running sums of the contributions of
+    # each position, which are updated as positions are transacted or marked to
+    # market. These are keyed by 'market_value_base' etc. for the equity
+    # positions, 'cash_market_value_base' etc. for the cash positions and
+    # (name, currency) tuples for the local currency totals. Cash positions are
+    # keyed by ('cash', currency) to distinguish them from any equity position
+    # with the same symbol
+    def _recalculate_total(self, key):
+        if isinstance(key, tuple):
+            name, currency = key
+            return getattr(self.pos_handler, 'total_%s' % name)(currency)
+        if key.startswith('cash_'):
+            return getattr(self.pos_cash_handler, 'total_%s' % key)()
+        return getattr(self.pos_handler, 'total_%s' % key)()
+
+    def _position_contributions(self, asset):
+        if isinstance(asset, tuple):
+            return self._cash_position_contributions(asset[1])
+        positions = self.pos_handler.view_positions()
+        if asset not in positions:
+            return {}
+        pos = positions[asset]
+        return {
+            'market_value_base': pos.market_value_base,
+            'unrealised_pnl_base': pos.unrealised_pnl_base,
+            ('market_value_local', pos.currency): pos.market_value_local,
+            ('unrealised_pnl_local', pos.currency): pos.unrealised_pnl_local,
+            ('realised_pnl_local', pos.currency): pos.realised_pnl_local,
+            ('total_pnl_local', pos.currency): pos.total_pnl_local
+        }
+
+    def _cash_position_contributions(self, currency):
+        positions = self.pos_cash_handler.view_positions()
+        if currency not in positions:
+            return {}
+        pos = positions[currency]
+        return {
+            'cash_market_value_base': pos.market_value_base,
+            'cash_unrealised_pnl_base': pos.unrealised_pnl_base
+        }
+
+    def _all_position_contributions(self):
+        all_contributions = {}
+        assets = list(self.pos_handler.view_positions().keys()) + [
+            ('cash', currency)
+            for currency in self.pos_cash_handler.view_positions().keys()
+        ]
+        for asset in assets:
+            for key, value in self._position_contributions(asset).items():
+                all_contributions.setdefault(key, {})[asset] = value
+        return all_contributions
+
+    def _transact_position(self, txn):
+        self.pos_handler.transact_position(txn)
+        self.totals.update_position(txn.asset)
+
+    def _transact_cash_position(self, txn):
+        self.pos_cash_handler.transact_cash_position(txn)
+        self.totals.update_position(('cash', txn.asset))
+
     @property
     def total_market_value_base(self):
-        return self.pos_handler.total_market_value_base() 
+        return self.totals.get('market_value_base')
 
     #@property
     def total_market_value_local(self, currency):
-        return self.pos_handler.total_market_value_local(currency)
+        return self.totals.get(('market_value_local', currency))
 
     @property
     def total_cash_value_base(self):
-        return self.pos_cash_handler.total_cash_market_value_base() 
+        return self.totals.get('cash_market_value_base')
 
     #@property
     def total_cash_value_local(self, currency):
@@ -99,27 +169,27 @@ class Portfolio_MC(object):
 
     @property
     def total_equity_base(self):
-        return self.pos_handler.total_market_value_base() + self.pos_cash_handler.total_cash_market_value_base()
+        return self.totals.get('market_value_base') + self.totals.get('cash_market_value_base')
 
     #@property
     def total_equity_local(self, currency):
-        return self.pos_handler.total_market_value_local(currency) + self.pos_cash_handler.total_cash_market_value_local(currency)
+        return self.totals.get(('market_value_local', currency)) + self.pos_cash_handler.total_cash_market_value_local(currency)
 
     @property
     def total_unrealised_pnl_base(self):
-        return self.pos_handler.total_unrealised_pnl_base() + self.pos_cash_handler.total_cash_unrealised_pnl_base()
+        return self.totals.get('unrealised_pnl_base') + self.totals.get('cash_unrealised_pnl_base')
 
     #@property
     def total_unrealised_pnl_local(self, currency):
-        return self.pos_handler.total_unrealised_pnl_local(currency) + self.pos_cash_handler.total_cash_unrealised_pnl_local(currency)
+        return self.totals.get(('unrealised_pnl_local', currency)) + self.pos_cash_handler.total_cash_unrealised_pnl_local(currency)
 
     #@property
     def total_realised_pnl_local(self, currency):
-        return self.pos_handler.total_realised_pnl_local(currency) + self.pos_cash_handler.total_cash_realised_pnl_local(currency)
+        return self.totals.get(('realised_pnl_local', currency)) + self.pos_cash_handler.total_cash_realised_pnl_local(currency)
 
     #@property
     def total_pnl_local(self, currency):
-        return self.pos_handler.total_pnl_local(currency) + self.pos_cash_handler.total_cash_pnl_local(currency)
+        return self.totals.get(('total_pnl_local', currency)) + self.pos_cash_handler.total_cash_pnl_local(currency)
 
 
     ##TC - This needs to be added to pull currency exposure
@@ -127,7 +197,7 @@ class Portfolio_MC(object):
     #     exposure = {}
 
 
-    #     for asset, pos in self.pos_cash_handler.positions.items():
+    #     for asset, pos in self.pos_cash_handler.view_positions().items():
     #         holdings[asset] = {
     #             "quantity": pos.net_quantity,
     #             "market_value": pos.market_value,
@@ -135,7 +205,7 @@ class Portfolio_MC(object):
     #             "realised_pnl": pos.realised_pnl,
     #             "total_pnl": pos.total_pnl
     #         }
-    #     for asset, pos in self.pos_cash_handler.positions.items():
+    #     for asset, pos in self.pos_cash_handler.view_positions().items():
     #         holdings[asset] = {
     #             "quantity": pos.net_quantity,
     #             "market_value": pos.market_value,
@@ -171,7 +241,7 @@ class Portfolio_MC(object):
             1.0, uuid.uuid4().hex, commission=0.0
         )
 
-        self.pos_cash_handler.transact_cash_position(txn_subscription)
+        self._transact_cash_position(txn_subscription)
 
         currency_bal = self.portfolio_cash_to_dict()[self.base_currency]['quantity']
         self.history.append(
@@ -222,7 +292,7 @@ class Portfolio_MC(object):
             1.0, uuid.uuid4().hex, commission=0.0
         )
 
-        self.pos_cash_handler.transact_cash_position(txn_withdraw)
+        self._transact_cash_position(txn_withdraw)
 
         currency_bal = self.portfolio_cash_to_dict()[self.base_currency]['quantity']
         self.history.append(
@@ -256,8 +326,8 @@ class Portfolio_MC(object):
             txn_leg_curncy_one = Transaction_Leg_Cash(txn.asset,txn.quantity, txn.dt, txn.price, uuid.uuid4().hex,coms)     
             qty_curncy_two = (txn.price * txn.quantity) / txn.fx_rate
             txn_leg_curncy_two = Transaction_Leg_Cash(txn.currency,-qty_curncy_two, txn.dt, txn.fx_rate, uuid.uuid4().hex,coms) 
-            self.pos_cash_handler.transact_cash_position(txn_leg_curncy_one)
-            self.pos_cash_handler.transact_cash_position(txn_leg_curncy_two)
+            self._transact_cash_position(txn_leg_curncy_one)
+            self._transact_cash_position(txn_leg_curncy_two)
             txn_total_cost = qty_curncy_two + txn.commission
 
         else:
@@ -265,8 +335,8 @@ class Portfolio_MC(object):
             txn_leg_stock = Transaction_Leg_Stock(txn.asset,txn.currency, txn.quantity, txn.dt, txn.price, txn.fx_rate, uuid.uuid4().hex, txn.commission)            
             txn_total_cost = (txn.quantity * txn.price) + txn.commission
             txn_leg_cash = Transaction_Leg_Cash(txn.currency, -txn_total_cost, txn.dt, txn.fx_rate, uuid.uuid4().hex,0.0)  
-            self.pos_handler.transact_position(txn_leg_stock)
-            self.pos_cash_handler.transact_cash_position(txn_leg_cash)
+            self._transact_position(txn_leg_stock)
+            self._transact_cash_position(txn_leg_cash)
 
 
         direction = "LONG" if txn.direction > 0 else "SHORT"
@@ -323,7 +393,7 @@ class Portfolio_MC(object):
     ##TC - Returns equity positions as dict
     def portfolio_equity_to_dict(self):
         holdings = {}
-        for asset, pos in self.pos_handler.positions.items():
+        for asset, pos in self.pos_handler.view_positions().items():
             holdings[asset] = {
                 "quantity": pos.net_quantity,
                 "market_value_local": pos.market_value_local,
@@ -338,7 +408,7 @@ class Portfolio_MC(object):
     ##TC - Returns cash positions as dict
     def portfolio_cash_to_dict(self):
         holdings = {}
-        for asset, pos in self.pos_cash_handler.positions.items():
+        for asset, pos in self.pos_cash_handler.view_positions().items():
             holdings[asset] = {
                 "quantity": pos.net_quantity,
                 "market_value_local": pos.market_value_local,
@@ -381,7 +451,7 @@ class Portfolio_MC(object):
 
     def update_market_value_of_asset(self, asset, current_price, current_dt):
 
-        if asset not in self.pos_handler.positions:
+        if asset not in self.pos_handler.view_positions():
             return
         else:
             if current_price < 0.0:
@@ -401,12 +471,13 @@ class Portfolio_MC(object):
                     )
                 )
 
-            self.pos_handler.positions[asset].update_current_price(current_price, current_dt)
+            self.pos_handler.view_positions()[asset].update_current_price(current_price, current_dt)
+            self.totals.mark_position(asset)
 
 
     def update_fx_rate_of_asset(self, asset, current_fx, current_dt):
 
-        if asset not in self.pos_handler.positions:
+        if asset not in self.pos_handler.view_positions():
             return
         else:
             if current_fx < 0.0:
@@ -426,12 +497,13 @@ class Portfolio_MC(object):
                     )
                 )
 
-            self.pos_handler.positions[asset].update_current_fx(current_fx,current_dt)
+            self.pos_handler.view_positions()[asset].update_current_fx(current_fx,current_dt)
+            self.totals.mark_position(asset)
 
 
     def update_fx_rate(self, currency, current_fx, current_dt):
 
-        if currency not in self.pos_cash_handler.positions:
+        if currency not in self.pos_cash_handler.view_positions():
             return
         else:
             if current_fx < 0.0:
@@ -451,7 +523,8 @@ class Portfolio_MC(object):
                     )
                 )
 
-            self.pos_cash_handler.positions[currency].update_current_fx(current_fx, current_dt)
+            self.pos_cash_handler.view_positions()[currency].update_current_fx(current_fx, current_dt)
+            self.totals.mark_position(('cash', currency))
 
 
     def history_to_df(self):
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from types import MappingProxyType
 
 from qstrader.broker.portfolio_mc.position_mc import Position_MC
 
@@ -6,51 +7,63 @@ from qstrader.broker.portfolio_mc.position_mc import Position_MC
 
 class PositionHandler_MC(object):
 
-    def __init__(self):
-        self.positions = OrderedDict()
+    ##TC - on_mutable_access is called whenever the positions are handed out
+    # for modification, such that the Portfolio_MC totals are invalidated
+    def __init__(self, on_mutable_access=None):
+        self.on_mutable_access = on_mutable_access
+        self._positions = OrderedDict()
+
+    @property
+    def positions(self):
+        if self.on_mutable_access is not None:
+            self.on_mutable_access()
+        return self._positions
+
+    def view_positions(self):
+        return MappingProxyType(self._positions)
 
     def transact_position(self, transaction):
         asset = transaction.asset
-        if asset in self.positions:
-            self.positions[asset].transact(transaction)
+        if asset in self._positions:
+            self._positions[asset].transact(transaction)
         else:
             position = Position_MC.open_from_transaction(transaction)
-            self.positions[asset] = position
+            self._positions[asset] = position
 
         # If the position has zero quantity remove it
-        if self.positions[asset].net_quantity == 0:
-            del self.positions[asset]
+        if self._positions[asset].net_quantity == 0:
+            del self._positions[asset]
 
     def total_market_value_base(self):
         return sum(
-            pos.market_value_base for asset, pos in self.positions.items()
+            pos.market_value_base for asset, pos in self._positions.items()
         )
 
     def total_market_value_local(self, currency):
-        pos_list = list(self.positions.values())
+        pos_list = list(self._positions.values())
         return sum(
             pos.market_value_local for pos in pos_list if (pos.currency == currency)
         )
 
     def total_unrealised_pnl_base(self):
         return sum(
-            pos.unrealised_pnl_base for asset, pos in self.positions.items()
+            pos.unrealised_pnl_base for asset, pos in self._positions.items()
         )
 
     def total_unrealised_pnl_local(self, currency):
-        pos_list = list(self.positions.values())
+        pos_list = list(self._positions.values())
         return sum(
             pos.unrealised_pnl_local for pos in pos_list if (pos.currency == currency)
         )
 
     def total_realised_pnl_local(self, currency):
-        pos_list = list(self.positions.values())
+        pos_list = list(self._positions.values())
         return sum(
             pos.realised_pnl_local for pos in pos_list if (pos.currency == currency)
         )
 
     def total_pnl_local(self, currency):
-        pos_list = list(self.positions.values())
+        pos_list = list(self._positions.values())
         return sum(
             pos.total_pnl_local for pos in pos_list if (pos.currency == currency)
         )
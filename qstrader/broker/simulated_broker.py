@@ -1,10 +1,9 @@
-import queue
-
 import numpy as np
 
 from qstrader import settings
 from qstrader.broker.broker import Broker
 from qstrader.broker.fee_model.fee_model import FeeModel
+from qstrader.broker.order_book import OrderBook
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.transaction.transaction import Transaction
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
@@ -41,6 +40,14 @@ class SimulatedBroker(Broker):
         The model used to simulate trade slippage.
     market_impact_model : `MarketImpactModel`, optional
         The model used to simulate market impact of trading.
+    columnar_positions : `Boolean`, optional
+        Whether the portfolios hold their positions in a columnar
+        position book, rather than as separate Position instances.
+    batch_execution : `Boolean`, optional
+        Whether all pending orders of a timestamp are priced, and
+        their fees calculated, in a single vectorised pass rather than
+        separately for each order. The transactions are applied in
+        the same order either way.
     """
 
     def __init__(
@@ -53,7 +60,9 @@ class SimulatedBroker(Broker):
         initial_funds=0.0,
         fee_model=ZeroFeeModel(),
         slippage_model=None,
-        market_impact_model=None
+        market_impact_model=None,
+        columnar_positions=False,
+        batch_execution=False
     ):
         self.start_dt = start_dt
         self.exchange = exchange
@@ -66,6 +75,8 @@ class SimulatedBroker(Broker):
         self.fee_model = self._set_fee_model(fee_model)
         self.slippage_model = None  # TODO: Implement
         self.market_impact_model = None  # TODO: Implement
+        self.columnar_positions = columnar_positions
+        self.batch_execution = batch_execution
 
         self.cash_balances = self._set_cash_balances()
         self.portfolios = self._set_initial_portfolios()
@@ -334,10 +345,11 @@ class SimulatedBroker(Broker):
                 self.current_dt,
                 currency=self.base_currency,
                 portfolio_id=portfolio_id_str,
-                name=name
+                name=name,
+                columnar_positions=self.columnar_positions
             )
             self.portfolios[portfolio_id_str] = p
-            self.open_orders[portfolio_id_str] = queue.Queue()
+            self.open_orders[portfolio_id_str] = OrderBook()
             if settings.PRINT_EVENTS:
                 print(
                     '(%s) - portfolio creation: Portfolio "%s" created at broker "%s"' % (
@@ -568,7 +580,7 @@ class SimulatedBroker(Broker):
         bid_ask = self.data_handler.get_asset_latest_bid_ask_price(
             dt, order.asset
         )
-        if bid_ask == (np.NaN, np.NaN):
+        if np.isnan(bid_ask).all():
             raise ValueError(price_err_msg)
 
         # Calculate the consideration and total commission
@@ -614,6 +626,89 @@ class SimulatedBroker(Broker):
                 )
             )
 
+    def _execute_orders(self, dt, orders):
+        """
+        Fill a batch of (portfolio ID, Order) pairs. The prices of all
+        ordered assets are obtained at once, while the considerations
+        and total commissions are calculated as vectorised operations.
+        The resulting Transactions are then applied to their portfolios
+        one at a time, in the order provided, exactly as if each order
+        had been executed separately.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current timestamp.
+        orders : `list[tuple(str, Order)]`
+            The portfolio ID string and Order of each order to execute.
+        """
+        if not orders:
+            return
+
+        # Obtain a price for every asset, if any asset has no
+        # price then raise a ValueError prior to any execution
+        assets = [order.asset for portfolio_id, order in orders]
+        bid_asks = self.data_handler.get_assets_latest_bid_ask_prices(
+            dt, list(dict.fromkeys(assets))
+        )
+        for portfolio_id, order in orders:
+            if np.isnan(bid_asks[order.asset]).all():
+                raise ValueError(
+                    "Could not obtain a latest market price for "
+                    "Asset with ticker symbol '%s'. Order with ID '%s' was "
+                    "not executed." % (
+                        order.asset, order.order_id
+                    )
+                )
+
+        # Calculate the considerations and total commissions
+        # based on the commission model
+        directions = np.array(
+            [order.direction for portfolio_id, order in orders]
+        )
+        quantities = np.array(
+            [order.quantity for portfolio_id, order in orders],
+            dtype=np.float64
+        )
+        bids, asks = np.array(
+            [bid_asks[asset] for asset in assets], dtype=np.float64
+        ).T
+        prices = np.where(directions > 0, asks, bids)
+        considerations = prices * quantities
+        total_commissions = self.fee_model.calc_total_costs(
+            assets, quantities, considerations, self
+        )
+
+        # Create and apply the transaction of each order, warning
+        # where the estimated cost exceeds the available cash
+        for (portfolio_id, order), price, consideration, total_commission in zip(
+            orders, prices.tolist(), considerations.tolist(),
+            total_commissions.tolist()
+        ):
+            est_total_cost = consideration + total_commission
+            total_cash = self.portfolios[portfolio_id].cash
+            if est_total_cost > total_cash:
+                if settings.PRINT_EVENTS:
+                    print(
+                        "WARNING: Estimated transaction size of %0.2f exceeds "
+                        "available cash of %0.2f. Transaction will still occur "
+                        "with a negative cash balance." % (est_total_cost, total_cash)
+                    )
+
+            txn = Transaction(
+                order.asset, order.quantity, self.current_dt,
+                price, order.order_id, commission=total_commission
+            )
+            self.portfolios[portfolio_id].transact_asset(txn)
+            if settings.PRINT_EVENTS:
+                print(
+                    "(%s) - executed order: %s, qty: %s, price: %0.2f, "
+                    "consideration: %0.2f, commission: %0.2f, total: %0.2f" % (
+                        self.current_dt, order.asset, order.quantity, price,
+                        consideration, total_commission, est_total_cost
+                    )
+                )
+
     def submit_order(self, portfolio_id, order):
         """
         Execute an Order instance against the sub-portfolio
@@ -642,7 +737,7 @@ class SimulatedBroker(Broker):
                     portfolio_id, order.order_id
                 )
             )
-        self.open_orders[portfolio_id].put(order)
+        self.open_orders[portfolio_id].submit_order(order)
         if settings.PRINT_EVENTS:
             print(
                 "(%s) - submitted order: %s, qty: %s" % (
@@ -650,6 +745,106 @@ class SimulatedBroker(Broker):
                 )
             )
 
+    def submit_orders(self, portfolio_id, orders):
+        """
+        Submit many Order instances at once against the
+        sub-portfolio with ID 'portfolio_id', in order.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        orders : `list[Order]`
+            The Order instances to submit.
+        """
+        for order in orders:
+            self.submit_order(portfolio_id, order)
+
+    def cancel_order(self, portfolio_id, order_id):
+        """
+        Cancel an open order of the sub-portfolio with ID
+        'portfolio_id', such that it is not executed.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        order_id : `str`
+            The order ID of the open order.
+
+        Returns
+        -------
+        `Order`
+            The cancelled Order instance.
+        """
+        if portfolio_id not in self.portfolios.keys():
+            raise KeyError(
+                "Portfolio with ID '%s' does not exist. Order with "
+                "ID '%s' was not cancelled." % (
+                    portfolio_id, order_id
+                )
+            )
+        order = self.open_orders[portfolio_id].cancel_order(order_id)
+        if settings.PRINT_EVENTS:
+            print(
+                "(%s) - cancelled order: %s, qty: %s" % (
+                    self.current_dt, order.asset, order.quantity
+                )
+            )
+        return order
+
+    def has_open_orders(self):
+        """
+        Check whether any portfolio has orders awaiting execution.
+
+        Returns
+        -------
+        `Boolean`
+            Whether there are any open orders.
+        """
+        return any(
+            len(open_orders) > 0 for open_orders in self.open_orders.values()
+        )
+
+    def get_checkpoint_state(self):
+        """
+        Obtain the mutable state of the broker, such that it can
+        be persisted and subsequently restored. The open order
+        books are converted into lists of orders.
+
+        Returns
+        -------
+        `dict`
+            The broker state.
+        """
+        return {
+            'current_dt': self.current_dt,
+            'cash_balances': self.cash_balances,
+            'portfolios': self.portfolios,
+            'open_orders': {
+                portfolio_id: list(open_orders)
+                for portfolio_id, open_orders in self.open_orders.items()
+            }
+        }
+
+    def restore_checkpoint_state(self, state):
+        """
+        Restore the mutable state of the broker from a
+        previously obtained checkpoint state.
+
+        Parameters
+        ----------
+        state : `dict`
+            The broker state.
+        """
+        self.current_dt = state['current_dt']
+        self.cash_balances = state['cash_balances']
+        self.portfolios = state['portfolios']
+        self.open_orders = {}
+        for portfolio_id, orders in state['open_orders'].items():
+            self.open_orders[portfolio_id] = OrderBook()
+            self.open_orders[portfolio_id].submit_orders(orders)
+
     def update(self, dt):
         """
         Updates the current SimulatedBroker timestamp.
@@ -661,25 +856,32 @@ class SimulatedBroker(Broker):
         """
         self.current_dt = dt
 
-        # Update portfolio asset values
-        for portfolio in self.portfolios:
-            for asset in self.portfolios[portfolio].pos_handler.positions:
-                mid_price = self.data_handler.get_asset_latest_mid_price(
-                    dt, asset
-                )
-                self.portfolios[portfolio].update_market_value_of_asset(
-                    asset, mid_price, self.current_dt
-                )
+        # Update portfolio asset values, obtaining the prices
+        # of all held assets in a single batch and revaluing
+        # the positions of each portfolio in one operation
+        held_assets = list(
+            dict.fromkeys(
+                asset for portfolio in self.portfolios.values()
+                for asset in portfolio.pos_handler.held_assets()
+            )
+        )
+        if held_assets:
+            mid_prices = self.data_handler.get_assets_latest_mid_prices(
+                dt, held_assets
+            )
+            for portfolio in self.portfolios.values():
+                portfolio.update_market_values(mid_prices, self.current_dt)
 
         # Try to execute orders
         if self.exchange.is_open_at_datetime(self.current_dt):
-            orders = []
-            for portfolio in self.portfolios:
-                while not self.open_orders[portfolio].empty():
-                    orders.append(
-                        (portfolio, self.open_orders[portfolio].get())
-                    )
+            orders = [
+                (portfolio, order) for portfolio in self.portfolios
+                for order in self.open_orders[portfolio].drain()
+            ]
 
             sorted_orders = sorted(orders, key=lambda x: x[1].direction)
-            for portfolio, order in sorted_orders:
-                self._execute_order(dt, portfolio, order)
+            if self.batch_execution:
+                self._execute_orders(dt, sorted_orders)
+            else:
+                for portfolio, order in sorted_orders:
+                    self._execute_order(dt, portfolio, order)
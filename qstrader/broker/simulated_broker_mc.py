@@ -1,6 +1,5 @@
 ######TC######
 
-import queue
 #from typing_extensions import Required
 
 import numpy as np
@@ -8,6 +7,7 @@ import numpy as np
 from qstrader import settings
 from qstrader.broker.broker import Broker
 from qstrader.broker.fee_model.fee_model import FeeModel
+from qstrader.broker.order_book import OrderBook
 from qstrader.broker.portfolio_mc.portfolio_mc import Portfolio_MC
 from qstrader.broker.transaction.transaction_mc import Transaction_MC
 from qstrader.execution.order_mc import Order_MC
@@ -233,7 +233,7 @@ class SimulatedBroker_MC(Broker):
                 name=name
             )
             self.portfolios[portfolio_id_str] = p
-            self.open_orders[portfolio_id_str] = queue.Queue()
+            self.open_orders[portfolio_id_str] = OrderBook()
             if settings.PRINT_EVENTS:
                 print(
                     '(%s) - portfolio creation: Portfolio "%s" created at broker "%s"' % (
@@ -635,7 +635,7 @@ class SimulatedBroker_MC(Broker):
                     portfolio_id, order.order_id
                 )
             )
-        self.open_orders[portfolio_id].put(order)
+        self.open_orders[portfolio_id].submit_order(order)
         if settings.PRINT_EVENTS:
             print(
                 "(%s) - submitted order: %s, qty: %s" % (
@@ -643,6 +643,54 @@ class SimulatedBroker_MC(Broker):
                 )
             )
 
+    def submit_orders(self, portfolio_id, orders):
+        """
+        Submit many Order instances at once against the
+        sub-portfolio with ID 'portfolio_id', in order.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        orders : `list[Order_MC]`
+            The Order instances to submit.
+        """
+        for order in orders:
+            self.submit_order(portfolio_id, order)
+
+    def cancel_order(self, portfolio_id, order_id):
+        """
+        Cancel an open order of the sub-portfolio with ID
+        'portfolio_id', such that it is not executed.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        order_id : `str`
+            The order ID of the open order.
+
+        Returns
+        -------
+        `Order_MC`
+            The cancelled Order instance.
+        """
+        if portfolio_id not in self.portfolios.keys():
+            raise KeyError(
+                "Portfolio with ID '%s' does not exist. Order with "
+                "ID '%s' was not cancelled." % (
+                    portfolio_id, order_id
+                )
+            )
+        order = self.open_orders[portfolio_id].cancel_order(order_id)
+        if settings.PRINT_EVENTS:
+            print(
+                "(%s) - cancelled order: %s, qty: %s" % (
+                    self.current_dt, order.asset, order.quantity
+                )
+            )
+        return order
+
 
     def update(self, dt):
         """
@@ -657,7 +705,7 @@ class SimulatedBroker_MC(Broker):
 
         # Update portfolio asset values
         for portfolio in self.portfolios:
-            for asset in self.portfolios[portfolio].pos_handler.positions:
+            for asset in self.portfolios[portfolio].pos_handler.view_positions():
                 mid_price = self.data_handler.get_asset_latest_mid_price(
                     dt, asset
                 )
@@ -665,7 +713,7 @@ class SimulatedBroker_MC(Broker):
                     asset, mid_price, self.current_dt
                 )
 
-                asset_curreny = self.portfolios[portfolio].pos_handler.positions[asset].currency
+                asset_curreny = self.portfolios[portfolio].pos_handler.view_positions()[asset].currency
                 if asset_curreny != self.portfolios[portfolio].base_currency:
                     mid_price = self.data_handler.get_asset_latest_mid_price(
                         dt, asset_curreny
@@ -674,7 +722,7 @@ class SimulatedBroker_MC(Broker):
                         asset, mid_price, self.current_dt
                     )
 
-            for cash_asset in self.portfolios[portfolio].pos_cash_handler.positions:
+            for cash_asset in self.portfolios[portfolio].pos_cash_handler.view_positions():
                 
                 ##TC - Base currency always 1 so not updated
                 if cash_asset != self.portfolios[portfolio].base_currency:
@@ -687,12 +735,10 @@ class SimulatedBroker_MC(Broker):
 
         # Try to execute orders
         if self.exchange.is_open_at_datetime(self.current_dt):
-            orders = []
-            for portfolio in self.portfolios:
-                while not self.open_orders[portfolio].empty():
-                    orders.append(
-                        (portfolio, self.open_orders[portfolio].get())
-                    )
+            orders = [
+                (portfolio, order) for portfolio in self.portfolios
+                for order in self.open_orders[portfolio].drain()
+            ]
 
             sorted_orders = sorted(orders, key=lambda x: x[1].direction)
             for portfolio, order in sorted_orders:
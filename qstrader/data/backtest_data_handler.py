@@ -3,43 +3,203 @@ import numpy as np
 
 class BacktestDataHandler(object):
     """
+    Routes pricing requests to the data sources providing each asset.
+
+    At construction an index is built mapping each asset symbol to
+    the data sources that provide it, ordered by the precedence
+    policy. Lookups for indexed symbols are therefore a single dict
+    access, rather than trying every data source in turn. Data sources
+    that do not list their asset symbols (via an `asset_symbols`
+    attribute) are queried as a fallback for any unindexed symbol.
+
+    Parameters
+    ----------
+    universe : `Universe`
+        The Asset Universe.
+    data_sources : `list`, optional
+        The data sources to obtain pricing from.
+    source_precedence : `str`, optional
+        Which data source is preferred when several provide the same
+        symbol. 'first' prefers the earliest in `data_sources`, while
+        'last' prefers the latest. Less preferred data sources are
+        only used if the preferred one has no price at a timestamp.
     """
 
+    SOURCE_PRECEDENCES = ('first', 'last')
+
     def __init__(
         self,
         universe,
-        data_sources=None
+        data_sources=None,
+        source_precedence='first'
     ):
         self.universe = universe
         self.data_sources = data_sources
+        self.source_precedence = self._check_source_precedence(
+            source_precedence
+        )
+        self.asset_sources, self.unindexed_sources = self._build_symbol_index()
 
-    def get_asset_latest_bid_price(self, dt, asset_symbol):
+    def _check_source_precedence(self, source_precedence):
         """
+        Check that the data source precedence policy is supported.
+
+        Parameters
+        ----------
+        source_precedence : `str`
+            The data source precedence policy.
+
+        Returns
+        -------
+        `str`
+            The data source precedence policy.
         """
-        # TODO: Check for asset in Universe
-        bid = np.NaN
-        for ds in self.data_sources:
+        if source_precedence not in self.SOURCE_PRECEDENCES:
+            raise ValueError(
+                "Data source precedence '%s' is not supported. Must be "
+                "one of %s." % (
+                    source_precedence, ", ".join(self.SOURCE_PRECEDENCES)
+                )
+            )
+        return source_precedence
+
+    def _build_symbol_index(self):
+        """
+        Create the mapping of each asset symbol to the data sources
+        that provide it, in order of precedence.
+
+        Returns
+        -------
+        `tuple(dict{str: list}, list)`
+            The symbol to data sources mapping and the list of data
+            sources that do not list their asset symbols.
+        """
+        data_sources = list(self.data_sources or [])
+        if self.source_precedence == 'last':
+            data_sources = data_sources[::-1]
+
+        asset_sources = {}
+        unindexed_sources = []
+        for ds in data_sources:
+            asset_symbols = getattr(ds, 'asset_symbols', None)
+            if asset_symbols is None:
+                unindexed_sources.append(ds)
+                continue
+            for asset_symbol in asset_symbols:
+                asset_sources.setdefault(asset_symbol, []).append(ds)
+        return asset_sources, unindexed_sources
+
+    def _query_data_source(self, ds, method, dt, asset_symbols, indexed):
+        """
+        Obtain prices for the provided asset symbols from a single data
+        source. Errors are only suppressed for unindexed data sources,
+        which may not provide the assets at all.
+
+        Parameters
+        ----------
+        ds : `DataSource`
+            The data source to query.
+        method : `str`
+            The name of the data source price method.
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        asset_symbols : `str` or `list[str]`
+            The asset symbol(s) to obtain prices for.
+        indexed : `Boolean`
+            Whether the data source is known to provide the assets.
+
+        Returns
+        -------
+        `float` or `np.ndarray`
+            The price(s), NaN if unavailable.
+        """
+        if indexed:
+            return getattr(ds, method)(dt, asset_symbols)
+        try:
+            return getattr(ds, method)(dt, asset_symbols)
+        except Exception:
+            return np.NaN
+
+    def _query_data_source_batch(
+        self, ds, batch_method, single_method, dt, asset_symbols, indexed
+    ):
+        """
+        Obtain prices for many asset symbols from a single data source,
+        using its batch price method if available.
+
+        As an unindexed data source may not provide every asset, if its
+        batch price method raises then each asset is priced individually,
+        such that the assets it does provide are still priced.
+
+        Parameters
+        ----------
+        ds : `DataSource`
+            The data source to query.
+        batch_method : `str`
+            The name of the data source batch price method.
+        single_method : `str`
+            The name of the data source single asset price method.
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+        indexed : `Boolean`
+            Whether the data source is known to provide the assets.
+
+        Returns
+        -------
+        `np.ndarray` or `list[float]`
+            The prices aligned to the asset symbols, NaN if unavailable.
+        """
+        if hasattr(ds, batch_method):
             try:
-                bid = ds.get_bid(dt, asset_symbol)
-                if not np.isnan(bid):
-                    return bid
+                return getattr(ds, batch_method)(dt, asset_symbols)
             except Exception:
-                bid = np.NaN
-        return bid
+                if indexed:
+                    raise
+        return [
+            self._query_data_source(ds, single_method, dt, symbol, indexed)
+            for symbol in asset_symbols
+        ]
+
+    def _get_asset_latest_price(self, dt, asset_symbol, method):
+        """
+        Obtain the latest price of an asset from the data sources that
+        provide it, in order of precedence.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the price for.
+        asset_symbol : `str`
+            The asset symbol to obtain the price for.
+        method : `str`
+            The name of the data source price method.
+
+        Returns
+        -------
+        `float`
+            The price, NaN if unavailable.
+        """
+        price = np.NaN
+        indexed = asset_symbol in self.asset_sources
+        for ds in self.asset_sources.get(asset_symbol, self.unindexed_sources):
+            price = self._query_data_source(ds, method, dt, asset_symbol, indexed)
+            if not np.isnan(price):
+                return price
+        return price
+
+    def get_asset_latest_bid_price(self, dt, asset_symbol):
+        """
+        """
+        # TODO: Check for asset in Universe
+        return self._get_asset_latest_price(dt, asset_symbol, 'get_bid')
 
     def get_asset_latest_ask_price(self, dt, asset_symbol):
         """
         """
         # TODO: Check for asset in Universe
-        ask = np.NaN
-        for ds in self.data_sources:
-            try:
-                ask = ds.get_ask(dt, asset_symbol)
-                if not np.isnan(ask):
-                    return ask
-            except Exception:
-                ask = np.NaN
-        return ask
+        return self._get_asset_latest_price(dt, asset_symbol, 'get_ask')
 
     def get_asset_latest_bid_ask_price(self, dt, asset_symbol):
         """
@@ -64,6 +224,156 @@ class BacktestDataHandler(object):
             mid = np.NaN
         return mid
 
+    def _get_assets_latest_prices(
+        self, dt, asset_symbols, batch_method, single_method
+    ):
+        """
+        Obtain the latest prices of many assets, querying each data
+        source once for all of the assets it is routed.
+
+        Assets without a price from their preferred data source are
+        routed to their next data source in order of precedence. Data
+        sources without a batch method, or unindexed data sources whose
+        batch method raises, are queried per asset.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+        batch_method : `str`
+            The name of the data source batch price method.
+        single_method : `str`
+            The name of the data source single asset price method.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices aligned to the asset symbols, with NaN for
+            any asset that no data source could price.
+        """
+        asset_symbols = list(asset_symbols)
+        prices = np.full(len(asset_symbols), np.NaN)
+        pending = range(len(asset_symbols))
+        rank = 0
+        while pending:
+            # Group the unpriced assets by their next data source
+            routes = {}
+            for i in pending:
+                asset_symbol = asset_symbols[i]
+                ds_list = self.asset_sources.get(
+                    asset_symbol, self.unindexed_sources
+                )
+                if rank < len(ds_list):
+                    ds = ds_list[rank]
+                    route = routes.setdefault(
+                        id(ds), (ds, asset_symbol in self.asset_sources, [])
+                    )
+                    route[2].append(i)
+
+            for ds, indexed, indices in routes.values():
+                prices[indices] = self._query_data_source_batch(
+                    ds, batch_method, single_method, dt,
+                    [asset_symbols[i] for i in indices], indexed
+                )
+
+            pending = [
+                i for route in routes.values() for i in route[2]
+                if np.isnan(prices[i])
+            ]
+            rank += 1
+        return prices
+
+    def get_assets_latest_bid_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest bid prices of many assets at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `dict{str: float}`
+            The bid price of each asset, NaN if unavailable.
+        """
+        asset_symbols = list(asset_symbols)
+        bids = self._get_assets_latest_prices(
+            dt, asset_symbols, 'get_bids', 'get_bid'
+        )
+        return dict(zip(asset_symbols, bids))
+
+    def get_assets_latest_ask_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest ask prices of many assets at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `dict{str: float}`
+            The ask price of each asset, NaN if unavailable.
+        """
+        asset_symbols = list(asset_symbols)
+        asks = self._get_assets_latest_prices(
+            dt, asset_symbols, 'get_asks', 'get_ask'
+        )
+        return dict(zip(asset_symbols, asks))
+
+    def get_assets_latest_bid_ask_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest bid/ask prices of many assets at once.
+
+        As with the single asset method this currently uses the bid
+        price for both sides, which is sufficient for OHLCV data.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid/ask prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain the bid/ask prices for.
+
+        Returns
+        -------
+        `dict{str: tuple(float, float)}`
+            The (bid, ask) prices of each asset, NaN if unavailable.
+        """
+        return {
+            asset: (bid, bid) for asset, bid in
+            self.get_assets_latest_bid_prices(dt, asset_symbols).items()
+        }
+
+    def get_assets_latest_mid_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest mid prices of many assets at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the mid prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain the mid prices for.
+
+        Returns
+        -------
+        `dict{str: float}`
+            The mid price of each asset, NaN if unavailable.
+        """
+        return {
+            asset: (bid + bid) / 2.0 for asset, bid in
+            self.get_assets_latest_bid_prices(dt, asset_symbols).items()
+        }
+
     def get_assets_historical_range_close_price(
         self, start_dt, end_dt, asset_symbols, adjusted=False
     ):
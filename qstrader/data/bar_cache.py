@@ -0,0 +1,279 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytz
+
+
+# Cached entries of at least this many bytes are memory mapped, while
+# smaller entries are read into memory such that no file is held open
+DEFAULT_MMAP_MIN_BYTES = 1 << 20
+
+# Alignment in bytes of each array within a cached entry's data file
+ARRAY_ALIGNMENT = 8
+
+
+class BarFrameCache(object):
+    """
+    Persistent on-disk cache of loaded daily 'bar' DataFrames along
+    with their converted individually-timestamped bid/ask DataFrames.
+
+    Each cached entry is stored as a directory containing a single
+    binary NumPy '.npy' data file, into which the index and every column
+    of both DataFrames are packed, along with a JSON file describing the
+    layout. Entries are keyed on the absolute path, modification time
+    and size of the originating CSV file, as well as whether the prices
+    were adjusted. Any modification to the CSV file therefore results
+    in a cache miss and a fresh conversion.
+
+    Large entries are loaded with a single memory map, so that prices
+    are paged in from disk on demand rather than being parsed, and the
+    loaded DataFrames (and their indices) are read-only views onto it.
+    As each memory map holds a file descriptor open, entries smaller
+    than `mmap_min_bytes` are instead read into memory, such that
+    loading a wide universe of daily bars holds no files open.
+
+    Parameters
+    ----------
+    cache_dir : `str`
+        The directory in which to store the cached entries.
+    mmap_min_bytes : `int`, optional
+        The size in bytes from which cached entries are memory mapped.
+    """
+
+    VERSION = 2
+
+    def __init__(self, cache_dir, mmap_min_bytes=DEFAULT_MMAP_MIN_BYTES):
+        self.cache_dir = cache_dir
+        self.mmap_min_bytes = mmap_min_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_key(self, csv_path, adjust_prices, variant=None):
+        """
+        Create the cache key for a particular CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices have been adjusted for corporate actions.
+        variant : `str`, optional
+            Distinguishes differing conversions of the same CSV file.
+
+        Returns
+        -------
+        `str`
+            The hexadecimal cache key.
+        """
+        csv_stat = os.stat(csv_path)
+        key = '%s|%s|%s|%s|%s' % (
+            os.path.abspath(csv_path), csv_stat.st_mtime_ns,
+            csv_stat.st_size, bool(adjust_prices), BarFrameCache.VERSION
+        )
+        if variant is not None:
+            key = '%s|%s' % (key, variant)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _entry_dir(self, csv_path, adjust_prices, variant=None):
+        """
+        Obtain the cache entry directory for a particular CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices have been adjusted for corporate actions.
+        variant : `str`, optional
+            Distinguishes differing conversions of the same CSV file.
+
+        Returns
+        -------
+        `str`
+            The full path to the cache entry directory.
+        """
+        return os.path.join(
+            self.cache_dir, self._cache_key(csv_path, adjust_prices, variant)
+        )
+
+    @staticmethod
+    def _index_from_array(index_values):
+        """
+        Create a UTC DatetimeIndex from int64 nanosecond timestamps,
+        as a view onto the (possibly memory mapped) timestamps.
+
+        Parameters
+        ----------
+        index_values : `np.ndarray`
+            The int64 nanosecond timestamps.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The UTC-localised DatetimeIndex.
+        """
+        return pd.DatetimeIndex(
+            pd.arrays.DatetimeArray(
+                np.asarray(index_values).view('datetime64[ns]'),
+                dtype=pd.DatetimeTZDtype(tz=pytz.UTC), copy=False
+            ),
+            copy=False
+        )
+
+    def load(self, csv_path, adjust_prices, variant=None):
+        """
+        Load the bar and bid/ask DataFrames for a CSV file from the
+        cache, if a valid entry exists.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices have been adjusted for corporate actions.
+        variant : `str`, optional
+            Distinguishes differing conversions of the same CSV file.
+
+        Returns
+        -------
+        `tuple(pd.DataFrame, pd.DataFrame)` or `None`
+            The bar and bid/ask DataFrames, or None on a cache miss.
+        """
+        entry_dir = self._entry_dir(csv_path, adjust_prices, variant)
+        meta_path = os.path.join(entry_dir, 'meta.json')
+        if not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path, 'r') as meta_file:
+            meta = json.load(meta_file)
+
+        data_path = os.path.join(entry_dir, 'data.npy')
+        mmap_mode = (
+            'r' if os.path.getsize(data_path) >= self.mmap_min_bytes else None
+        )
+        data = np.load(data_path, mmap_mode=mmap_mode)
+
+        def unpack(name):
+            offset, dtype, shape = meta['arrays'][name]
+            dtype = np.dtype(dtype)
+            nbytes = dtype.itemsize * int(np.prod(shape))
+            return data[offset:offset + nbytes].view(dtype).reshape(shape)
+
+        # Each bar column is held as a separate block, rather than being
+        # consolidated into a copy, such that it remains a view onto
+        # the data file
+        bar_df = pd.DataFrame(
+            {
+                column: unpack('bar_%d' % i)
+                for i, column in enumerate(meta['bar_columns'])
+            },
+            index=self._index_from_array(unpack('bar_index')),
+            columns=meta['bar_columns'],
+            copy=False
+        )
+        bar_df.index.name = meta['bar_index_name']
+
+        # Bid/ask prices are stored as a single (2, N) array such that
+        # the resulting DataFrame is a single block viewing the data file
+        bid_ask_df = pd.DataFrame(
+            unpack('bid_ask').T,
+            index=self._index_from_array(unpack('bid_ask_index')),
+            columns=['Bid', 'Ask']
+        )
+        bid_ask_df.index.name = 'Date'
+        return bar_df, bid_ask_df
+
+    @staticmethod
+    def _pack_arrays(arrays):
+        """
+        Pack arrays into a single byte array, each aligned to
+        ARRAY_ALIGNMENT bytes.
+
+        Parameters
+        ----------
+        arrays : `dict{str: np.ndarray}`
+            The arrays to pack, keyed by name.
+
+        Returns
+        -------
+        `tuple(np.ndarray, dict)`
+            The packed uint8 array, along with the byte offset, dtype
+            and shape of each array keyed by name.
+        """
+        chunks = []
+        layout = {}
+        offset = 0
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            padding = -offset % ARRAY_ALIGNMENT
+            chunks.append(np.zeros(padding, dtype=np.uint8))
+            offset += padding
+            layout[name] = [offset, array.dtype.str, list(array.shape)]
+            chunks.append(array.reshape(-1).view(np.uint8))
+            offset += array.nbytes
+        return np.concatenate(chunks), layout
+
+    def save(self, csv_path, adjust_prices, bar_df, bid_ask_df, variant=None):
+        """
+        Store the bar and bid/ask DataFrames for a CSV file in the cache.
+
+        The entry is written to a temporary directory and then moved
+        into place, so that concurrent or interrupted writes never leave
+        a partially written entry behind.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices have been adjusted for corporate actions.
+        bar_df : `pd.DataFrame`
+            The daily 'bar' OHLCV DataFrame.
+        bid_ask_df : `pd.DataFrame`
+            The individually-timestamped bid/ask DataFrame.
+        variant : `str`, optional
+            Distinguishes differing conversions of the same CSV file.
+        """
+        entry_dir = self._entry_dir(csv_path, adjust_prices, variant)
+        if os.path.exists(entry_dir):
+            return
+
+        # Only numeric columns can be stored as binary arrays, so any
+        # frame containing text columns is not cached
+        if any(dtype == object for dtype in bar_df.dtypes):
+            return
+
+        arrays = {'bar_index': bar_df.index.asi8}
+        for i, column in enumerate(bar_df.columns):
+            arrays['bar_%d' % i] = bar_df[column].to_numpy()
+        arrays['bid_ask_index'] = bid_ask_df.index.asi8
+        arrays['bid_ask'] = np.vstack(
+            [bid_ask_df['Bid'].to_numpy(), bid_ask_df['Ask'].to_numpy()]
+        ).astype(np.float64)
+        data, layout = self._pack_arrays(arrays)
+
+        tmp_dir = tempfile.mkdtemp(dir=self.cache_dir)
+        try:
+            np.save(os.path.join(tmp_dir, 'data.npy'), data)
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w') as meta_file:
+                json.dump(
+                    {
+                        'csv_path': os.path.abspath(csv_path),
+                        'adjust_prices': bool(adjust_prices),
+                        'bar_columns': [str(column) for column in bar_df.columns],
+                        'bar_index_name': bar_df.index.name,
+                        'arrays': layout
+                    },
+                    meta_file
+                )
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            # Another process may have written the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not os.path.exists(entry_dir):
+                raise
@@ -1,10 +1,196 @@
-import functools
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 import numpy as np
 import pandas as pd
 import pytz
 from qstrader import settings
+from qstrader.data.bar_cache import BarFrameCache
+from qstrader.data.price_store import ArrayPriceStore
+from qstrader.utils.lru_cache import LRUCache
+
+
+# Intraday offsets (UTC) of the open and closing prices of a daily bar
+MARKET_OPEN_OFFSET = pd.Timedelta(hours=14, minutes=30)
+MARKET_CLOSE_OFFSET = pd.Timedelta(hours=21, minutes=00)
+
+# Default maximum number of cached bid (and ask) price lookups
+DEFAULT_PRICE_CACHE_SIZE = 65536
+
+# Daily bar columns retained when storing frames compactly
+COMPACT_BAR_COLUMNS = ['Open', 'Close', 'Adj Close']
+
+
+def interleave_open_close_prices(dates, opens, closes):
+    """
+    Interleave daily opening and closing prices into a single
+    chronologically sorted sequence of individually-timestamped
+    prices, forward-filling any missing prices.
+
+    The timestamp and price arrays are preallocated and filled via
+    strided assignment, so they are sorted by construction provided
+    the daily dates are sorted.
+
+    Parameters
+    ----------
+    dates : `np.ndarray`
+        The sorted int64 nanosecond timestamps (UTC) of each daily bar.
+    opens : `np.ndarray`
+        The opening prices of each daily bar.
+    closes : `np.ndarray`
+        The closing prices of each daily bar.
+
+    Returns
+    -------
+    `tuple(np.ndarray, np.ndarray)`
+        The int64 nanosecond timestamps and float64 prices.
+    """
+    num_bars = len(dates)
+    timestamps = np.empty(2 * num_bars, dtype=np.int64)
+    timestamps[0::2] = dates + MARKET_OPEN_OFFSET.value
+    timestamps[1::2] = dates + MARKET_CLOSE_OFFSET.value
+
+    prices = np.empty(2 * num_bars, dtype=np.float64)
+    prices[0::2] = opens
+    prices[1::2] = closes
+
+    return timestamps, forward_fill_prices(prices)
+
+
+def forward_fill_prices(prices):
+    """
+    Forward-fill missing prices with the latest available price,
+    leaving any leading missing prices as NaN.
+
+    Parameters
+    ----------
+    prices : `np.ndarray`
+        The chronologically sorted prices.
+
+    Returns
+    -------
+    `np.ndarray`
+        The forward-filled prices.
+    """
+    missing = np.isnan(prices)
+    if missing.any():
+        latest = np.where(missing, 0, np.arange(len(prices)))
+        np.maximum.accumulate(latest, out=latest)
+        prices = prices[latest]
+    return prices
+
+
+def convert_bar_frame_into_bid_ask_df(bar_df, adjust_prices):
+    """
+    Converts the DataFrame from daily OHLCV 'bars' into a DataFrame
+    of open and closing price timestamps.
+
+    Optionally adjusts the open/close prices for corporate actions
+    using any provided 'Adjusted Close' column.
+
+    Parameters
+    ----------
+    bar_df : `pd.DataFrame`
+        The daily 'bar' OHLCV DataFrame.
+    adjust_prices : `Boolean`
+        Whether to utilise corporate-action adjusted prices for both
+        the open and closing prices.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The individually-timestamped open/closing prices, optionally
+        adjusted for corporate actions.
+    """
+    bar_df = bar_df.sort_index()
+    opens = bar_df['Open'].to_numpy(dtype=np.float64)
+    if adjust_prices:
+        if 'Adj Close' not in bar_df.columns:
+            raise ValueError(
+                "Unable to locate Adjusted Close pricing column in CSV data file. "
+                "Prices cannot be adjusted. Exiting."
+            )
+
+        # Adjust opening prices
+        closes = bar_df['Adj Close'].to_numpy(dtype=np.float64)
+        opens = (closes / bar_df['Close'].to_numpy(dtype=np.float64)) * opens
+    else:
+        closes = bar_df['Close'].to_numpy(dtype=np.float64)
+
+    timestamps, prices = interleave_open_close_prices(
+        bar_df.index.asi8, opens, closes
+    )
+
+    # TODO: Unable to distinguish between Bid/Ask, implement later
+    index = pd.DatetimeIndex(
+        timestamps.view('datetime64[ns]'), name='Date'
+    ).tz_localize(pytz.UTC)
+    return pd.DataFrame({'Bid': prices, 'Ask': prices}, index=index)
+
+
+# The data source instance used by each worker process
+# of a parallel CSV load, set once via the pool initialiser
+_worker_data_source = None
+
+
+def _column_indexer(columns):
+    """
+    Obtain an indexer for the given matrix columns, which is a
+    slice (selecting a view) if the columns are evenly spaced
+    and otherwise the list of columns (selecting a copy).
+
+    Parameters
+    ----------
+    columns : `list[int]`
+        The matrix columns, in order.
+
+    Returns
+    -------
+    `slice` or `list[int]`
+        The indexer of the columns.
+    """
+    if len(columns) == 1:
+        return slice(columns[0], columns[0] + 1)
+    step = columns[1] - columns[0]
+    if step == 0 or any(
+        later - earlier != step
+        for earlier, later in zip(columns[1:], columns[2:])
+    ):
+        return columns
+    stop = columns[-1] + step
+    return slice(columns[0], stop if stop >= 0 else None, step)
+
+
+def _init_load_worker(data_source):
+    """
+    Store the (not yet loaded) data source within the worker
+    process, to avoid re-sending it with every CSV file.
+
+    Parameters
+    ----------
+    data_source : `CSVDailyBarDataSource`
+        The data source carrying out the parallel load.
+    """
+    global _worker_data_source
+    _worker_data_source = data_source
+
+
+def _load_asset_frames_in_worker(csv_file):
+    """
+    Load and convert a single CSV file within a worker process.
+
+    Parameters
+    ----------
+    csv_file : `str`
+        The name of the CSV file.
+
+    Returns
+    -------
+    `tuple(pd.DataFrame, pd.DataFrame)`
+        The daily bar and bid/ask DataFrames.
+    """
+    return _worker_data_source._load_asset_frames(csv_file)
 
 
 class CSVDailyBarDataSource(object):
@@ -30,16 +216,180 @@ class CSVDailyBarDataSource(object):
         An optional list of CSV symbols to restrict the data source to.
         The alternative is to convert all CSVs found within the
         provided directory.
+    cache_dir : `str`, optional
+        An optional directory used to persist the converted frames
+        in a binary columnar format, such that subsequent data source
+        instantiations skip the CSV parsing and conversion.
+    workers : `int`, optional
+        The number of worker processes used to parse and convert the
+        CSV files in parallel. Defaults to a serial load in the
+        current process.
+    lazy : `Boolean`, optional
+        Whether to defer loading each CSV file until its prices are
+        first requested. Defaults to eagerly loading all CSV files.
+    max_resident_symbols : `int`, optional
+        When loading lazily, the optional maximum number of symbols
+        kept in memory at once. The least recently used symbol is
+        discarded (and reloaded if subsequently requested) once
+        this is exceeded. Batch price lookups of more symbols than
+        this load and price each symbol in turn.
+    price_cache_size : `int`, optional
+        The maximum number of bid (and separately ask) price lookups
+        cached by this data source instance. Zero disables the cache.
+    compact : `Boolean`, optional
+        Whether to store the loaded frames compactly, retaining only the
+        open, close and adjusted close bar columns and a single 'Mid'
+        column in place of identical bid and ask columns. The retained
+        columns are copied once at load, such that the full frames
+        are released.
+    price_dtype : `str` or `np.dtype`, optional
+        The floating point type the loaded prices are stored as, e.g.
+        'float32' to halve their memory usage. Defaults to float64.
     """
 
-    def __init__(self, csv_dir, asset_type, adjust_prices=True, csv_symbols=None):
+    def __init__(
+        self,
+        csv_dir,
+        asset_type,
+        adjust_prices=True,
+        csv_symbols=None,
+        cache_dir=None,
+        workers=None,
+        lazy=False,
+        max_resident_symbols=None,
+        price_cache_size=DEFAULT_PRICE_CACHE_SIZE,
+        compact=False,
+        price_dtype=None
+    ):
         self.csv_dir = csv_dir
         self.asset_type = asset_type
         self.adjust_prices = adjust_prices
         self.csv_symbols = csv_symbols
+        self.bar_cache = self._create_bar_cache(cache_dir)
+        self.workers = self._check_set_workers(workers)
+        self.lazy = lazy
+        self.max_resident_symbols = self._check_set_max_resident_symbols(
+            max_resident_symbols
+        )
+        self.compact = compact
+        self.price_dtype = self._check_set_price_dtype(price_dtype)
+
+        self.asset_csv_files = self._map_asset_symbols_to_csv_files()
+        if self.lazy:
+            self.asset_bar_frames = OrderedDict()
+            self.asset_bid_ask_frames = OrderedDict()
+        else:
+            self.asset_bar_frames, self.asset_bid_ask_frames = self._load_csvs_into_dfs()
+        self.price_store = self._create_price_store()
+        self.close_panel = None
+        self.bid_cache = LRUCache(price_cache_size)
+        self.ask_cache = LRUCache(price_cache_size)
 
-        self.asset_bar_frames = self._load_csvs_into_dfs()
-        self.asset_bid_ask_frames = self._convert_bars_into_bid_ask_dfs()
+    def _create_bar_cache(self, cache_dir):
+        """
+        Create the optional on-disk cache of converted frames.
+
+        Parameters
+        ----------
+        cache_dir : `str` or None
+            The directory to store the cache in, or None for no caching.
+
+        Returns
+        -------
+        `BarFrameCache` or None
+            The on-disk frame cache, if a directory was provided.
+        """
+        if cache_dir is None:
+            return None
+        return BarFrameCache(cache_dir)
+
+    def _bar_cache_variant(self):
+        """
+        Obtain the identifier distinguishing this data source's bar
+        conversion within the on-disk cache.
+
+        Returns
+        -------
+        `str` or None
+            The conversion variant, None for the daily conversion.
+        """
+        return None
+
+    def _check_set_workers(self, workers):
+        """
+        Checks and sets the number of CSV loading worker processes.
+
+        Parameters
+        ----------
+        workers : `int` or None
+            The number of worker processes, or None for a serial load.
+
+        Returns
+        -------
+        `int`
+            The number of worker processes.
+        """
+        if workers is None:
+            return 1
+        if workers < 1:
+            raise ValueError(
+                "Number of CSV loading workers '%s' provided to the "
+                "data source must be a positive integer." % workers
+            )
+        return int(workers)
+
+    def _check_set_max_resident_symbols(self, max_resident_symbols):
+        """
+        Checks and sets the maximum number of symbols kept in memory
+        when lazily loading.
+
+        Parameters
+        ----------
+        max_resident_symbols : `int` or None
+            The maximum number of resident symbols, or None if unbounded.
+
+        Returns
+        -------
+        `int` or None
+            The maximum number of resident symbols.
+        """
+        if max_resident_symbols is None:
+            return None
+        if not self.lazy:
+            raise ValueError(
+                "A maximum number of resident symbols can only be "
+                "provided to the data source when loading lazily."
+            )
+        if max_resident_symbols < 1:
+            raise ValueError(
+                "Maximum number of resident symbols '%s' provided to the "
+                "data source must be a positive integer." % max_resident_symbols
+            )
+        return int(max_resident_symbols)
+
+    def _check_set_price_dtype(self, price_dtype):
+        """
+        Checks and sets the floating point type of the stored prices.
+
+        Parameters
+        ----------
+        price_dtype : `str` or `np.dtype` or None
+            The floating point type, or None for float64.
+
+        Returns
+        -------
+        `np.dtype`
+            The floating point type of the stored prices.
+        """
+        if price_dtype is None:
+            return np.dtype(np.float64)
+        price_dtype = np.dtype(price_dtype)
+        if not np.issubdtype(price_dtype, np.floating):
+            raise ValueError(
+                "Price dtype '%s' provided to the data source must be "
+                "a floating point type." % price_dtype
+            )
+        return price_dtype
 
     def _obtain_asset_csv_files(self):
         """
@@ -98,33 +448,207 @@ class CSVDailyBarDataSource(object):
         csv_df = csv_df.set_index(csv_df.index.tz_localize(pytz.UTC))
         return csv_df
 
-    def _load_csvs_into_dfs(self):
+    def _obtain_csv_files_to_load(self):
         """
-        Load all CSVs in the CSV directory into Pandas DataFrames.
+        Obtain the list of CSV filenames to load, either from the
+        provided CSV symbols or from the CSV directory.
 
         Returns
         -------
-        `dict{pd.DataFrame}`
-            The asset-symbol keyed dictionary of Pandas DataFrames
-            containing the timestamped price/volume data.
+        `list[str]`
+            The list of CSV filenames to load.
         """
-        if settings.PRINT_EVENTS:
-            print("Loading CSV files into DataFrames...")
         if self.csv_symbols is not None:
             # TODO/NOTE: This assumes existence of CSV symbols
             # within the provided directory.
-            csv_files = ['%s.csv' % symbol for symbol in self.csv_symbols]
-        else:
-            csv_files = self._obtain_asset_csv_files()
+            return ['%s.csv' % symbol for symbol in self.csv_symbols]
+        return self._obtain_asset_csv_files()
+
+    def _map_asset_symbols_to_csv_files(self):
+        """
+        Map each available asset symbol to its CSV filename.
+
+        Returns
+        -------
+        `dict{str: str}`
+            The CSV filenames keyed by asset symbol.
+        """
+        return {
+            self._obtain_asset_symbol_from_filename(csv_file): csv_file
+            for csv_file in self._obtain_csv_files_to_load()
+        }
+
+    def _load_asset_frames(self, csv_file):
+        """
+        Load a single CSV file into its daily bar DataFrame and
+        its converted bid/ask DataFrame, utilising the on-disk
+        cache if available.
+
+        Parameters
+        ----------
+        csv_file : `str`
+            The name of the CSV file.
+
+        Returns
+        -------
+        `tuple(pd.DataFrame, pd.DataFrame)`
+            The daily bar and bid/ask DataFrames.
+        """
+        csv_path = os.path.join(self.csv_dir, csv_file)
+        if self.bar_cache is not None:
+            cached_frames = self.bar_cache.load(
+                csv_path, self.adjust_prices, self._bar_cache_variant()
+            )
+            if cached_frames is not None:
+                return self._store_asset_frames(*cached_frames)
+
+        bar_df = self._load_csv_into_df(csv_file)
+        bid_ask_df = self._convert_bar_frame_into_bid_ask_df(bar_df)
+        if self.bar_cache is not None:
+            self.bar_cache.save(
+                csv_path, self.adjust_prices, bar_df, bid_ask_df,
+                self._bar_cache_variant()
+            )
+        return self._store_asset_frames(bar_df, bid_ask_df)
+
+    def _store_asset_frames(self, bar_df, bid_ask_df):
+        """
+        Prepare the loaded daily bar and bid/ask DataFrames for storage,
+        optionally compacting them and reducing their price precision.
+
+        Compacting or reducing precision copies the retained prices into
+        new frames, rather than taking views, as a view would keep the
+        memory of the full frames alive.
+
+        The on-disk cache always holds the full frames, so that the
+        storage options do not affect the cache contents.
+
+        Parameters
+        ----------
+        bar_df : `pd.DataFrame`
+            The daily 'bar' OHLCV DataFrame.
+        bid_ask_df : `pd.DataFrame`
+            The individually-timestamped bid/ask DataFrame.
+
+        Returns
+        -------
+        `tuple(pd.DataFrame, pd.DataFrame)`
+            The daily bar and bid/ask DataFrames to store.
+        """
+        if self.compact:
+            bar_df = bar_df[
+                [column for column in COMPACT_BAR_COLUMNS if column in bar_df.columns]
+            ]
+            bids = bid_ask_df['Bid'].to_numpy()
+            if np.array_equal(bids, bid_ask_df['Ask'].to_numpy(), equal_nan=True):
+                bid_ask_df = pd.DataFrame(
+                    {'Mid': bids}, index=bid_ask_df.index
+                )
+
+        if self.price_dtype != np.float64:
+            bar_df = bar_df.astype(
+                {
+                    column: self.price_dtype for column, dtype in bar_df.dtypes.items()
+                    if np.issubdtype(dtype, np.floating)
+                }
+            )
+            bid_ask_df = bid_ask_df.astype(self.price_dtype)
+        return bar_df, bid_ask_df
+
+    def _load_all_asset_frames(self, csv_files):
+        """
+        Load and convert the provided CSV files, fanning the work out
+        across a process pool if more than one worker is requested.
+
+        Parameters
+        ----------
+        csv_files : `list[str]`
+            The names of the CSV files.
+
+        Returns
+        -------
+        `iterator(tuple(pd.DataFrame, pd.DataFrame))`
+            The daily bar and bid/ask DataFrames, in CSV file order.
+        """
+        if self.workers == 1 or len(csv_files) < 2:
+            return map(self._load_asset_frames, csv_files)
+
+        # The pool is created prior to any frames being attached to the
+        # data source, so only its parameters are sent to each worker
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(csv_files)),
+            initializer=_init_load_worker,
+            initargs=(self,)
+        )
+        chunksize = max(1, len(csv_files) // (self.workers * 4))
+        with executor:
+            return list(
+                executor.map(
+                    _load_asset_frames_in_worker, csv_files, chunksize=chunksize
+                )
+            )
 
-        asset_frames = {}
-        for csv_file in csv_files:
-            asset_symbol = self._obtain_asset_symbol_from_filename(csv_file)
+    def _load_csvs_into_dfs(self):
+        """
+        Load all CSVs in the CSV directory into Pandas DataFrames
+        and convert them into individually-timestamped open/closing
+        price DataFrames.
+
+        Returns
+        -------
+        `tuple(dict{pd.DataFrame}, dict{pd.DataFrame})`
+            The asset-symbol keyed dictionaries of Pandas DataFrames
+            containing the timestamped price/volume data and the
+            converted bid/ask prices respectively.
+        """
+        if settings.PRINT_EVENTS:
+            print("Loading CSV files into DataFrames...")
+        asset_bar_frames = {}
+        asset_bid_ask_frames = {}
+        for asset_symbol, (bar_df, bid_ask_df) in zip(
+            self.asset_csv_files.keys(),
+            self._load_all_asset_frames(list(self.asset_csv_files.values()))
+        ):
             if settings.PRINT_EVENTS:
                 print("Loading CSV file for symbol '%s'..." % asset_symbol)
-            csv_df = self._load_csv_into_df(csv_file)
-            asset_frames[asset_symbol] = csv_df
-        return asset_frames
+            asset_bar_frames[asset_symbol] = bar_df
+            asset_bid_ask_frames[asset_symbol] = bid_ask_df
+        return asset_bar_frames, asset_bid_ask_frames
+
+    def _ensure_asset_loaded(self, asset):
+        """
+        When loading lazily, ensure that the frames and prices of the
+        provided asset are resident in memory, loading its CSV file if
+        necessary and discarding the least recently used asset if the
+        maximum number of resident symbols is exceeded.
+
+        Raises a KeyError if no CSV file exists for the asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        if asset in self.asset_bid_ask_frames:
+            self.asset_bid_ask_frames.move_to_end(asset)
+            return
+
+        csv_file = self.asset_csv_files[asset]
+        if settings.PRINT_EVENTS:
+            print("Lazily loading CSV file for symbol '%s'..." % asset)
+        bar_df, bid_ask_df = self._load_asset_frames(csv_file)
+        self.asset_bar_frames[asset] = bar_df
+        self.asset_bid_ask_frames[asset] = bid_ask_df
+        self.price_store.add_bid_ask_frame(asset, bid_ask_df)
+        self.close_panel = None
+
+        if (
+            self.max_resident_symbols is not None and
+            len(self.asset_bid_ask_frames) > self.max_resident_symbols
+        ):
+            evicted_asset, _ = self.asset_bid_ask_frames.popitem(last=False)
+            del self.asset_bar_frames[evicted_asset]
+            self.price_store.remove_asset(evicted_asset)
 
     def _convert_bar_frame_into_bid_ask_df(self, bar_df):
         """
@@ -145,59 +669,43 @@ class CSVDailyBarDataSource(object):
             The individually-timestamped open/closing prices, optionally
             adjusted for corporate actions.
         """
-        bar_df = bar_df.sort_index()
-        if self.adjust_prices:
-            if 'Adj Close' not in bar_df.columns:
-                raise ValueError(
-                    "Unable to locate Adjusted Close pricing column in CSV data file. "
-                    "Prices cannot be adjusted. Exiting."
-                )
-
-            # Restrict solely to the open/closing prices
-            oc_df = bar_df.loc[:, ['Open', 'Close', 'Adj Close']]
+        return convert_bar_frame_into_bid_ask_df(bar_df, self.adjust_prices)
 
-            # Adjust opening prices
-            oc_df['Adj Open'] = (oc_df['Adj Close'] / oc_df['Close']) * oc_df['Open']
-            oc_df = oc_df.loc[:, ['Adj Open', 'Adj Close']]
-            oc_df.columns = ['Open', 'Close']
-        else:
-            oc_df = bar_df.loc[:, ['Open', 'Close']]
-
-        # Convert bars into separate rows for open/close prices
-        # appropriately timestamped
-        seq_oc_df = oc_df.T.unstack(level=0).reset_index()
-        seq_oc_df.columns = ['Date', 'Market', 'Price']
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Open', 'Date'] += pd.Timedelta(hours=14, minutes=30)
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Close', 'Date'] += pd.Timedelta(hours=21, minutes=00)
+    def _create_price_store(self):
+        """
+        Pack the converted bid/ask DataFrames into contiguous
+        NumPy arrays used to answer the price lookups.
 
-        # TODO: Unable to distinguish between Bid/Ask, implement later
-        dp_df = seq_oc_df[['Date', 'Price']]
-        dp_df['Bid'] = dp_df['Price']
-        dp_df['Ask'] = dp_df['Price']
-        dp_df = dp_df.loc[:, ['Date', 'Bid', 'Ask']].fillna(method='ffill').set_index('Date').sort_index()
-        return dp_df
+        Returns
+        -------
+        `ArrayPriceStore`
+            The array-backed price store for all assets.
+        """
+        price_store = ArrayPriceStore()
+        for asset_symbol, bid_ask_df in self.asset_bid_ask_frames.items():
+            price_store.add_bid_ask_frame(asset_symbol, bid_ask_df)
+        return price_store
 
-    def _convert_bars_into_bid_ask_dfs(self):
+    @property
+    def asset_symbols(self):
         """
-        Convert all of the daily OHLCV 'bar' based DataFrames into
-        individually-timestamped open/closing price DataFrames.
+        Obtain the asset symbols provided by this data source,
+        irrespective of whether they are currently loaded.
 
         Returns
         -------
-        `dict{pd.DataFrame}`
-            The converted DataFrames.
+        `list[str]`
+            The asset symbols.
         """
-        if settings.PRINT_EVENTS:
-            print("Adjusting pricing in CSV files...")
-        asset_bid_ask_frames = {}
-        for asset_symbol, bar_df in self.asset_bar_frames.items():
-            if settings.PRINT_EVENTS:
-                print("Adjusting CSV file for symbol '%s'..." % asset_symbol)
-            asset_bid_ask_frames[asset_symbol] = \
-                self._convert_bar_frame_into_bid_ask_df(bar_df)
-        return asset_bid_ask_frames
+        return list(self.asset_csv_files.keys())
+
+    def clear_price_caches(self):
+        """
+        Discard all cached bid and ask price lookups.
+        """
+        self.bid_cache.clear()
+        self.ask_cache.clear()
 
-    @functools.lru_cache(maxsize=1024 * 1024)
     def get_bid(self, dt, asset):
         """
         Obtain the bid price of an asset at the provided timestamp.
@@ -214,14 +722,15 @@ class CSVDailyBarDataSource(object):
         `float`
             The bid price.
         """
-        bid_ask_df = self.asset_bid_ask_frames[asset]
-        try:
-            bid = bid_ask_df.iloc[bid_ask_df.index.get_loc(dt, method='pad')]['Bid']
-        except KeyError:  # Before start date
-            return np.NaN
+        key = (dt, asset)
+        bid = self.bid_cache.get(key)
+        if bid is None:
+            if self.lazy:
+                self._ensure_asset_loaded(asset)
+            bid = self.price_store.get_bid(dt, asset)
+            self.bid_cache.put(key, bid)
         return bid
 
-    @functools.lru_cache(maxsize=1024 * 1024)
     def get_ask(self, dt, asset):
         """
         Obtain the ask price of an asset at the provided timestamp.
@@ -238,17 +747,154 @@ class CSVDailyBarDataSource(object):
         `float`
             The ask price.
         """
-        bid_ask_df = self.asset_bid_ask_frames[asset]
-        try:
-            ask = bid_ask_df.iloc[bid_ask_df.index.get_loc(dt, method='pad')]['Ask']
-        except KeyError:  # Before start date
-            return np.NaN
+        key = (dt, asset)
+        ask = self.ask_cache.get(key)
+        if ask is None:
+            if self.lazy:
+                self._ensure_asset_loaded(asset)
+            ask = self.price_store.get_ask(dt, asset)
+            self.ask_cache.put(key, ask)
         return ask
 
-    def get_assets_historical_closes(self, start_dt, end_dt, assets):
+    def _ensure_assets_loaded(self, assets):
         """
-        Obtain a multi-asset historical range of closing prices as a DataFrame,
-        indexed by timestamp with asset symbols as columns.
+        When loading lazily, ensure that all of the provided assets
+        with an available CSV file are resident in memory.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols.
+        """
+        for asset in assets:
+            if asset in self.asset_csv_files:
+                self._ensure_asset_loaded(asset)
+
+    def _get_lazy_prices(self, dt, assets, get_price, get_prices):
+        """
+        When loading lazily, obtain the prices of many assets at the
+        provided timestamp.
+
+        If the batch holds no more of this data source's symbols than may
+        be resident at once these are loaded and priced in a single pass.
+        Otherwise each symbol is loaded in turn (discarding the least
+        recently used symbol as required) and priced individually, such
+        that the batch never needs to be resident at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the prices for.
+        get_price : `callable`
+            Obtains the price of a single asset, i.e. the bid or ask.
+        get_prices : `callable`
+            Obtains the prices of many resident assets in a single pass.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices aligned to the assets, with NaN for any
+            asset not provided by this data source.
+        """
+        provided = [asset for asset in assets if asset in self.asset_csv_files]
+        if (
+            self.max_resident_symbols is None or
+            len(set(provided)) <= self.max_resident_symbols
+        ):
+            self._ensure_assets_loaded(provided)
+            return get_prices(dt, assets)
+        return np.array(
+            [
+                get_price(dt, asset) if asset in self.asset_csv_files
+                else np.NaN for asset in assets
+            ],
+            dtype=np.float64
+        )
+
+    def get_bids(self, dt, assets):
+        """
+        Obtain the bid prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices aligned to the assets, with NaN for any
+            asset not provided by this data source.
+        """
+        if self.lazy:
+            return self._get_lazy_prices(
+                dt, assets, self.get_bid, self.price_store.get_bids
+            )
+        return self.price_store.get_bids(dt, assets)
+
+    def get_asks(self, dt, assets):
+        """
+        Obtain the ask prices of many assets at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices aligned to the assets, with NaN for any
+            asset not provided by this data source.
+        """
+        if self.lazy:
+            return self._get_lazy_prices(
+                dt, assets, self.get_ask, self.price_store.get_asks
+            )
+        return self.price_store.get_asks(dt, assets)
+
+    def _create_close_panel(self):
+        """
+        Align the closing prices of all loaded assets into a single
+        date x asset matrix, stored column-major such that each asset's
+        closing prices are contiguous. The matrix is read-only, as
+        views of it are handed out.
+
+        Returns
+        -------
+        `dict`
+            The int64 nanosecond timestamps ('timestamps'), the
+            DatetimeIndex ('index'), the closing price matrix ('closes')
+            and the matrix column of each asset ('columns').
+        """
+        assets = list(self.asset_bar_frames.keys())
+        if len(assets) == 0:
+            closes_df = pd.DataFrame(index=pd.DatetimeIndex([], tz=pytz.UTC))
+        else:
+            closes_df = pd.concat(
+                [self.asset_bar_frames[asset]['Close'] for asset in assets],
+                axis=1
+            )
+        closes = np.asfortranarray(closes_df.to_numpy())
+        closes.flags.writeable = False
+        return {
+            'timestamps': closes_df.index.asi8,
+            'index': closes_df.index,
+            'closes': closes,
+            'columns': {asset: i for i, asset in enumerate(assets)}
+        }
+
+    def _concat_historical_closes(self, start_dt, end_dt, assets):
+        """
+        Obtain a multi-asset historical range of closing prices by
+        joining each asset's closing prices, loading assets lazily
+        one at a time if required.
 
         Parameters
         ----------
@@ -266,6 +912,8 @@ class CSVDailyBarDataSource(object):
         """
         close_series = []
         for asset in assets:
+            if self.lazy and asset in self.asset_csv_files:
+                self._ensure_asset_loaded(asset)
             if asset in self.asset_bar_frames.keys():
                 asset_close_prices = self.asset_bar_frames[asset][['Close']]
                 asset_close_prices.columns = [asset]
@@ -274,3 +922,68 @@ class CSVDailyBarDataSource(object):
         prices_df = pd.concat(close_series, axis=1).dropna(how='all')
         prices_df = prices_df.loc[start_dt:end_dt]
         return prices_df
+
+    def get_assets_historical_closes(self, start_dt, end_dt, assets):
+        """
+        Obtain a multi-asset historical range of closing prices as a DataFrame,
+        indexed by timestamp with asset symbols as columns.
+
+        The prices are sliced from a date x asset closing price matrix
+        that is aligned once (and realigned only when lazily loaded
+        assets change), rather than being joined on every call.
+
+        Only the requested window of the matrix is copied, such that the
+        returned DataFrame is always writable and modifying it leaves the
+        matrix (and hence later calls) unaffected.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        assets : `list[str]`
+            The list of asset symbols to obtain closing prices for.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame.
+        """
+        if self.lazy:
+            self._ensure_assets_loaded(assets)
+
+        # Fall back to joining the closing prices if no asset is
+        # available or if lazily loaded assets have since been evicted
+        assets = [
+            asset for asset in assets if asset in self.asset_bar_frames or
+            (self.lazy and asset in self.asset_csv_files)
+        ]
+        if len(assets) == 0 or any(
+            asset not in self.asset_bar_frames for asset in assets
+        ):
+            return self._concat_historical_closes(start_dt, end_dt, assets)
+
+        if self.close_panel is None:
+            self.close_panel = self._create_close_panel()
+        timestamps = self.close_panel['timestamps']
+        start = 0 if start_dt is None else timestamps.searchsorted(
+            pd.Timestamp(start_dt).value, side='left'
+        )
+        end = len(timestamps) if end_dt is None else timestamps.searchsorted(
+            pd.Timestamp(end_dt).value, side='right'
+        )
+
+        columns = _column_indexer(
+            [self.close_panel['columns'][asset] for asset in assets]
+        )
+        closes = self.close_panel['closes'][start:end, columns]
+        index = self.close_panel['index'][start:end]
+        rows = ~np.isnan(closes).all(axis=1)
+        if not rows.all():
+            closes = closes[rows]
+            index = index[rows]
+        elif isinstance(columns, slice):
+            # Evenly spaced columns are selected as a view of the matrix
+            closes = closes.copy(order='F')
+        return pd.DataFrame(closes, index=index, columns=assets, copy=False)
@@ -0,0 +1,226 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.data.daily_bar_csv import (
+    CSVDailyBarDataSource, forward_fill_prices
+)
+
+
+def convert_intraday_bar_frame_into_bid_ask_df(
+    bar_df, bar_frequency, bar_label='start', adjust_prices=False
+):
+    """
+    Converts the DataFrame from intraday OHLCV 'bars' into a DataFrame
+    of individually-timestamped prices.
+
+    Each bar contributes its closing price at the end of the bar. The
+    opening price is only included at the start of bars that do not
+    immediately follow a preceding bar, such as the first bar of each
+    trading session, so that the number of prices is bounded by the
+    number of bars plus the number of sessions.
+
+    Parameters
+    ----------
+    bar_df : `pd.DataFrame`
+        The intraday 'bar' OHLCV DataFrame.
+    bar_frequency : `pd.Timedelta`
+        The duration of each bar.
+    bar_label : `str`, optional
+        Whether the bar timestamps label the 'start' or 'end' of each bar.
+    adjust_prices : `Boolean`, optional
+        Whether to utilise corporate-action adjusted prices for both
+        the open and closing prices.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The individually-timestamped open/closing prices.
+    """
+    bar_df = bar_df.sort_index()
+    opens = bar_df['Open'].to_numpy(dtype=np.float64)
+    if adjust_prices:
+        if 'Adj Close' not in bar_df.columns:
+            raise ValueError(
+                "Unable to locate Adjusted Close pricing column in CSV data file. "
+                "Prices cannot be adjusted. Exiting."
+            )
+        closes = bar_df['Adj Close'].to_numpy(dtype=np.float64)
+        opens = (closes / bar_df['Close'].to_numpy(dtype=np.float64)) * opens
+    else:
+        closes = bar_df['Close'].to_numpy(dtype=np.float64)
+
+    bar_nanos = bar_df.index.asi8
+    if bar_label == 'start':
+        starts = bar_nanos
+        ends = bar_nanos + bar_frequency.value
+    else:
+        starts = bar_nanos - bar_frequency.value
+        ends = bar_nanos
+
+    # Bars that follow on directly from the preceding bar share
+    # their opening timestamp with the preceding closing price
+    gaps = np.ones(len(bar_nanos), dtype=bool)
+    gaps[1:] = starts[1:] != ends[:-1]
+
+    timestamps = np.concatenate([starts[gaps], ends])
+    prices = np.concatenate([opens[gaps], closes])
+    order = np.argsort(timestamps, kind='stable')
+    timestamps = timestamps[order]
+    prices = forward_fill_prices(prices[order])
+
+    # TODO: Unable to distinguish between Bid/Ask, implement later
+    index = pd.DatetimeIndex(
+        timestamps.view('datetime64[ns]'), name='Date'
+    ).tz_localize(pytz.UTC)
+    return pd.DataFrame({'Bid': prices, 'Ask': prices}, index=index)
+
+
+class CSVIntradayBarDataSource(CSVDailyBarDataSource):
+    """
+    Encapsulates loading, preparation and querying of CSV files of
+    intraday 'bar' OHLCV data, such as one minute or hourly bars.
+
+    The CSV files require a 'Date' column of bar timestamps (in UTC
+    unless a timezone offset is present) along with 'Open' and 'Close'
+    columns. All of the loading, caching, lazy loading and price lookup
+    behaviour of the CSVDailyBarDataSource is retained.
+
+    Parameters
+    ----------
+    csv_dir : `str`
+        The full path to the directory where the CSV is located.
+    asset_type : `str`
+        The asset type that the price/volume data is for.
+    bar_frequency : `str` or `pd.Timedelta`, optional
+        The duration of each bar, e.g. '1min', '5min' or '1h'.
+    bar_label : `str`, optional
+        Whether the bar timestamps label the 'start' (default) or
+        'end' of each bar.
+    adjust_prices : `Boolean`, optional
+        Whether to utilise corporate-action adjusted prices for both
+        the open and closing prices. Defaults to False.
+    **kwargs
+        Any further keyword arguments of the CSVDailyBarDataSource.
+    """
+
+    BAR_LABELS = ('start', 'end')
+
+    def __init__(
+        self,
+        csv_dir,
+        asset_type,
+        bar_frequency='1min',
+        bar_label='start',
+        adjust_prices=False,
+        **kwargs
+    ):
+        self.bar_frequency = self._check_set_bar_frequency(bar_frequency)
+        self.bar_label = self._check_set_bar_label(bar_label)
+        super().__init__(
+            csv_dir, asset_type, adjust_prices=adjust_prices, **kwargs
+        )
+
+    def _check_set_bar_frequency(self, bar_frequency):
+        """
+        Checks and sets the duration of each bar.
+
+        Parameters
+        ----------
+        bar_frequency : `str` or `pd.Timedelta`
+            The duration of each bar.
+
+        Returns
+        -------
+        `pd.Timedelta`
+            The duration of each bar.
+        """
+        bar_frequency = pd.Timedelta(bar_frequency)
+        if bar_frequency <= pd.Timedelta(0):
+            raise ValueError(
+                "Bar frequency '%s' provided to the intraday data source "
+                "must be a positive duration." % bar_frequency
+            )
+        return bar_frequency
+
+    def _check_set_bar_label(self, bar_label):
+        """
+        Checks and sets whether the bar timestamps label the
+        start or end of each bar.
+
+        Parameters
+        ----------
+        bar_label : `str`
+            Either 'start' or 'end'.
+
+        Returns
+        -------
+        `str`
+            Either 'start' or 'end'.
+        """
+        if bar_label not in self.BAR_LABELS:
+            raise ValueError(
+                "Bar label '%s' provided to the intraday data source must "
+                "be one of %s." % (bar_label, ", ".join(self.BAR_LABELS))
+            )
+        return bar_label
+
+    def _bar_cache_variant(self):
+        """
+        Obtain the identifier distinguishing this data source's bar
+        conversion within the on-disk cache.
+
+        Returns
+        -------
+        `str`
+            The conversion variant.
+        """
+        return 'intraday|%s|%s' % (self.bar_frequency.value, self.bar_label)
+
+    def _load_csv_into_df(self, csv_file):
+        """
+        Loads the CSV file into a Pandas DataFrame with bar timestamps
+        parsed, sorted and converted to UTC.
+
+        Parameters
+        ----------
+        csv_file : `str`
+            The name of the CSV file.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            DataFrame of the CSV file with timestamps in UTC.
+        """
+        csv_df = pd.read_csv(
+            os.path.join(self.csv_dir, csv_file),
+            index_col='Date',
+            parse_dates=True
+        )
+        index = pd.DatetimeIndex(csv_df.index)
+        if index.tz is None:
+            index = index.tz_localize(pytz.UTC)
+        else:
+            index = index.tz_convert(pytz.UTC)
+        return csv_df.set_index(index.rename('Date')).sort_index()
+
+    def _convert_bar_frame_into_bid_ask_df(self, bar_df):
+        """
+        Converts the DataFrame from intraday OHLCV 'bars' into a
+        DataFrame of individually-timestamped prices.
+
+        Parameters
+        ----------
+        `pd.DataFrame`
+            The intraday 'bar' OHLCV DataFrame.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The individually-timestamped open/closing prices.
+        """
+        return convert_intraday_bar_frame_into_bid_ask_df(
+            bar_df, self.bar_frequency, self.bar_label, self.adjust_prices
+        )
@@ -0,0 +1,312 @@
+import numpy as np
+import pandas as pd
+
+
+class ArrayPriceStore(object):
+    """
+    Stores the individually-timestamped bid/ask prices of many
+    assets as contiguous NumPy arrays, in order to answer
+    'latest price as of timestamp' queries via a binary search
+    rather than through Pandas indexing.
+
+    Timestamps are held as int64 nanoseconds since the UTC epoch,
+    while the bid and ask prices are held as float64. Each asset
+    has its own sorted timestamp array, so that a lookup is a
+    single O(log n) np.searchsorted call.
+    """
+
+    def __init__(self):
+        self.timestamps = {}
+        self.bids = {}
+        self.asks = {}
+
+    @staticmethod
+    def _timestamp_to_int(dt):
+        """
+        Convert a (timezone-aware) timestamp into int64
+        nanoseconds since the UTC epoch.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to convert.
+
+        Returns
+        -------
+        `int`
+            Nanoseconds since the UTC epoch.
+        """
+        try:
+            return dt.value
+        except AttributeError:
+            return pd.Timestamp(dt).value
+
+    @staticmethod
+    def _as_price_array(prices):
+        """
+        Convert prices into a contiguous floating point array, retaining
+        any reduced precision (e.g. float32) floating point type.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The prices to convert.
+
+        Returns
+        -------
+        `np.ndarray`
+            The contiguous floating point prices.
+        """
+        prices = np.asarray(prices)
+        if not np.issubdtype(prices.dtype, np.floating):
+            prices = prices.astype(np.float64)
+        return np.ascontiguousarray(prices)
+
+    @property
+    def assets(self):
+        """
+        Obtain the list of asset symbols held within the store.
+
+        Returns
+        -------
+        `list[str]`
+            The asset symbols.
+        """
+        return list(self.timestamps.keys())
+
+    def __contains__(self, asset):
+        return asset in self.timestamps
+
+    def add_asset(self, asset, timestamps, bids, asks=None):
+        """
+        Add (or replace) the pricing arrays for an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        timestamps : `np.ndarray`
+            Sorted int64 nanosecond timestamps (UTC).
+        bids : `np.ndarray`
+            The bid prices aligned to the timestamps.
+        asks : `np.ndarray`, optional
+            The ask prices aligned to the timestamps. If not provided
+            the bid array is shared for the asks.
+
+        Prices may be stored at reduced precision (e.g. float32), but
+        are always returned as float64.
+        """
+        timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        bids = self._as_price_array(bids)
+        if asks is None:
+            asks = bids
+        else:
+            asks = self._as_price_array(asks)
+
+        if not (len(timestamps) == len(bids) == len(asks)):
+            raise ValueError(
+                "Unable to add asset '%s' to the price store as the "
+                "timestamp, bid and ask arrays differ in length." % asset
+            )
+
+        self.timestamps[asset] = timestamps
+        self.bids[asset] = bids
+        self.asks[asset] = asks
+
+    def add_bid_ask_frame(self, asset, bid_ask_df):
+        """
+        Add the pricing for an asset from a timestamp-indexed
+        DataFrame containing either 'Bid' and 'Ask' columns, or a single
+        'Mid' column that is used for both the bid and ask prices.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        bid_ask_df : `pd.DataFrame`
+            The individually-timestamped bid/ask prices.
+        """
+        if 'Mid' in bid_ask_df.columns:
+            self.add_asset(
+                asset, bid_ask_df.index.asi8, bid_ask_df['Mid'].to_numpy()
+            )
+        else:
+            self.add_asset(
+                asset,
+                bid_ask_df.index.asi8,
+                bid_ask_df['Bid'].to_numpy(),
+                bid_ask_df['Ask'].to_numpy()
+            )
+
+    def remove_asset(self, asset):
+        """
+        Remove the pricing arrays for an asset, if present.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        self.timestamps.pop(asset, None)
+        self.bids.pop(asset, None)
+        self.asks.pop(asset, None)
+
+    def _latest_index(self, dt, asset):
+        """
+        Obtain the array index of the latest price at or before
+        the provided timestamp. Raises KeyError if the asset is
+        not present in the store.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to search for.
+        asset : `str`
+            The asset symbol.
+
+        Returns
+        -------
+        `int`
+            The array index, or -1 if the timestamp precedes
+            the first available price.
+        """
+        return np.searchsorted(
+            self.timestamps[asset],
+            self._timestamp_to_int(dt),
+            side='right'
+        ) - 1
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the latest bid price of an asset at the provided
+        timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first price.
+        """
+        idx = self._latest_index(dt, asset)
+        if idx < 0:
+            return np.NaN
+        return np.float64(self.bids[asset][idx])
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the latest ask price of an asset at the provided
+        timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first price.
+        """
+        idx = self._latest_index(dt, asset)
+        if idx < 0:
+            return np.NaN
+        return np.float64(self.asks[asset][idx])
+
+    def _latest_indices(self, dt, assets):
+        """
+        Obtain the array indices of the latest prices at or before
+        the provided timestamp for many assets at once.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to search for.
+        assets : `list[str]`
+            The asset symbols.
+
+        Returns
+        -------
+        `np.ndarray`
+            The array indices, which are -1 for assets either not
+            present in the store or prior to their first price.
+        """
+        ts = self._timestamp_to_int(dt)
+        indices = np.full(len(assets), -1, dtype=np.int64)
+        for i, asset in enumerate(assets):
+            timestamps = self.timestamps.get(asset)
+            if timestamps is not None:
+                indices[i] = timestamps.searchsorted(ts, side='right') - 1
+        return indices
+
+    def _gather_prices(self, prices, dt, assets):
+        """
+        Obtain the latest prices of many assets from the provided
+        asset-keyed price arrays.
+
+        Parameters
+        ----------
+        prices : `dict{str: np.ndarray}`
+            Either the bid or ask price arrays.
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices, with NaN for assets that are unavailable.
+        """
+        indices = self._latest_indices(dt, assets)
+        latest = np.full(len(assets), np.NaN)
+        for i in np.flatnonzero(indices >= 0):
+            latest[i] = prices[assets[i]][indices[i]]
+        return latest
+
+    def get_bids(self, dt, assets):
+        """
+        Obtain the latest bid prices of many assets at the provided
+        timestamp in a single pass.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices aligned to the assets, with NaN for assets
+            not in the store or prior to their first price.
+        """
+        return self._gather_prices(self.bids, dt, assets)
+
+    def get_asks(self, dt, assets):
+        """
+        Obtain the latest ask prices of many assets at the provided
+        timestamp in a single pass.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices aligned to the assets, with NaN for assets
+            not in the store or prior to their first price.
+        """
+        return self._gather_prices(self.asks, dt, assets)
@@ -0,0 +1,152 @@
+import pandas as pd
+from pandas.tseries.holiday import (
+    DateOffset, EasterMonday, GoodFriday, Holiday, MO,
+    USLaborDay, USMemorialDay, USPresidentsDay, USThanksgivingDay,
+    nearest_workday, next_monday, next_monday_or_tuesday, sunday_to_monday
+)
+
+from qstrader.exchange.calendar.trading_calendar import TradingCalendar
+
+
+class RulesTradingCalendar(TradingCalendar):
+    """
+    A TradingCalendar generating exchange holidays from Pandas holiday
+    rules, along with tables of ad-hoc closures and of rule-generated
+    holidays that were moved or cancelled.
+
+    Parameters
+    ----------
+    rules : `list[pd.tseries.holiday.Holiday]`
+        The recurring exchange holiday rules.
+    additional_holidays : `list[str]`, optional
+        Ad-hoc exchange closures not covered by the rules.
+    excluded_holidays : `list[str]`, optional
+        Rule-generated holidays on which the exchange was open.
+    """
+
+    def __init__(self, rules, additional_holidays=None, excluded_holidays=None):
+        super().__init__()
+        self.rules = rules
+        self.additional_holidays = pd.DatetimeIndex(
+            additional_holidays if additional_holidays is not None else []
+        )
+        self.excluded_holidays = pd.DatetimeIndex(
+            excluded_holidays if excluded_holidays is not None else []
+        )
+
+    def _generate_holidays(self, start_date, end_date):
+        """
+        Generate the exchange holidays between two dates (inclusive).
+
+        Parameters
+        ----------
+        start_date : `pd.Timestamp`
+            The starting (timezone-naive) date.
+        end_date : `pd.Timestamp`
+            The ending (timezone-naive) date.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The timezone-naive dates of the exchange holidays.
+        """
+        holidays = self.additional_holidays[
+            (self.additional_holidays >= start_date) &
+            (self.additional_holidays <= end_date)
+        ]
+        for rule in self.rules:
+            holidays = holidays.union(rule.dates(start_date, end_date))
+        return holidays.difference(self.excluded_holidays)
+
+
+# New York Stock Exchange full day closures
+NYSE_RULES = [
+    Holiday('New Years Day', month=1, day=1, observance=sunday_to_monday),
+    Holiday(
+        'Martin Luther King Jr. Day', start_date='1998-01-01',
+        month=1, day=1, offset=DateOffset(weekday=MO(3))
+    ),
+    USPresidentsDay,
+    GoodFriday,
+    USMemorialDay,
+    Holiday(
+        'Juneteenth', start_date='2022-01-01',
+        month=6, day=19, observance=nearest_workday
+    ),
+    Holiday('Independence Day', month=7, day=4, observance=nearest_workday),
+    USLaborDay,
+    USThanksgivingDay,
+    Holiday('Christmas Day', month=12, day=25, observance=nearest_workday)
+]
+
+NYSE_ADDITIONAL_HOLIDAYS = [
+    '1985-09-27',  # Hurricane Gloria
+    '1994-04-27',  # President Nixon's funeral
+    '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',  # September 11th
+    '2004-06-11',  # President Reagan's funeral
+    '2007-01-02',  # President Ford's funeral
+    '2012-10-29', '2012-10-30',  # Hurricane Sandy
+    '2018-12-05',  # President George H.W. Bush's funeral
+    '2025-01-09'  # President Carter's funeral
+]
+
+# London Stock Exchange full day closures
+LSE_RULES = [
+    Holiday('New Years Day', month=1, day=1, observance=next_monday),
+    GoodFriday,
+    EasterMonday,
+    Holiday(
+        'Early May Bank Holiday', start_date='1978-01-01',
+        month=5, day=1, offset=DateOffset(weekday=MO(1))
+    ),
+    Holiday(
+        'Spring Bank Holiday', month=5, day=31,
+        offset=DateOffset(weekday=MO(-1))
+    ),
+    Holiday(
+        'Summer Bank Holiday', month=8, day=31,
+        offset=DateOffset(weekday=MO(-1))
+    ),
+    Holiday('Christmas Day', month=12, day=25, observance=next_monday),
+    Holiday('Boxing Day', month=12, day=26, observance=next_monday_or_tuesday)
+]
+
+LSE_ADDITIONAL_HOLIDAYS = [
+    '1995-05-08',  # VE Day 50th anniversary
+    '1999-12-31',  # Millennium
+    '2002-06-03', '2002-06-04',  # Golden Jubilee
+    '2011-04-29',  # Royal Wedding
+    '2012-06-04', '2012-06-05',  # Diamond Jubilee
+    '2020-05-08',  # VE Day 75th anniversary
+    '2022-06-02', '2022-06-03',  # Platinum Jubilee
+    '2022-09-19',  # State Funeral of Queen Elizabeth II
+    '2023-05-08'  # Coronation of King Charles III
+]
+
+LSE_EXCLUDED_HOLIDAYS = [
+    '1995-05-01',  # Moved to VE Day
+    '2002-05-27',  # Moved to the Golden Jubilee
+    '2012-05-28',  # Moved to the Diamond Jubilee
+    '2020-05-04',  # Moved to VE Day
+    '2022-05-30'  # Moved to the Platinum Jubilee
+]
+
+
+class NYSETradingCalendar(RulesTradingCalendar):
+    """
+    The full day closures of the New York Stock Exchange.
+    """
+
+    def __init__(self):
+        super().__init__(NYSE_RULES, NYSE_ADDITIONAL_HOLIDAYS)
+
+
+class LSETradingCalendar(RulesTradingCalendar):
+    """
+    The full day closures of the London Stock Exchange.
+    """
+
+    def __init__(self):
+        super().__init__(
+            LSE_RULES, LSE_ADDITIONAL_HOLIDAYS, LSE_EXCLUDED_HOLIDAYS
+        )
@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+
+from qstrader.exchange.calendar.trading_calendar import TradingCalendar
+
+
+class StaticHolidayTradingCalendar(TradingCalendar):
+    """
+    A TradingCalendar utilising a fixed table of exchange holiday
+    dates, for instance as published by the exchange.
+
+    Parameters
+    ----------
+    holidays : `list[str]` or `list[pd.Timestamp]`
+        The dates of the exchange holidays.
+    """
+
+    def __init__(self, holidays):
+        super().__init__()
+        self.holiday_dates = pd.DatetimeIndex(
+            [self._to_naive_date(holiday) for holiday in holidays]
+        ).sort_values()
+
+    @classmethod
+    def from_csv(cls, csv_path, column='Date'):
+        """
+        Create the calendar from a CSV file containing a column
+        of exchange holiday dates.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        column : `str`, optional
+            The name of the column containing the holiday dates.
+
+        Returns
+        -------
+        `StaticHolidayTradingCalendar`
+            The static holiday trading calendar.
+        """
+        if not os.path.exists(csv_path):
+            raise ValueError(
+                "Exchange holiday CSV file '%s' does not exist." % csv_path
+            )
+        holidays_df = pd.read_csv(csv_path, parse_dates=[column])
+        return cls(holidays_df[column].tolist())
+
+    def _generate_holidays(self, start_date, end_date):
+        """
+        Obtain the exchange holidays between two dates (inclusive).
+
+        Parameters
+        ----------
+        start_date : `pd.Timestamp`
+            The starting (timezone-naive) date.
+        end_date : `pd.Timestamp`
+            The ending (timezone-naive) date.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The timezone-naive dates of the exchange holidays.
+        """
+        return self.holiday_dates[
+            (self.holiday_dates >= start_date) & (self.holiday_dates <= end_date)
+        ]
@@ -0,0 +1,230 @@
+from abc import ABCMeta, abstractmethod
+
+import pandas as pd
+import pytz
+
+
+class TradingCalendar(object):
+    """
+    Interface to an exchange trading calendar, which determines the
+    days on which an exchange is open for trading.
+
+    Trading days are weekdays (Monday-Friday) that are not exchange
+    holidays. Subclasses provide the holidays, which are cached per
+    calendar year such that checking a single timestamp is a set
+    membership test.
+
+    All dates refer to the calendar date of UTC timestamps, consistent
+    with the remainder of the simulation.
+    """
+
+    __metaclass__ = ABCMeta
+
+    def __init__(self):
+        self._year_holidays = {}
+
+    @abstractmethod
+    def _generate_holidays(self, start_date, end_date):
+        """
+        Generate the exchange holidays between two dates (inclusive).
+
+        Parameters
+        ----------
+        start_date : `pd.Timestamp`
+            The starting (timezone-naive) date.
+        end_date : `pd.Timestamp`
+            The ending (timezone-naive) date.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The timezone-naive dates of the exchange holidays.
+        """
+        raise NotImplementedError(
+            "Should implement _generate_holidays()"
+        )
+
+    @staticmethod
+    def _to_naive_date(dt):
+        """
+        Convert a timestamp into its timezone-naive calendar date.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to convert.
+
+        Returns
+        -------
+        `pd.Timestamp`
+            The timezone-naive date at midnight.
+        """
+        dt = pd.Timestamp(dt)
+        if dt.tzinfo is not None:
+            dt = dt.tz_convert(pytz.utc).tz_localize(None)
+        return dt.normalize()
+
+    def _holidays_for_year(self, year):
+        """
+        Obtain the (cached) exchange holidays of a calendar year.
+
+        Parameters
+        ----------
+        year : `int`
+            The calendar year.
+
+        Returns
+        -------
+        `frozenset[datetime.date]`
+            The exchange holiday dates.
+        """
+        try:
+            return self._year_holidays[year]
+        except KeyError:
+            holidays = frozenset(
+                holiday.date() for holiday in self._generate_holidays(
+                    pd.Timestamp(year=year, month=1, day=1),
+                    pd.Timestamp(year=year, month=12, day=31)
+                )
+            )
+            self._year_holidays[year] = holidays
+            return holidays
+
+    def holidays(self, start_dt, end_dt):
+        """
+        Obtain the exchange holidays between two timestamps.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting timestamp.
+        end_dt : `pd.Timestamp`
+            The ending timestamp.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The timezone-naive dates of the exchange holidays.
+        """
+        start_date = self._to_naive_date(start_dt)
+        end_date = self._to_naive_date(end_dt)
+        holidays = sorted(
+            holiday for year in range(start_date.year, end_date.year + 1)
+            for holiday in self._holidays_for_year(year)
+        )
+        holidays = pd.DatetimeIndex(holidays)
+        return holidays[(holidays >= start_date) & (holidays <= end_date)]
+
+    def is_trading_day(self, dt):
+        """
+        Check whether the exchange trades on the date of a timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to check.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the date is a trading day.
+        """
+        date = self._to_naive_date(dt)
+        if date.weekday() > 4:
+            return False
+        return date.date() not in self._holidays_for_year(date.year)
+
+    def trading_day_mask(self, timestamps):
+        """
+        Check whether the exchange trades on the date of each of many
+        timestamps.
+
+        Parameters
+        ----------
+        timestamps : `pd.DatetimeIndex`
+            The timestamps to check.
+
+        Returns
+        -------
+        `np.ndarray`
+            Boolean mask of whether each date is a trading day.
+        """
+        timestamps = pd.DatetimeIndex(timestamps)
+        if timestamps.tz is not None:
+            timestamps = timestamps.tz_convert(pytz.utc).tz_localize(None)
+        dates = timestamps.normalize()
+        if len(dates) == 0:
+            return dates.weekday < 5
+        holidays = self.holidays(dates.min(), dates.max())
+        return (dates.weekday < 5) & ~dates.isin(holidays)
+
+    def previous_trading_datetime(self, dt):
+        """
+        Roll a timestamp back to the same time of day on the latest
+        trading day on or before its date.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to roll back.
+
+        Returns
+        -------
+        `pd.Timestamp`
+            The rolled back timestamp.
+        """
+        while not self.is_trading_day(dt):
+            dt = dt - pd.Timedelta(days=1)
+        return dt
+
+    def next_trading_datetime(self, dt):
+        """
+        Roll a timestamp forward to the same time of day on the
+        earliest trading day on or after its date.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to roll forward.
+
+        Returns
+        -------
+        `pd.Timestamp`
+            The rolled forward timestamp.
+        """
+        while not self.is_trading_day(dt):
+            dt = dt + pd.Timedelta(days=1)
+        return dt
+
+    def roll_to_trading_datetimes(self, timestamps, start_dt, end_dt):
+        """
+        Move any of the provided timestamps falling on non-trading days
+        to a trading day within the provided (inclusive) range.
+
+        Each timestamp is rolled back to the previous trading day, unless
+        this would precede the start of the range, in which case it is
+        rolled forward to the next trading day instead. Any timestamps
+        subsequently outside of the range are discarded.
+
+        Parameters
+        ----------
+        timestamps : `list[pd.Timestamp]`
+            The timestamps to roll.
+        start_dt : `pd.Timestamp`
+            The starting timestamp of the range.
+        end_dt : `pd.Timestamp`
+            The ending timestamp of the range.
+
+        Returns
+        -------
+        `list[pd.Timestamp]`
+            The sorted unique timestamps on trading days.
+        """
+        rolled_timestamps = set()
+        for dt in timestamps:
+            rolled_dt = self.previous_trading_datetime(dt)
+            if rolled_dt < start_dt:
+                rolled_dt = self.next_trading_datetime(dt)
+            if start_dt <= rolled_dt <= end_dt:
+                rolled_timestamps.add(rolled_dt)
+        return sorted(rolled_timestamps)
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from qstrader.exchange.calendar.trading_calendar import TradingCalendar
+
+
+class WeekdayTradingCalendar(TradingCalendar):
+    """
+    A TradingCalendar where every weekday (Monday-Friday) is a trading
+    day. This reproduces the behaviour of a simulation without an
+    exchange holiday calendar.
+    """
+
+    def _generate_holidays(self, start_date, end_date):
+        """
+        Generate the (non-existent) exchange holidays.
+
+        Parameters
+        ----------
+        start_date : `pd.Timestamp`
+            The starting (timezone-naive) date.
+        end_date : `pd.Timestamp`
+            The ending (timezone-naive) date.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            An empty DatetimeIndex.
+        """
+        return pd.DatetimeIndex([])
@@ -16,10 +16,13 @@ class SimulatedExchange(Exchange):
     ----------
     start_dt : `pd.Timestamp`
         The starting time of the simulated exchange.
+    calendar : `TradingCalendar`, optional
+        The exchange trading calendar used to determine holidays.
     """
 
-    def __init__(self, start_dt):
+    def __init__(self, start_dt, calendar=None):
         self.start_dt = start_dt
+        self.calendar = calendar
 
         # TODO: Eliminate hardcoding of NYSE
         # TODO: Make these timezone-aware
@@ -32,10 +35,9 @@ class SimulatedExchange(Exchange):
         provided pandas Timestamp.
 
         This logic is simplistic in that it only checks whether
-        the provided time is between market hours on a weekday.
-
-        There is no historical calendar handling or concept of
-        exchange holidays.
+        the provided time is between market hours on a weekday
+        that is not an exchange holiday of the (optional)
+        trading calendar.
 
         Parameters
         ----------
@@ -49,4 +51,6 @@ class SimulatedExchange(Exchange):
         """
         if dt.weekday() > 4:
             return False
+        if self.calendar is not None and not self.calendar.is_trading_day(dt):
+            return False
         return self.open_dt <= dt.time() and dt.time() < self.close_dt
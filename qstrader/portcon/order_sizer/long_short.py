@@ -131,6 +131,10 @@ class LongShortLeveragedOrderSizer(OrderSizer):
         # Scale weights to take into account gross exposure and leverage
         normalised_weights = self._normalise_weights(weights)
 
+        asset_prices = self.data_handler.get_assets_latest_ask_prices(
+            dt, sorted(normalised_weights.keys())
+        )
+
         target_portfolio = {}
         for asset, weight in sorted(normalised_weights.items()):
             pre_cost_dollar_weight = total_equity * weight
@@ -143,9 +147,7 @@ class LongShortLeveragedOrderSizer(OrderSizer):
 
             # Calculate integral target asset quantity assuming broker costs
             after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
-            asset_price = self.data_handler.get_asset_latest_ask_price(
-                dt, asset
-            )
+            asset_price = asset_prices[asset]
 
             if np.isnan(asset_price):
                 raise ValueError(
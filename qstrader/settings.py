@@ -17,3 +17,11 @@ PRINT_EVENTS = True
 def set_print_events(print_events=True):
     global PRINT_EVENTS
     PRINT_EVENTS = print_events
+
+
+DEBUG_TOTALS = False
+
+
+def set_debug_totals(debug_totals=True):
+    global DEBUG_TOTALS
+    DEBUG_TOTALS = debug_totals
@@ -38,6 +38,51 @@ class SignalsCollection(object):
         """
         return self.signals[signal]
 
+    def get_checkpoint_state(self):
+        """
+        Obtain the mutable state of the signals, namely each
+        signal's assets and price buffers along with the
+        number of warmup updates, such that it can be
+        persisted and subsequently restored.
+
+        Returns
+        -------
+        `dict`
+            The signals state.
+        """
+        return {
+            'warmup': self.warmup,
+            'signals': {
+                name: {'assets': signal.assets, 'buffers': signal.buffers}
+                for name, signal in self.signals.items()
+            }
+        }
+
+    def restore_checkpoint_state(self, state):
+        """
+        Restore the mutable state of the signals from a
+        previously obtained checkpoint state.
+
+        Parameters
+        ----------
+        state : `dict`
+            The signals state.
+        """
+        for name, signal_state in state['signals'].items():
+            if signal_state['buffers'].lookbacks != self.signals[name].lookbacks:
+                raise ValueError(
+                    "Signal '%s' has lookbacks %s, which differ from the "
+                    "checkpoint lookbacks %s. Cannot restore the signals." % (
+                        name, self.signals[name].lookbacks,
+                        signal_state['buffers'].lookbacks
+                    )
+                )
+
+        self.warmup = state['warmup']
+        for name, signal_state in state['signals'].items():
+            self.signals[name].assets = signal_state['assets']
+            self.signals[name].buffers = signal_state['buffers']
+
     def update(self, dt):
         """
         Updates the universe (if dynamic) for each signal as well
@@ -55,8 +100,9 @@ class SignalsCollection(object):
 
         # Update all of the signals with new prices
         for name, signal in self.signals.items():
-            assets = signal.assets
-            for asset in assets:
-                price = self.data_handler.get_asset_latest_mid_price(dt, asset)
-                self.signals[name].append(asset, price)
+            prices = self.data_handler.get_assets_latest_mid_prices(
+                dt, signal.assets
+            )
+            for asset in signal.assets:
+                self.signals[name].append(asset, prices[asset])
         self.warmup += 1
@@ -1,5 +1,4 @@
-import datetime
-
+import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import BDay
 import pytz
@@ -8,19 +7,37 @@ from qstrader.simulation.sim_engine import SimulationEngine
 from qstrader.simulation.event import SimulationEvent
 
 
+# Event types generated on each business day, in chronological order
+EVENT_TYPES = ('pre_market', 'market_open', 'market_close', 'post_market')
+
+# Nanoseconds after midnight UTC at which each event type occurs
+EVENT_OFFSETS = np.array(
+    [
+        pd.Timedelta(hours=0).value,
+        pd.Timedelta(hours=14, minutes=30).value,
+        pd.Timedelta(hours=21, minutes=00).value,
+        pd.Timedelta(hours=23, minutes=59).value
+    ],
+    dtype=np.int64
+)
+
+
 class DailyBusinessDaySimulationEngine(SimulationEngine):
     """
     A SimulationEngine subclass that generates events on a daily
     frequency defaulting to typical business days, that is
     Monday-Friday.
 
-    In particular it does not take into account any specific
-    regional holidays, such as Federal Holidays in the USA or
-    Bank Holidays in the UK.
+    An optional TradingCalendar can be provided in order to take
+    into account specific regional holidays, such as Federal Holidays
+    in the USA or Bank Holidays in the UK. No events are produced on
+    exchange holidays.
 
     It produces a pre-market event, a market open event,
     a market closing event and a post-market event for every day
-    between the starting and ending dates.
+    between the starting and ending dates. The full schedule of event
+    timestamps and event type codes is precomputed as arrays upon
+    construction, rather than being generated during iteration.
 
     Parameters
     ----------
@@ -32,9 +49,14 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         Whether to include a pre-market event
     post_market : `Boolean`, optional
         Whether to include a post-market event
+    calendar : `TradingCalendar`, optional
+        The exchange trading calendar used to exclude holidays.
     """
 
-    def __init__(self, starting_day, ending_day, pre_market=True, post_market=True):
+    def __init__(
+        self, starting_day, ending_day, pre_market=True, post_market=True,
+        calendar=None
+    ):
         if ending_day < starting_day:
             raise ValueError(
                 "Ending date time %s is earlier than starting date time %s. "
@@ -46,12 +68,14 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         self.ending_day = ending_day
         self.pre_market = pre_market
         self.post_market = post_market
+        self.calendar = calendar
         self.business_days = self._generate_business_days()
+        self.event_times, self.event_codes = self._generate_event_schedule()
 
     def _generate_business_days(self):
         """
         Generate the list of business days using midnight UTC as
-        the timestamp.
+        the timestamp, excluding any trading calendar holidays.
 
         Returns
         -------
@@ -61,8 +85,46 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         days = pd.date_range(
             self.starting_day, self.ending_day, freq=BDay()
         )
+        if self.calendar is not None:
+            days = days[self.calendar.trading_day_mask(days)]
         return days
 
+    def _generate_event_schedule(self):
+        """
+        Precompute the full schedule of event timestamps and event
+        type codes for every business day, in chronological order.
+
+        Returns
+        -------
+        `tuple(pd.DatetimeIndex, np.ndarray)`
+            The UTC event timestamps and the int8 event type codes,
+            which index into EVENT_TYPES.
+        """
+        event_codes = np.array(
+            [
+                code for code, event_type in enumerate(EVENT_TYPES)
+                if (event_type != 'pre_market' or self.pre_market) and
+                (event_type != 'post_market' or self.post_market)
+            ],
+            dtype=np.int8
+        )
+
+        # Event times are relative to midnight UTC of the calendar
+        # date of each business day
+        days = pd.DatetimeIndex(self.business_days)
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        day_nanos = days.normalize().asi8
+
+        event_nanos = (
+            day_nanos[:, np.newaxis] + EVENT_OFFSETS[event_codes][np.newaxis, :]
+        ).ravel()
+        event_times = pd.DatetimeIndex(event_nanos, tz=pytz.utc)
+        return event_times, np.tile(event_codes, len(day_nanos))
+
+    def __len__(self):
+        return len(self.event_codes)
+
     def __iter__(self):
         """
         Generate the daily timestamps and event information
@@ -73,35 +135,5 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         `SimulationEvent`
             Market time simulation event to yield
         """
-        for index, bday in enumerate(self.business_days):
-            year = bday.year
-            month = bday.month
-            day = bday.day
-
-            if self.pre_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day), tz='UTC'
-                    ), event_type="pre_market"
-                )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 14, 30),
-                    tz=pytz.utc
-                ), event_type="market_open"
-            )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 21, 00),
-                    tz=pytz.utc
-                ), event_type="market_close"
-            )
-
-            if self.post_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day, 23, 59), tz='UTC'
-                    ), event_type="post_market"
-                )
+        for ts, code in zip(self.event_times, self.event_codes.tolist()):
+            yield SimulationEvent(ts, EVENT_TYPES[code])
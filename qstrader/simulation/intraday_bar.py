@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.offsets import BDay
+import pytz
+
+from qstrader.simulation.sim_engine import SimulationEngine
+from qstrader.simulation.event import SimulationEvent
+
+
+# Event types generated on each trading day
+INTRADAY_EVENT_TYPES = (
+    'pre_market', 'market_open', 'market_bar', 'market_close', 'post_market'
+)
+
+
+class IntradayBarSimulationEngine(SimulationEngine):
+    """
+    A SimulationEngine subclass that generates events at a configurable
+    intraday bar frequency, such as one minute, five minutes or hourly,
+    on business days (Monday-Friday).
+
+    On every trading day it produces an optional pre-market event, a
+    market open event, a market bar event at the end of every bar that
+    closes strictly within market hours, a market close event and an
+    optional post-market event.
+
+    Only the per-day event offsets and the trading days are held in
+    memory, with each day's timestamps generated upon iteration, so
+    that memory usage does not grow with the number of bars.
+
+    Parameters
+    ----------
+    starting_day : `pd.Timestamp`
+        The starting day of the simulation.
+    ending_day : `pd.Timestamp`
+        The ending day of the simulation.
+    bar_frequency : `str` or `pd.Timedelta`, optional
+        The duration of each bar, e.g. '1min', '5min' or '1h'.
+    market_open : `str`, optional
+        The UTC time of the market open.
+    market_close : `str`, optional
+        The UTC time of the market close.
+    pre_market : `Boolean`, optional
+        Whether to include a pre-market event
+    post_market : `Boolean`, optional
+        Whether to include a post-market event
+    calendar : `TradingCalendar`, optional
+        The exchange trading calendar used to exclude holidays.
+    """
+
+    def __init__(
+        self,
+        starting_day,
+        ending_day,
+        bar_frequency='5min',
+        market_open='14:30',
+        market_close='21:00',
+        pre_market=False,
+        post_market=False,
+        calendar=None
+    ):
+        if ending_day < starting_day:
+            raise ValueError(
+                "Ending date time %s is earlier than starting date time %s. "
+                "Cannot create IntradayBarSimulationEngine "
+                "instance." % (ending_day, starting_day)
+            )
+
+        self.starting_day = starting_day
+        self.ending_day = ending_day
+        self.bar_frequency = pd.Timedelta(bar_frequency)
+        self.market_open = pd.Timedelta('%s:00' % market_open)
+        self.market_close = pd.Timedelta('%s:00' % market_close)
+        if self.bar_frequency <= pd.Timedelta(0):
+            raise ValueError(
+                "Bar frequency %s must be a positive duration. Cannot "
+                "create IntradayBarSimulationEngine instance." % bar_frequency
+            )
+        if self.market_close <= self.market_open:
+            raise ValueError(
+                "Market close %s is not later than market open %s. Cannot "
+                "create IntradayBarSimulationEngine instance." % (
+                    market_close, market_open
+                )
+            )
+
+        self.pre_market = pre_market
+        self.post_market = post_market
+        self.calendar = calendar
+        self.business_days = self._generate_business_days()
+        self.event_offsets, self.event_codes = self._generate_day_schedule()
+
+    def _generate_business_days(self):
+        """
+        Generate the list of business days using midnight UTC as
+        the timestamp, excluding any trading calendar holidays.
+
+        Returns
+        -------
+        `list[pd.Timestamp]`
+            The business day range list.
+        """
+        days = pd.date_range(
+            self.starting_day, self.ending_day, freq=BDay()
+        )
+        if self.calendar is not None:
+            days = days[self.calendar.trading_day_mask(days)]
+        return days
+
+    def _generate_day_schedule(self):
+        """
+        Generate the event offsets from midnight UTC and the event type
+        codes that are repeated on every trading day.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The int64 nanosecond event offsets and the int8 event type
+            codes, which index into INTRADAY_EVENT_TYPES.
+        """
+        open_nanos = self.market_open.value
+        close_nanos = self.market_close.value
+        bar_nanos = np.arange(
+            open_nanos + self.bar_frequency.value, close_nanos,
+            self.bar_frequency.value, dtype=np.int64
+        )
+
+        offsets = []
+        codes = []
+        if self.pre_market:
+            offsets.append(np.zeros(1, dtype=np.int64))
+            codes.append(np.full(1, 0, dtype=np.int8))
+        offsets.append(np.array([open_nanos], dtype=np.int64))
+        codes.append(np.full(1, 1, dtype=np.int8))
+        offsets.append(bar_nanos)
+        codes.append(np.full(len(bar_nanos), 2, dtype=np.int8))
+        offsets.append(np.array([close_nanos], dtype=np.int64))
+        codes.append(np.full(1, 3, dtype=np.int8))
+        if self.post_market:
+            offsets.append(
+                np.array([pd.Timedelta(hours=23, minutes=59).value], dtype=np.int64)
+            )
+            codes.append(np.full(1, 4, dtype=np.int8))
+        return np.concatenate(offsets), np.concatenate(codes)
+
+    def __len__(self):
+        return len(self.business_days) * len(self.event_codes)
+
+    def __iter__(self):
+        """
+        Generate the intraday timestamps and event information
+        for every trading day.
+
+        Yields
+        ------
+        `SimulationEvent`
+            Market time simulation event to yield
+        """
+        days = pd.DatetimeIndex(self.business_days)
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        event_types = [INTRADAY_EVENT_TYPES[code] for code in self.event_codes]
+
+        for day_nanos in days.normalize().asi8:
+            event_times = pd.DatetimeIndex(
+                day_nanos + self.event_offsets, tz=pytz.utc
+            )
+            for ts, event_type in zip(event_times, event_types):
+                yield SimulationEvent(ts, event_type)
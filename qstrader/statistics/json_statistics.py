@@ -60,6 +60,37 @@ class JSONStatistics(object):
         self.output_filename = output_filename
         self.statistics = self._create_full_statistics()
 
+    @classmethod
+    def from_results_sink(cls, results_sink, burn_in_dt=None, **kwargs):
+        """
+        Create the statistics from the equity curve and target
+        allocations streamed to a results sink, which are read
+        back in chunks.
+
+        Parameters
+        ----------
+        results_sink : `ResultsSink`
+            The results sink of the backtest.
+        burn_in_dt : `pd.Timestamp`, optional
+            The end of the burn-in period of the backtest, prior
+            to which the results are discarded.
+        **kwargs
+            Any further keyword arguments of JSONStatistics.
+
+        Returns
+        -------
+        `JSONStatistics`
+            The JSON statistics instance.
+        """
+        equity_curve = results_sink.read_equity_curve(start_dt=burn_in_dt)
+        equity_curve.index = equity_curve.index.date
+        target_allocations = results_sink.read_target_allocations()
+        target_allocations.index = target_allocations.index.date
+        target_allocations = target_allocations.reindex(
+            index=equity_curve.index, method='ffill'
+        )
+        return cls(equity_curve, target_allocations, **kwargs)
+
     @staticmethod
     def _series_to_tuple_list(series):
         """
@@ -130,8 +161,8 @@ class JSONStatistics(object):
         curve : `pd.DataFrame`
             The equity curve DataFrame.
         """
-        curve['Returns'] = curve['Equity'].pct_change().fillna(0.0)
-        curve['CumReturns'] = np.exp(np.log(1 + curve['Returns']).cumsum())
+        curve['Returns'] = perf.create_returns(curve['Equity'])
+        curve['CumReturns'] = perf.create_cum_returns(curve['Returns'])
 
     def _calculate_monthly_aggregated_returns(self, returns):
         """
@@ -337,7 +368,7 @@ class JSONStatistics(object):
         stats['mean_returns'] = np.mean(curve['Returns'])
         stats['stdev_returns'] = np.std(curve['Returns'])
         stats['cagr'] = perf.create_cagr(curve['CumReturns'], self.periods)
-        stats['annualised_vol'] = np.std(curve['Returns']) * np.sqrt(self.periods)
+        stats['annualised_vol'] = perf.create_annualised_vol(curve['Returns'], self.periods)
         stats['sharpe'] = perf.create_sharpe_ratio(curve['Returns'], self.periods)
         stats['sortino'] = perf.create_sortino_ratio(curve['Returns'], self.periods)
 
@@ -26,6 +26,40 @@ def aggregate_returns(returns, convert_to):
         ValueError('convert_to must be weekly, monthly or yearly')
 
 
+def create_returns(equity):
+    """
+    Calculates the period percentage returns of an equity
+    curve, with a zero return for the first period.
+
+    Parameters:
+    equity - A pandas Series representing the equity curve.
+    """
+    return equity.pct_change().fillna(0.0)
+
+
+def create_cum_returns(returns):
+    """
+    Calculates the cumulative returns curve, starting at
+    one, of the period percentage returns.
+
+    Parameters:
+    returns - A pandas Series representing period percentage returns.
+    """
+    return np.exp(np.log(1 + returns).cumsum())
+
+
+def create_annualised_vol(returns, periods=252):
+    """
+    Calculates the annualised volatility of the
+    period percentage returns.
+
+    Parameters:
+    returns - A pandas Series representing period percentage returns.
+    periods - Daily (252), Hourly (252*6.5), Minutely(252*6.5*60) etc.
+    """
+    return np.std(returns) * np.sqrt(periods)
+
+
 def create_cagr(equity, periods=252):
     """
     Calculates the Compound Annual Growth Rate (CAGR)
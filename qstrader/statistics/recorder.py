@@ -0,0 +1,263 @@
+import numpy as np
+import pandas as pd
+import pytz
+
+
+# Default number of rows preallocated by each recorder
+DEFAULT_RECORDER_CAPACITY = 1024
+
+# Default number of rebalances preallocated by the allocation recorder
+DEFAULT_ALLOCATION_CAPACITY = 64
+
+
+def _timestamp_to_int(dt):
+    """
+    Convert a (timezone-aware) timestamp into int64
+    nanoseconds since the UTC epoch.
+
+    Parameters
+    ----------
+    dt : `pd.Timestamp`
+        The timestamp to convert.
+
+    Returns
+    -------
+    `int`
+        Nanoseconds since the UTC epoch.
+    """
+    try:
+        return dt.value
+    except AttributeError:
+        return pd.Timestamp(dt).value
+
+
+def _int_to_timestamps(timestamps):
+    """
+    Convert int64 nanoseconds since the UTC epoch into a
+    UTC DatetimeIndex named 'Date'.
+
+    Parameters
+    ----------
+    timestamps : `np.ndarray`
+        The int64 nanosecond timestamps.
+
+    Returns
+    -------
+    `pd.DatetimeIndex`
+        The UTC timestamps.
+    """
+    return pd.DatetimeIndex(
+        timestamps.view('datetime64[ns]'), name='Date'
+    ).tz_localize(pytz.UTC)
+
+
+def _check_capacity(capacity):
+    """
+    Check that the preallocated capacity is a positive integer.
+
+    Parameters
+    ----------
+    capacity : `int`
+        The number of preallocated rows.
+
+    Returns
+    -------
+    `int`
+        The number of preallocated rows.
+    """
+    if capacity < 1:
+        raise ValueError(
+            "Recorder capacity '%s' must be a positive integer." % capacity
+        )
+    return int(capacity)
+
+
+class EquityCurveRecorder(object):
+    """
+    Records the equity curve of a backtest into preallocated int64
+    timestamp and float64 equity arrays, which grow geometrically as
+    required, in place of a list of (timestamp, equity) tuples.
+
+    Remains compatible with the previous list interface, in that
+    (timestamp, equity) tuples can be appended and iterated over.
+
+    Parameters
+    ----------
+    capacity : `int`, optional
+        The number of rows initially preallocated.
+    """
+
+    def __init__(self, capacity=DEFAULT_RECORDER_CAPACITY):
+        capacity = _check_capacity(capacity)
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.equity = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for dt, equity in zip(
+            _int_to_timestamps(self.timestamps[:self.size]),
+            self.equity[:self.size]
+        ):
+            yield (dt, equity)
+
+    def _grow(self):
+        """
+        Double the preallocated capacity of the arrays.
+        """
+        capacity = 2 * len(self.timestamps)
+        self.timestamps = np.resize(self.timestamps, capacity)
+        self.equity = np.resize(self.equity, capacity)
+
+    def record(self, dt, equity):
+        """
+        Record the total equity at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which the equity was obtained.
+        equity : `float`
+            The total equity.
+        """
+        if self.size == len(self.timestamps):
+            self._grow()
+        self.timestamps[self.size] = _timestamp_to_int(dt)
+        self.equity[self.size] = equity
+        self.size += 1
+
+    def append(self, item):
+        """
+        Record a (timestamp, equity) tuple.
+
+        Parameters
+        ----------
+        item : `tuple(pd.Timestamp, float)`
+            The timestamp and total equity.
+        """
+        self.record(*item)
+
+    def to_frame(self):
+        """
+        Obtain the recorded equity curve as a Pandas DataFrame.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The 'Equity' column indexed by the UTC 'Date' timestamps.
+        """
+        return pd.DataFrame(
+            {'Equity': self.equity[:self.size].copy()},
+            index=_int_to_timestamps(self.timestamps[:self.size])
+        )
+
+
+class TargetAllocationRecorder(object):
+    """
+    Records the target allocations of each rebalance into an
+    asset-indexed float64 weight matrix, with a row per rebalance and
+    a column per asset, in place of a list of per-rebalance weight
+    dictionaries. Assets without a weight for a particular rebalance
+    are recorded as NaN.
+
+    The matrix is preallocated and grows geometrically in the number
+    of rebalances, while columns are only added for newly seen assets.
+
+    Remains compatible with the previous list interface, in that the
+    {'Date': timestamp, asset: weight, ...} dictionaries produced by
+    the portfolio construction model can be appended.
+
+    Parameters
+    ----------
+    capacity : `int`, optional
+        The number of rebalances initially preallocated.
+    """
+
+    def __init__(self, capacity=DEFAULT_ALLOCATION_CAPACITY):
+        capacity = _check_capacity(capacity)
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.weights = np.full((capacity, 0), np.NaN)
+        self.assets = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _grow_rows(self):
+        """
+        Double the preallocated number of rebalances.
+        """
+        capacity, num_columns = self.weights.shape
+        weights = np.full((2 * capacity, num_columns), np.NaN)
+        weights[:capacity] = self.weights
+        self.weights = weights
+        self.timestamps = np.resize(self.timestamps, 2 * capacity)
+
+    def _add_assets(self, assets):
+        """
+        Add a weight matrix column for each previously unseen asset.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols.
+        """
+        new_assets = [asset for asset in assets if asset not in self.assets]
+        if not new_assets:
+            return
+        capacity, num_columns = self.weights.shape
+        weights = np.full((capacity, num_columns + len(new_assets)), np.NaN)
+        weights[:, :num_columns] = self.weights
+        self.weights = weights
+        for asset in new_assets:
+            self.assets[asset] = len(self.assets)
+
+    def record(self, dt, weights):
+        """
+        Record the target weights of a rebalance.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time of the rebalance.
+        weights : `dict{str: float}`
+            The target weight of each asset.
+        """
+        if self.size == len(self.timestamps):
+            self._grow_rows()
+        self._add_assets(weights.keys())
+        columns = [self.assets[asset] for asset in weights.keys()]
+        self.weights[self.size, columns] = list(weights.values())
+        self.timestamps[self.size] = _timestamp_to_int(dt)
+        self.size += 1
+
+    def append(self, alloc_dict):
+        """
+        Record a {'Date': timestamp, asset: weight, ...} dictionary.
+
+        Parameters
+        ----------
+        alloc_dict : `dict`
+            The rebalance timestamp and target weight of each asset.
+        """
+        weights = dict(alloc_dict)
+        dt = weights.pop('Date')
+        self.record(dt, weights)
+
+    def to_frame(self):
+        """
+        Obtain the recorded target allocations as a Pandas DataFrame.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The weight of each asset column, in order of first
+            appearance, indexed by the UTC 'Date' timestamps.
+        """
+        return pd.DataFrame(
+            self.weights[:self.size, :len(self.assets)].copy(),
+            index=_int_to_timestamps(self.timestamps[:self.size]),
+            columns=list(self.assets.keys())
+        )
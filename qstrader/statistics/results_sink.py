@@ -0,0 +1,623 @@
+from abc import ABCMeta, abstractmethod
+import json
+import os
+
+import pandas as pd
+
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+
+
+# Default number of records buffered per stream prior to writing
+DEFAULT_CHUNK_SIZE = 1000
+
+# The columns of each of the streamed results
+RESULTS_STREAM_COLUMNS = {
+    'equity_curve': ['Date', 'Equity'],
+    'target_allocations': ['Date', 'Asset', 'Weight'],
+    'portfolio_events': [
+        'portfolio_id', 'dt', 'type', 'description', 'debit', 'credit', 'balance'
+    ]
+}
+
+# The string columns of each of the streamed results
+RESULTS_STREAM_STRING_COLUMNS = {
+    'equity_curve': [],
+    'target_allocations': ['Asset'],
+    'portfolio_events': ['portfolio_id', 'type', 'description']
+}
+
+# The timestamp columns of each of the streamed results
+RESULTS_STREAM_DATE_COLUMNS = {
+    'equity_curve': 'Date',
+    'target_allocations': 'Date',
+    'portfolio_events': 'dt'
+}
+
+
+class ResultsSink(object):
+    """
+    Abstract interface for streaming the results of a backtest, namely
+    the equity curve, target allocations and portfolio events, to an
+    append-only file per results stream during the simulation, rather
+    than accumulating them in memory.
+
+    Records are buffered per stream and written in chunks. Any existing
+    results files within the output directory are truncated upon
+    instantiation.
+
+    Parameters
+    ----------
+    output_dir : `str`
+        The directory in which the results files are written.
+    chunk_size : `int`, optional
+        The number of records buffered per stream prior to writing.
+    """
+
+    __metaclass__ = ABCMeta
+
+    extension = None
+
+    def __init__(self, output_dir, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.output_dir = output_dir
+        self.chunk_size = self._check_chunk_size(chunk_size)
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.buffers = {stream: [] for stream in RESULTS_STREAM_COLUMNS}
+        for stream in RESULTS_STREAM_COLUMNS:
+            open(self.stream_path(stream), 'w').close()
+
+    def _check_chunk_size(self, chunk_size):
+        """
+        Check that the chunk size is a positive integer.
+
+        Parameters
+        ----------
+        chunk_size : `int`
+            The number of records buffered per stream.
+
+        Returns
+        -------
+        `int`
+            The number of records buffered per stream.
+        """
+        if chunk_size < 1:
+            raise ValueError(
+                "Results sink chunk size '%s' must be a positive "
+                "integer." % chunk_size
+            )
+        return int(chunk_size)
+
+    def stream_path(self, stream):
+        """
+        Obtain the full path of the results file of a stream.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+
+        Returns
+        -------
+        `str`
+            The full path of the results file.
+        """
+        return os.path.join(self.output_dir, '%s.%s' % (stream, self.extension))
+
+    def write(self, stream, record):
+        """
+        Buffer a single record of a results stream, writing the
+        buffered records once the chunk size is reached.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        record : `dict`
+            The record, keyed by the columns of the stream.
+        """
+        buffer = self.buffers[stream]
+        buffer.append(record)
+        if len(buffer) >= self.chunk_size:
+            self._flush_stream(stream)
+
+    def _flush_stream(self, stream):
+        """
+        Write the buffered records of a results stream.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        """
+        if self.buffers[stream]:
+            self._write_chunk(stream, self.buffers[stream])
+            self.buffers[stream] = []
+
+    def flush(self):
+        """
+        Write the buffered records of all results streams.
+        """
+        for stream in self.buffers:
+            self._flush_stream(stream)
+
+    def iter_frames(self, stream, chunksize=None):
+        """
+        Read a results stream back incrementally.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        chunksize : `int`, optional
+            The number of records per chunk, defaulting to the chunk size.
+
+        Yields
+        ------
+        `pd.DataFrame`
+            The records of each chunk, with the timestamps parsed as UTC.
+        """
+        self._flush_stream(stream)
+        date_column = RESULTS_STREAM_DATE_COLUMNS[stream]
+        for chunk_df in self._read_chunks(stream, chunksize or self.chunk_size):
+            chunk_df[date_column] = pd.to_datetime(chunk_df[date_column], utc=True)
+            yield chunk_df
+
+    def iter_equity_curve(self, start_dt=None, chunksize=None):
+        """
+        Read the streamed equity curve back incrementally, one chunk
+        at a time, optionally discarding equity prior to a timestamp.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`, optional
+            The timestamp prior to which the equity is discarded.
+        chunksize : `int`, optional
+            The number of records per chunk, defaulting to the chunk size.
+
+        Yields
+        ------
+        `pd.DataFrame`
+            The 'Equity' column of each chunk, indexed by the UTC
+            'Date' timestamps.
+        """
+        for chunk_df in self.iter_frames('equity_curve', chunksize=chunksize):
+            equity_df = chunk_df.set_index('Date')
+            if start_dt is not None:
+                equity_df = equity_df[equity_df.index >= start_dt]
+            if not equity_df.empty:
+                yield equity_df
+
+    def read_equity_curve(self, start_dt=None):
+        """
+        Read the streamed equity curve back in chunks.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`, optional
+            The timestamp prior to which the equity is discarded.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The 'Equity' column indexed by the UTC 'Date' timestamps.
+        """
+        return pd.concat(
+            list(self.iter_equity_curve(start_dt=start_dt)) or
+            [self._empty_frame('equity_curve').set_index('Date')]
+        )
+
+    @staticmethod
+    def _pivot_target_allocations(chunk_df):
+        """
+        Pivot target allocation records into a column per asset.
+
+        Parameters
+        ----------
+        chunk_df : `pd.DataFrame`
+            The 'Date', 'Asset' and 'Weight' records.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The weight of each asset column, in order of first
+            appearance, indexed by the UTC 'Date' timestamps.
+        """
+        alloc_df = chunk_df.pivot(index='Date', columns='Asset', values='Weight')
+        alloc_df.columns.name = None
+        return alloc_df[list(dict.fromkeys(chunk_df['Asset']))]
+
+    def iter_target_allocations(self, chunksize=None):
+        """
+        Read the streamed target allocations back incrementally, one
+        chunk at a time. The records of a rebalance split across two
+        chunks are held back until the rebalance is complete, such that
+        each rebalance is yielded whole.
+
+        Parameters
+        ----------
+        chunksize : `int`, optional
+            The number of records per chunk, defaulting to the chunk size.
+
+        Yields
+        ------
+        `pd.DataFrame`
+            The weight of each asset column of the rebalances of each
+            chunk, indexed by the UTC 'Date' timestamps.
+        """
+        pending_df = None
+        for chunk_df in self.iter_frames('target_allocations', chunksize=chunksize):
+            if pending_df is not None:
+                chunk_df = pd.concat([pending_df, chunk_df], ignore_index=True)
+            complete = chunk_df['Date'] != chunk_df['Date'].iloc[-1]
+            pending_df = chunk_df[~complete]
+            if complete.any():
+                yield self._pivot_target_allocations(chunk_df[complete])
+        if pending_df is not None:
+            yield self._pivot_target_allocations(pending_df)
+
+    def read_target_allocations(self):
+        """
+        Read the streamed target allocations back in chunks, with each
+        chunk pivoted into a column per asset prior to combining.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The weight of each asset column, in order of first
+            appearance, indexed by the UTC 'Date' timestamps.
+        """
+        alloc_dfs = list(self.iter_target_allocations())
+        if not alloc_dfs:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='Date', tz='UTC'))
+        assets = dict.fromkeys(
+            asset for alloc_df in alloc_dfs for asset in alloc_df.columns
+        )
+        return pd.concat(alloc_dfs)[list(assets)]
+
+    def read_portfolio_events(self, portfolio_id):
+        """
+        Read the streamed events of a portfolio back in chunks.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+
+        Yields
+        ------
+        `PortfolioEvent`
+            The portfolio events, in order of occurrence.
+        """
+        for chunk_df in self.iter_frames('portfolio_events'):
+            chunk_df = chunk_df[chunk_df['portfolio_id'] == portfolio_id]
+            for record in chunk_df.to_dict('records'):
+                yield PortfolioEvent(
+                    record['dt'], record['type'], record['description'],
+                    record['debit'], record['credit'], record['balance']
+                )
+
+    def _empty_frame(self, stream):
+        """
+        Create an empty DataFrame with the columns of a results stream.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The empty DataFrame.
+        """
+        empty_df = pd.DataFrame(columns=RESULTS_STREAM_COLUMNS[stream])
+        date_column = RESULTS_STREAM_DATE_COLUMNS[stream]
+        empty_df[date_column] = pd.to_datetime(empty_df[date_column], utc=True)
+        return empty_df
+
+    def close(self):
+        """
+        Write any remaining buffered records.
+        """
+        self.flush()
+
+    @abstractmethod
+    def _write_chunk(self, stream, records):
+        raise NotImplementedError(
+            "Should implement _write_chunk()"
+        )
+
+    @abstractmethod
+    def _read_chunks(self, stream, chunksize):
+        raise NotImplementedError(
+            "Should implement _read_chunks()"
+        )
+
+
+class CSVResultsSink(ResultsSink):
+    """
+    Streams the results of a backtest to a CSV file per results
+    stream, with floating point values written at full precision.
+
+    Parameters
+    ----------
+    output_dir : `str`
+        The directory in which the results files are written.
+    chunk_size : `int`, optional
+        The number of records buffered per stream prior to writing.
+    """
+
+    extension = 'csv'
+
+    def _write_chunk(self, stream, records):
+        """
+        Append a chunk of records to the CSV file of a results stream.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        records : `list[dict]`
+            The records to write.
+        """
+        path = self.stream_path(stream)
+        pd.DataFrame.from_records(
+            records, columns=RESULTS_STREAM_COLUMNS[stream]
+        ).to_csv(path, mode='a', header=os.path.getsize(path) == 0, index=False)
+
+    def _read_chunks(self, stream, chunksize):
+        """
+        Read the CSV file of a results stream in chunks.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        chunksize : `int`
+            The number of records per chunk.
+
+        Returns
+        -------
+        `iterator(pd.DataFrame)`
+            The records of each chunk.
+        """
+        path = self.stream_path(stream)
+        if os.path.getsize(path) == 0:
+            return iter([])
+        return pd.read_csv(
+            path,
+            chunksize=chunksize,
+            dtype={column: str for column in RESULTS_STREAM_STRING_COLUMNS[stream]},
+            float_precision='round_trip'
+        )
+
+
+class JSONLinesResultsSink(ResultsSink):
+    """
+    Streams the results of a backtest to a JSON-lines file per
+    results stream, with one JSON object per record.
+
+    Parameters
+    ----------
+    output_dir : `str`
+        The directory in which the results files are written.
+    chunk_size : `int`, optional
+        The number of records buffered per stream prior to writing.
+    """
+
+    extension = 'jsonl'
+
+    def _write_chunk(self, stream, records):
+        """
+        Append a chunk of records to the JSON-lines file of a
+        results stream, with timestamps written in ISO 8601 format.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        records : `list[dict]`
+            The records to write.
+        """
+        date_column = RESULTS_STREAM_DATE_COLUMNS[stream]
+        with open(self.stream_path(stream), 'a') as results_file:
+            for record in records:
+                record = dict(record)
+                record[date_column] = pd.Timestamp(record[date_column]).isoformat()
+                results_file.write(json.dumps(record) + '\n')
+
+    def _read_chunks(self, stream, chunksize):
+        """
+        Read the JSON-lines file of a results stream in chunks.
+
+        Parameters
+        ----------
+        stream : `str`
+            The results stream, e.g. 'equity_curve'.
+        chunksize : `int`
+            The number of records per chunk.
+
+        Yields
+        ------
+        `pd.DataFrame`
+            The records of each chunk.
+        """
+        columns = RESULTS_STREAM_COLUMNS[stream]
+        records = []
+        with open(self.stream_path(stream), 'r') as results_file:
+            for line in results_file:
+                records.append(json.loads(line))
+                if len(records) == chunksize:
+                    yield pd.DataFrame.from_records(records, columns=columns)
+                    records = []
+        if records:
+            yield pd.DataFrame.from_records(records, columns=columns)
+
+
+class StreamingEquityCurveRecorder(object):
+    """
+    Records the equity curve of a backtest to a results sink,
+    with the same interface as the EquityCurveRecorder.
+
+    Parameters
+    ----------
+    results_sink : `ResultsSink`
+        The results sink to stream the equity curve to.
+    """
+
+    def __init__(self, results_sink):
+        self.results_sink = results_sink
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for equity_df in self.results_sink.iter_equity_curve():
+            for dt, equity in zip(equity_df.index, equity_df['Equity']):
+                yield (dt, equity)
+
+    def record(self, dt, equity):
+        """
+        Record the total equity at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time at which the equity was obtained.
+        equity : `float`
+            The total equity.
+        """
+        self.results_sink.write('equity_curve', {'Date': dt, 'Equity': equity})
+        self.size += 1
+
+    def append(self, item):
+        """
+        Record a (timestamp, equity) tuple.
+
+        Parameters
+        ----------
+        item : `tuple(pd.Timestamp, float)`
+            The timestamp and total equity.
+        """
+        self.record(*item)
+
+    def to_frame(self):
+        """
+        Read the streamed equity curve back from the results sink.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The 'Equity' column indexed by the UTC 'Date' timestamps.
+        """
+        return self.results_sink.read_equity_curve()
+
+
+class StreamingTargetAllocationRecorder(object):
+    """
+    Records the target allocations of a backtest to a results sink,
+    with a record per asset weight, with the same interface as the
+    TargetAllocationRecorder.
+
+    Parameters
+    ----------
+    results_sink : `ResultsSink`
+        The results sink to stream the target allocations to.
+    """
+
+    def __init__(self, results_sink):
+        self.results_sink = results_sink
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def record(self, dt, weights):
+        """
+        Record the target weights of a rebalance.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The time of the rebalance.
+        weights : `dict{str: float}`
+            The target weight of each asset.
+        """
+        for asset, weight in weights.items():
+            self.results_sink.write(
+                'target_allocations',
+                {'Date': dt, 'Asset': asset, 'Weight': weight}
+            )
+        self.size += 1
+
+    def append(self, alloc_dict):
+        """
+        Record a {'Date': timestamp, asset: weight, ...} dictionary.
+
+        Parameters
+        ----------
+        alloc_dict : `dict`
+            The rebalance timestamp and target weight of each asset.
+        """
+        weights = dict(alloc_dict)
+        dt = weights.pop('Date')
+        self.record(dt, weights)
+
+    def to_frame(self):
+        """
+        Read the streamed target allocations back from the results sink.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The weight of each asset column, in order of first
+            appearance, indexed by the UTC 'Date' timestamps.
+        """
+        return self.results_sink.read_target_allocations()
+
+
+class StreamingPortfolioHistory(object):
+    """
+    Streams the PortfolioEvent history of a portfolio to a results
+    sink, in place of the list held by the Portfolio. Iterating over
+    the history reads the events back from the results sink.
+
+    Parameters
+    ----------
+    results_sink : `ResultsSink`
+        The results sink to stream the portfolio events to.
+    portfolio_id : `str`
+        The portfolio ID string.
+    events : `list[PortfolioEvent]`, optional
+        Any events already in the portfolio history.
+    """
+
+    def __init__(self, results_sink, portfolio_id, events=None):
+        self.results_sink = results_sink
+        self.portfolio_id = portfolio_id
+        self.size = 0
+        for event in events or []:
+            self.append(event)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return self.results_sink.read_portfolio_events(self.portfolio_id)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def append(self, event):
+        """
+        Stream a portfolio event to the results sink.
+
+        Parameters
+        ----------
+        event : `PortfolioEvent`
+            The portfolio event.
+        """
+        record = {'portfolio_id': self.portfolio_id}
+        record.update(event.to_dict())
+        self.results_sink.write('portfolio_events', record)
+        self.size += 1
@@ -28,15 +28,40 @@ class TearsheetStatistics(Statistics):
         self.title = title
         self.periods = periods
 
+    @classmethod
+    def from_results_sink(cls, results_sink, burn_in_dt=None, **kwargs):
+        """
+        Create the tearsheet from the equity curve streamed to a
+        results sink, which is read back in chunks.
+
+        Parameters
+        ----------
+        results_sink : `ResultsSink`
+            The results sink of the backtest.
+        burn_in_dt : `pd.Timestamp`, optional
+            The end of the burn-in period of the backtest, prior
+            to which the equity curve is discarded.
+        **kwargs
+            Any further keyword arguments of TearsheetStatistics.
+
+        Returns
+        -------
+        `TearsheetStatistics`
+            The tearsheet statistics instance.
+        """
+        strategy_equity = results_sink.read_equity_curve(start_dt=burn_in_dt)
+        strategy_equity.index = strategy_equity.index.date
+        return cls(strategy_equity, **kwargs)
+
     def get_results(self, equity_df):
         """
         Return a dict with all important results & stats.
         """
         # Returns
-        equity_df["returns"] = equity_df["Equity"].pct_change().fillna(0.0)
+        equity_df["returns"] = perf.create_returns(equity_df["Equity"])
 
         # Cummulative Returns
-        equity_df["cum_returns"] = np.exp(np.log(1 + equity_df["returns"]).cumsum())
+        equity_df["cum_returns"] = perf.create_cum_returns(equity_df["returns"])
 
         # Drawdown, max drawdown, max drawdown duration
         dd_s, max_dd, dd_dur = perf.create_drawdowns(equity_df["cum_returns"])
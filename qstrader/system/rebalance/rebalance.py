@@ -1,10 +1,19 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 
 class Rebalance(object):
     """
     Interface to a generic list of system logic and
     trade order rebalance timestamps.
+
+    Subclasses generate the `rebalances` list of timestamps. For
+    efficient checking of whether a timestamp is a rebalance, the
+    schedule is also exposed as a sorted int64 array of nanoseconds
+    since the UTC epoch along with a hashed set of the same values.
+    These are held per instance and (re)built whenever the `rebalances`
+    list is replaced or grows or shrinks in place.
     """
 
     __metaclass__ = ABCMeta
@@ -14,3 +23,58 @@ class Rebalance(object):
         raise NotImplementedError(
             "Should implement output_rebalances()"
         )
+
+    def _rebalance_schedule(self):
+        """
+        Obtain the hashed and sorted int64 rebalance schedule,
+        building it if the rebalance timestamps have changed.
+
+        Returns
+        -------
+        `tuple(frozenset[int], np.ndarray)`
+            The hashed and sorted rebalance nanosecond timestamps.
+        """
+        schedule = getattr(self, '_schedule', None)
+        if (
+            schedule is None or schedule[0] is not self.rebalances or
+            schedule[1] != len(self.rebalances)
+        ):
+            rebalance_nanos = np.unique(
+                np.array([ts.value for ts in self.rebalances], dtype=np.int64)
+            )
+            schedule = (
+                self.rebalances, len(self.rebalances),
+                frozenset(rebalance_nanos.tolist()), rebalance_nanos
+            )
+            self._schedule = schedule
+        return schedule[2], schedule[3]
+
+    @property
+    def rebalance_nanos(self):
+        """
+        Obtain the rebalance schedule as a sorted array of unique
+        int64 nanoseconds since the UTC epoch.
+
+        Returns
+        -------
+        `np.ndarray`
+            The sorted rebalance nanosecond timestamps.
+        """
+        return self._rebalance_schedule()[1]
+
+    def is_rebalance_event(self, dt):
+        """
+        Check, in constant time, whether the provided timestamp is
+        part of the rebalance schedule.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to check the rebalance schedule for.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the timestamp is part of the rebalance schedule.
+        """
+        return dt.value in self._rebalance_schedule()[0]
@@ -1,19 +1,29 @@
+import itertools
 import os
 
-import pandas as pd
-
 from qstrader.asset.equity import Equity
 from qstrader.broker.simulated_broker import SimulatedBroker
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader.data.backtest_data_handler import BacktestDataHandler
 from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
 from qstrader.exchange.simulated_exchange import SimulatedExchange
+from qstrader.statistics.recorder import (
+    EquityCurveRecorder, TargetAllocationRecorder
+)
+from qstrader.statistics.results_sink import (
+    StreamingEquityCurveRecorder,
+    StreamingPortfolioHistory,
+    StreamingTargetAllocationRecorder
+)
 from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
 from qstrader.system.qts import QuantTradingSystem
 from qstrader.system.rebalance.buy_and_hold import BuyAndHoldRebalance
 from qstrader.system.rebalance.daily import DailyRebalance
 from qstrader.system.rebalance.end_of_month import EndOfMonthRebalance
 from qstrader.system.rebalance.weekly import WeeklyRebalance
+from qstrader.trading.checkpoint import (
+    dump_checkpoint, load_checkpoint, loads_checkpoint, save_checkpoint
+)
 from qstrader.trading.trading_session import TradingSession
 from qstrader import settings
 
@@ -62,6 +72,30 @@ class BacktestTradingSession(TradingSession):
     burn_in_dt : `pd.Timestamp`, optional
         The optional date provided to begin tracking strategy statistics,
         which is used for strategies requiring a period of data 'burn in'
+    calendar : `TradingCalendar`, optional
+        The optional exchange trading calendar. If provided, no events are
+        generated on exchange holidays and any rebalance falling on a
+        holiday is moved to the previous trading day, or to the next
+        trading day if this would precede the start of the backtest.
+    sim_engine : `SimulationEngine`, optional
+        The optional simulation engine generating the events, such as an
+        IntradayBarSimulationEngine. Defaults to daily business day events.
+    fast_forward : `Boolean`, optional
+        Whether to skip the broker update on simulation events that
+        cannot change the backtest state, i.e. those without an order
+        execution, signal update, rebalance or equity curve update.
+        The results are identical to those without fast forwarding.
+    results_sink : `ResultsSink`, optional
+        The optional results sink to which the equity curve, target
+        allocations and portfolio events are streamed during the
+        simulation, rather than being held in memory.
+    columnar_positions : `Boolean`, optional
+        Whether to hold the portfolio positions in a columnar position
+        book, rather than as separate Position instances.
+    batch_execution : `Boolean`, optional
+        Whether the broker prices all pending orders of a timestamp,
+        and calculates their fees, in a single vectorised pass rather
+        than separately for each order.
     """
 
     def __init__(
@@ -81,6 +115,12 @@ class BacktestTradingSession(TradingSession):
         fee_model=ZeroFeeModel(),
         burn_in_dt=None,
         data_handler=None,
+        calendar=None,
+        sim_engine=None,
+        fast_forward=False,
+        results_sink=None,
+        columnar_positions=False,
+        batch_execution=False,
         **kwargs
     ):
         self.start_dt = start_dt
@@ -97,11 +137,16 @@ class BacktestTradingSession(TradingSession):
         self.long_only = long_only
         self.fee_model = fee_model
         self.burn_in_dt = burn_in_dt
+        self.calendar = calendar
+        self.fast_forward = fast_forward
+        self.results_sink = results_sink
+        self.columnar_positions = columnar_positions
+        self.batch_execution = batch_execution
 
         self.exchange = self._create_exchange()
         self.data_handler = self._create_data_handler(data_handler)
         self.broker = self._create_broker()
-        self.sim_engine = self._create_simulation_engine()
+        self.sim_engine = self._create_simulation_engine(sim_engine)
 
         if rebalance == 'weekly':
             if 'rebalance_weekday' in kwargs:
@@ -113,16 +158,19 @@ class BacktestTradingSession(TradingSession):
                     "keyword argument to the instantiation of "
                     "BacktestTradingSession, e.g. with 'WED'."
                 )
-        self.rebalance_schedule = self._create_rebalance_event_times()
+        self.rebalancer = self._create_rebalancer()
+        self.rebalance_schedule = self.rebalancer.rebalances
 
         self.qts = self._create_quant_trading_system(**kwargs)
-        self.equity_curve = []
-        self.target_allocations = []
+        self.equity_curve = self._create_equity_curve_recorder()
+        self.target_allocations = self._create_target_allocation_recorder()
+        self.events_processed = 0
+        self.last_event_dt = None
 
     def _is_rebalance_event(self, dt):
         """
         Checks if the provided timestamp is part of the rebalance
-        schedule of the backtest.
+        schedule of the backtest, via a constant time hashed lookup.
 
         Parameters
         ----------
@@ -134,7 +182,34 @@ class BacktestTradingSession(TradingSession):
         `Boolean`
             Whether the timestamp is part of the rebalance schedule.
         """
-        return dt in self.rebalance_schedule
+        return self.rebalancer.is_rebalance_event(dt)
+
+    def _is_actionable_event(self, event):
+        """
+        Checks whether the provided simulation event can change the
+        state of the backtest, and thus requires a broker update.
+
+        Parameters
+        ----------
+        event : `SimulationEvent`
+            The simulation event to check.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the simulation event is actionable.
+        """
+        dt = event.ts
+        past_burn_in = self.burn_in_dt is None or dt >= self.burn_in_dt
+        if event.event_type == "market_close":
+            if self.signals is not None or past_burn_in:
+                return True
+        if past_burn_in and self._is_rebalance_event(dt):
+            return True
+        return (
+            self.broker.has_open_orders() and
+            self.exchange.is_open_at_datetime(dt)
+        )
 
     def _create_exchange(self):
         """
@@ -146,7 +221,7 @@ class BacktestTradingSession(TradingSession):
         `SimulatedExchanage`
             The simulated exchange instance.
         """
-        return SimulatedExchange(self.start_dt)
+        return SimulatedExchange(self.start_dt, calendar=self.calendar)
 
     def _create_data_handler(self, data_handler):
         """
@@ -208,37 +283,54 @@ class BacktestTradingSession(TradingSession):
             self.data_handler,
             account_id=self.account_name,
             initial_funds=self.initial_cash,
-            fee_model=self.fee_model
+            fee_model=self.fee_model,
+            columnar_positions=self.columnar_positions,
+            batch_execution=self.batch_execution
         )
         broker.create_portfolio(self.portfolio_id, self.portfolio_name)
         broker.subscribe_funds_to_portfolio(self.portfolio_id, self.initial_cash)
+        if self.results_sink is not None:
+            portfolio = broker.portfolios[self.portfolio_id]
+            portfolio.history = StreamingPortfolioHistory(
+                self.results_sink, self.portfolio_id, events=portfolio.history
+            )
         return broker
 
-    def _create_simulation_engine(self):
+    def _create_simulation_engine(self, sim_engine=None):
         """
         Create a simulation engine instance to generate the events
         used for the quant trading algorithm to act upon.
 
-        TODO: Currently hardcoded to daily events
+        Defaults to daily business day events if no simulation
+        engine is provided.
+
+        Parameters
+        ----------
+        sim_engine : `SimulationEngine`, optional
+            An externally provided simulation engine, such as an
+            IntradayBarSimulationEngine.
 
         Returns
         -------
         `SimulationEngine`
             The simulation engine generating simulation timestamps.
         """
+        if sim_engine is not None:
+            return sim_engine
         return DailyBusinessDaySimulationEngine(
-            self.start_dt, self.end_dt, pre_market=False, post_market=False
+            self.start_dt, self.end_dt, pre_market=False, post_market=False,
+            calendar=self.calendar
         )
 
-    def _create_rebalance_event_times(self):
+    def _create_rebalancer(self):
         """
-        Creates the list of rebalance timestamps used to determine when
+        Creates the rebalance schedule used to determine when
         to execute the quant trading strategy throughout the backtest.
 
         Returns
         -------
-        `List[pd.Timestamp]`
-            The list of rebalance timestamps.
+        `Rebalance`
+            The rebalance schedule.
         """
         if self.rebalance == 'buy_and_hold':
             rebalancer = BuyAndHoldRebalance(self.start_dt)
@@ -256,7 +348,14 @@ class BacktestTradingSession(TradingSession):
             raise ValueError(
                 'Unknown rebalance frequency "%s" provided.' % self.rebalance
             )
-        return rebalancer.rebalances
+        if self.calendar is not None:
+            # Rebalances falling on exchange holidays are moved to the
+            # previous trading day, or the next trading day if this
+            # would precede the start of the backtest
+            rebalancer.rebalances = self.calendar.roll_to_trading_datetimes(
+                rebalancer.rebalances, self.start_dt, self.end_dt
+            )
+        return rebalancer
 
     def _create_quant_trading_system(self, **kwargs):
         """
@@ -312,6 +411,34 @@ class BacktestTradingSession(TradingSession):
 
         return qts
 
+    def _create_equity_curve_recorder(self):
+        """
+        Create the recorder of the equity curve, which streams to
+        the results sink if one is provided.
+
+        Returns
+        -------
+        `EquityCurveRecorder` or `StreamingEquityCurveRecorder`
+            The equity curve recorder.
+        """
+        if self.results_sink is None:
+            return EquityCurveRecorder()
+        return StreamingEquityCurveRecorder(self.results_sink)
+
+    def _create_target_allocation_recorder(self):
+        """
+        Create the recorder of the target allocations, which streams
+        to the results sink if one is provided.
+
+        Returns
+        -------
+        `TargetAllocationRecorder` or `StreamingTargetAllocationRecorder`
+            The target allocation recorder.
+        """
+        if self.results_sink is None:
+            return TargetAllocationRecorder()
+        return StreamingTargetAllocationRecorder(self.results_sink)
+
     def _update_equity_curve(self, dt):
         """
         Update the equity curve values.
@@ -321,8 +448,8 @@ class BacktestTradingSession(TradingSession):
         dt : `pd.Timestamp`
             The time at which the total account equity is obtained.
         """
-        self.equity_curve.append(
-            (dt, self.broker.get_account_total_equity()["master"])
+        self.equity_curve.record(
+            dt, self.broker.get_account_total_equity()["master"]
         )
 
     def output_holdings(self):
@@ -340,9 +467,7 @@ class BacktestTradingSession(TradingSession):
         `pd.DataFrame`
             The datetime-indexed equity curve of the strategy.
         """
-        equity_df = pd.DataFrame(
-            self.equity_curve, columns=['Date', 'Equity']
-        ).set_index('Date')
+        equity_df = self.equity_curve.to_frame()
         equity_df.index = equity_df.index.date
         return equity_df
 
@@ -358,35 +483,256 @@ class BacktestTradingSession(TradingSession):
             The datetime-indexed target allocations of the strategy.
         """
         equity_curve = self.get_equity_curve()
-        alloc_df = pd.DataFrame(self.target_allocations).set_index('Date')
+        alloc_df = self.target_allocations.to_frame()
         alloc_df.index = alloc_df.index.date
         alloc_df = alloc_df.reindex(index=equity_curve.index, method='ffill')
         if self.burn_in_dt is not None:
             alloc_df = alloc_df[self.burn_in_dt:]
         return alloc_df
 
-    def run(self, results=False):
+    def _check_no_results_sink(self):
+        """
+        Checks that the backtest is not streaming to a results sink, as
+        the streamed results cannot be checkpointed or resumed.
+        """
+        if self.results_sink is not None:
+            raise ValueError(
+                "Unable to checkpoint or resume a backtest streaming its "
+                "results to a results sink."
+            )
+
+    def _create_checkpoint_state(self, event_index, dt, stats):
+        """
+        Obtain the state required to resume the backtest after
+        the provided number of simulation events.
+
+        Parameters
+        ----------
+        event_index : `int`
+            The number of simulation events processed.
+        dt : `pd.Timestamp`
+            The timestamp of the last processed simulation event.
+        stats : `dict`
+            The statistics collected by the quant trading system.
+
+        Returns
+        -------
+        `dict`
+            The backtest checkpoint state.
+        """
+        self._check_no_results_sink()
+        return {
+            'event_index': event_index,
+            'dt': dt,
+            'broker': self.broker.get_checkpoint_state(),
+            'signals': (
+                None if self.signals is None
+                else self.signals.get_checkpoint_state()
+            ),
+            'equity_curve': self.equity_curve,
+            'target_allocations': stats['target_allocations']
+        }
+
+    def _restore_checkpoint_state(self, state, stats):
+        """
+        Restore the backtest from a previously obtained checkpoint state.
+
+        Parameters
+        ----------
+        state : `dict`
+            The backtest checkpoint state.
+        stats : `dict`
+            The statistics collected by the quant trading system.
+        """
+        self.broker.restore_checkpoint_state(state['broker'])
+        if self.signals is not None and state['signals'] is not None:
+            self.signals.restore_checkpoint_state(state['signals'])
+        self.equity_curve = state['equity_curve']
+        stats['target_allocations'] = state['target_allocations']
+
+    def save_checkpoint(self, checkpoint_path, event_index, dt, stats):
+        """
+        Write a checkpoint of the backtest to disk.
+
+        Parameters
+        ----------
+        checkpoint_path : `str`
+            The full path of the checkpoint file.
+        event_index : `int`
+            The number of simulation events processed.
+        dt : `pd.Timestamp`
+            The timestamp of the last processed simulation event.
+        stats : `dict`
+            The statistics collected by the quant trading system.
+        """
+        save_checkpoint(
+            self._create_checkpoint_state(event_index, dt, stats),
+            checkpoint_path
+        )
+        if settings.PRINT_EVENTS:
+            print("(%s) - checkpoint saved to %s" % (dt, checkpoint_path))
+
+    def create_snapshot(self):
+        """
+        Create an in-memory snapshot of the backtest state after the
+        simulation events processed so far, from which any number of
+        sessions with the same configuration can resume.
+
+        Returns
+        -------
+        `bytes`
+            The serialised backtest checkpoint state.
+        """
+        return dump_checkpoint(
+            self._create_checkpoint_state(
+                self.events_processed, self.last_event_dt,
+                {'target_allocations': self.target_allocations}
+            )
+        )
+
+    def create_burn_in_snapshot(self):
+        """
+        Simulate only the 'burn in' period of the backtest, updating
+        the signals and broker up until the burn in date, and create
+        an in-memory snapshot of the resulting state.
+
+        Strategy variants whose parameters only affect the trading
+        logic after the burn in date can then resume from the snapshot
+        via run(resume_from=...), rather than each simulating the
+        burn in period.
+
+        Returns
+        -------
+        `bytes`
+            The serialised backtest checkpoint state.
+        """
+        if self.burn_in_dt is None:
+            raise ValueError(
+                "Unable to create a burn in snapshot of a backtest "
+                "without a burn in date."
+            )
+        self.run(stop_dt=self.burn_in_dt)
+        return self.create_snapshot()
+
+    def _resume_from_checkpoint(self, resume_from, sim_events, stats):
+        """
+        Restore the backtest from a checkpoint and advance the
+        simulation events beyond those already processed.
+
+        Parameters
+        ----------
+        resume_from : `str` or `bytes`
+            The full path of the checkpoint file, or an in-memory snapshot.
+        sim_events : `iterator(SimulationEvent)`
+            The simulation events of the backtest.
+        stats : `dict`
+            The statistics collected by the quant trading system.
+
+        Returns
+        -------
+        `tuple(int, pd.Timestamp)`
+            The number of simulation events already processed and
+            the timestamp of the last of these.
+        """
+        if isinstance(resume_from, bytes):
+            state = loads_checkpoint(resume_from)
+            source = 'snapshot'
+        else:
+            state = load_checkpoint(resume_from)
+            source = "checkpoint '%s'" % resume_from
+
+        last_event = None
+        for last_event in itertools.islice(sim_events, state['event_index']):
+            pass
+        if state['event_index'] > 0 and (
+            last_event is None or last_event.ts != state['dt']
+        ):
+            raise ValueError(
+                "The %s taken at event %s (%s) does not match the "
+                "simulation events of this backtest. Cannot resume "
+                "the backtest." % (source, state['event_index'], state['dt'])
+            )
+        self._restore_checkpoint_state(state, stats)
+        if settings.PRINT_EVENTS:
+            print("(%s) - resumed from %s" % (state['dt'], source))
+        return state['event_index'], state['dt']
+
+    def run(
+        self,
+        results=False,
+        checkpoint_path=None,
+        checkpoint_every=None,
+        resume_from=None,
+        stop_dt=None
+    ):
         """
         Execute the simulation engine by iterating over all
         simulation events, rebalancing the quant trading
         system at the appropriate schedule.
 
+        Optionally writes checkpoints of the broker portfolios, open
+        orders, signal buffers, equity curve, target allocations and
+        simulation event position, from which a new session with
+        the same configuration can resume the backtest.
+
         Parameters
         ----------
         results : `Boolean`, optional
             Whether to output the current portfolio holdings
+        checkpoint_path : `str`, optional
+            The full path of the checkpoint file, which is overwritten
+            by each checkpoint and written at the end of the backtest.
+        checkpoint_every : `int`, optional
+            The number of simulation events between checkpoints. Defaults
+            to only writing the checkpoint at the end of the backtest.
+        resume_from : `str` or `bytes`, optional
+            The full path of a checkpoint file, or an in-memory snapshot,
+            to resume the backtest from.
+        stop_dt : `pd.Timestamp`, optional
+            The optional timestamp at which to stop the simulation, prior
+            to processing any event at or after it.
         """
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise ValueError(
+                "Checkpoint interval '%s' provided to the backtest must "
+                "be a positive number of events." % checkpoint_every
+            )
+        if checkpoint_path is not None:
+            self._check_no_results_sink()
+
         if settings.PRINT_EVENTS:
             print("Beginning backtest simulation...")
 
-        stats = {'target_allocations': []}
+        stats = {'target_allocations': self._create_target_allocation_recorder()}
+        skipped_dt = None
+        dt = None
+
+        sim_events = iter(self.sim_engine)
+        event_index = 0
+        if resume_from is not None:
+            self._check_no_results_sink()
+            event_index, dt = self._resume_from_checkpoint(
+                resume_from, sim_events, stats
+            )
+        checkpoint_index = event_index
+
+        for event in sim_events:
+            if stop_dt is not None and event.ts >= stop_dt:
+                break
 
-        for event in self.sim_engine:
             # Output the system event and timestamp
             dt = event.ts
+            event_index += 1
             if settings.PRINT_EVENTS:
                 print("(%s) - %s" % (event.ts, event.event_type))
 
+            # Skip the broker update for events that
+            # cannot change the backtest state
+            if self.fast_forward and not self._is_actionable_event(event):
+                skipped_dt = dt
+                continue
+            skipped_dt = None
+
             # Update the simulated broker
             self.broker.update(dt)
 
@@ -424,7 +770,26 @@ class BacktestTradingSession(TradingSession):
                 else:
                     self._update_equity_curve(dt)
 
+            # Periodically checkpoint the backtest
+            if (
+                checkpoint_path is not None and checkpoint_every is not None and
+                event_index - checkpoint_index >= checkpoint_every
+            ):
+                self.save_checkpoint(checkpoint_path, event_index, dt, stats)
+                checkpoint_index = event_index
+
+        # Ensure the broker is valued as of the final event
+        if skipped_dt is not None:
+            self.broker.update(skipped_dt)
+
+        if checkpoint_path is not None and event_index > checkpoint_index:
+            self.save_checkpoint(checkpoint_path, event_index, dt, stats)
+
+        self.events_processed = event_index
+        self.last_event_dt = dt
         self.target_allocations = stats['target_allocations']
+        if self.results_sink is not None:
+            self.results_sink.flush()
 
         # At the end of the simulation output the
         # portfolio holdings if desired
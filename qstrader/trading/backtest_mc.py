@@ -55,6 +55,8 @@ class BacktestTradingSession_MC(TradingSession):
         fee_model=ZeroFeeModel(),
         burn_in_dt=None,
         data_handler=None,
+        calendar=None,
+        sim_engine=None,
         **kwargs
     ):
         self.start_dt = start_dt
@@ -71,11 +73,12 @@ class BacktestTradingSession_MC(TradingSession):
         self.long_only = long_only
         self.fee_model = fee_model
         self.burn_in_dt = burn_in_dt
+        self.calendar = calendar
 
         self.exchange = self._create_exchange()
         self.data_handler = self._create_data_handler(data_handler)
         self.broker = self._create_broker()
-        self.sim_engine = self._create_simulation_engine()
+        self.sim_engine = self._create_simulation_engine(sim_engine)
 
         if rebalance == 'weekly':
             if 'rebalance_weekday' in kwargs:
@@ -87,17 +90,18 @@ class BacktestTradingSession_MC(TradingSession):
                     "keyword argument to the instantiation of "
                     "BacktestTradingSession, e.g. with 'WED'."
                 )
-        self.rebalance_schedule = self._create_rebalance_event_times()
+        self.rebalancer = self._create_rebalancer()
+        self.rebalance_schedule = self.rebalancer.rebalances
 
         self.qts = self._create_quant_trading_system(**kwargs)
         self.equity_curve = []
         self.target_allocations = []
 
     def _is_rebalance_event(self, dt):
-        return dt in self.rebalance_schedule
+        return self.rebalancer.is_rebalance_event(dt)
 
     def _create_exchange(self):
-        return SimulatedExchange(self.start_dt)
+        return SimulatedExchange(self.start_dt, calendar=self.calendar)
 
     def _create_data_handler(self, data_handler):
         
@@ -145,13 +149,15 @@ class BacktestTradingSession_MC(TradingSession):
         broker.subscribe_funds_to_portfolio(self.portfolio_id, self.initial_cash)
         return broker
 
-    def _create_simulation_engine(self):
-        
+    def _create_simulation_engine(self, sim_engine=None):
+        if sim_engine is not None:
+            return sim_engine
         return DailyBusinessDaySimulationEngine(
-            self.start_dt, self.end_dt, pre_market=False, post_market=False
+            self.start_dt, self.end_dt, pre_market=False, post_market=False,
+            calendar=self.calendar
         )
 
-    def _create_rebalance_event_times(self):
+    def _create_rebalancer(self):
         
         if self.rebalance == 'buy_and_hold':
             rebalancer = BuyAndHoldRebalance(self.start_dt)
@@ -169,7 +175,14 @@ class BacktestTradingSession_MC(TradingSession):
             raise ValueError(
                 'Unknown rebalance frequency "%s" provided.' % self.rebalance
             )
-        return rebalancer.rebalances
+        if self.calendar is not None:
+            # Rebalances falling on exchange holidays are moved to the
+            # previous trading day, or the next trading day if this
+            # would precede the start of the backtest
+            rebalancer.rebalances = self.calendar.roll_to_trading_datetimes(
+                rebalancer.rebalances, self.start_dt, self.end_dt
+            )
+        return rebalancer
 
     def _create_quant_trading_system(self, **kwargs):
 
@@ -0,0 +1,99 @@
+import os
+import pickle
+import tempfile
+
+
+# Incremented whenever the layout of the checkpoint state changes
+CHECKPOINT_VERSION = 2
+
+
+def dump_checkpoint(state):
+    """
+    Serialise a backtest checkpoint state into an in-memory snapshot.
+
+    Parameters
+    ----------
+    state : `dict`
+        The backtest checkpoint state.
+
+    Returns
+    -------
+    `bytes`
+        The serialised checkpoint.
+    """
+    return pickle.dumps(
+        {'version': CHECKPOINT_VERSION, 'state': state},
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def loads_checkpoint(snapshot):
+    """
+    Deserialise a backtest checkpoint state from an in-memory snapshot.
+    Each call produces an independent copy of the state.
+
+    Parameters
+    ----------
+    snapshot : `bytes`
+        The serialised checkpoint.
+
+    Returns
+    -------
+    `dict`
+        The backtest checkpoint state.
+    """
+    checkpoint = pickle.loads(snapshot)
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(
+            "Checkpoint has version '%s', which is incompatible with "
+            "the current checkpoint version '%s'." % (
+                checkpoint.get('version'), CHECKPOINT_VERSION
+            )
+        )
+    return checkpoint['state']
+
+
+def save_checkpoint(state, checkpoint_path):
+    """
+    Persist a backtest checkpoint state to disk.
+
+    The state is written to a temporary file within the same
+    directory and then atomically renamed into place, such that
+    a run terminated mid-write never leaves a corrupt checkpoint
+    behind in place of the previous one.
+
+    Parameters
+    ----------
+    state : `dict`
+        The backtest checkpoint state.
+    checkpoint_path : `str`
+        The full path of the checkpoint file.
+    """
+    checkpoint_dir = os.path.dirname(os.path.abspath(checkpoint_path))
+    fd, tmp_path = tempfile.mkstemp(dir=checkpoint_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(dump_checkpoint(state))
+        os.replace(tmp_path, checkpoint_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(checkpoint_path):
+    """
+    Load a backtest checkpoint state from disk.
+
+    Parameters
+    ----------
+    checkpoint_path : `str`
+        The full path of the checkpoint file.
+
+    Returns
+    -------
+    `dict`
+        The backtest checkpoint state.
+    """
+    with open(checkpoint_path, 'rb') as checkpoint_file:
+        return loads_checkpoint(checkpoint_file.read())
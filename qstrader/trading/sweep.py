@@ -0,0 +1,314 @@
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import multiprocessing
+
+import pandas as pd
+
+from qstrader import settings
+import qstrader.statistics.performance as perf
+
+
+# The parameter sweep instance used by each worker process,
+# set once via the pool initialiser
+_worker_sweep = None
+
+
+def _init_sweep_worker(sweep):
+    """
+    Store the parameter sweep within the worker process. When the
+    worker is forked this is inherited rather than pickled, so that
+    the loaded price arrays are shared with the parent process.
+
+    Parameters
+    ----------
+    sweep : `ParameterSweep`
+        The parameter sweep carrying out the parallel runs.
+    """
+    global _worker_sweep
+    _worker_sweep = sweep
+
+
+def _run_backtest_in_worker(run_id):
+    """
+    Carry out a single backtest of the sweep within a worker process.
+
+    Parameters
+    ----------
+    run_id : `int`
+        The index of the parameter combination to backtest.
+
+    Returns
+    -------
+    `tuple(int, pd.DataFrame)`
+        The run index and its equity curve.
+    """
+    return _worker_sweep._run_backtest(run_id)
+
+
+def expand_parameter_grid(param_grid):
+    """
+    Expand a parameter grid into the list of all combinations
+    of its parameter values.
+
+    Parameters
+    ----------
+    param_grid : `dict{str: list}` or `list[dict]`
+        The values of each parameter, or an explicit list of
+        parameter combinations.
+
+    Returns
+    -------
+    `list[dict]`
+        The parameter combinations, varying the last parameter fastest.
+    """
+    if isinstance(param_grid, dict):
+        names = list(param_grid.keys())
+        return [
+            dict(zip(names, values)) for values in itertools.product(
+                *(param_grid[name] for name in names)
+            )
+        ]
+    return [dict(params) for params in param_grid]
+
+
+def calculate_equity_statistics(equity_curve, periods=252):
+    """
+    Calculate the summary performance statistics of an equity curve.
+
+    Parameters
+    ----------
+    equity_curve : `pd.DataFrame`
+        The equity curve DataFrame with an 'Equity' column.
+    periods : `int`, optional
+        The number of periods per year used for annualisation.
+
+    Returns
+    -------
+    `dict`
+        The summary statistics.
+    """
+    returns = perf.create_returns(equity_curve['Equity'])
+    cum_returns = perf.create_cum_returns(returns)
+    dd_s, max_dd, dd_dur = perf.create_drawdowns(cum_returns)
+    return {
+        'final_equity': equity_curve['Equity'].iloc[-1],
+        'total_return': cum_returns.iloc[-1] - 1.0,
+        'cagr': perf.create_cagr(cum_returns, periods),
+        'annualised_vol': perf.create_annualised_vol(returns, periods),
+        'sharpe': perf.create_sharpe_ratio(returns, periods),
+        'sortino': perf.create_sortino_ratio(returns, periods),
+        'max_drawdown': max_dd,
+        'max_drawdown_duration': dd_dur
+    }
+
+
+class ParameterSweep(object):
+    """
+    Runs a BacktestTradingSession for every combination of a
+    parameter grid across a pool of worker processes, collecting
+    the equity curves and summary statistics into a single table.
+
+    The data handler is loaded once in the parent process. Where the
+    'fork' start method is available the worker processes inherit it
+    copy-on-write, so that the read-only price arrays are shared
+    rather than reloaded or copied for each backtest.
+
+    The session factory is called with the parameter combination and
+    the shared data handler, and must return a BacktestTradingSession
+    that has not yet been run. Any stateful components, such as
+    signals or alpha models, should be constructed by the factory.
+
+    Parameters
+    ----------
+    session_factory : `callable`
+        Creates the backtest trading session for a parameter combination.
+    param_grid : `dict{str: list}` or `list[dict]`
+        The values of each parameter, or an explicit list of
+        parameter combinations.
+    data_handler : `DataHandler`, optional
+        The data handler shared by all of the backtests.
+    workers : `int`, optional
+        The number of worker processes. Defaults to the number of CPUs,
+        while a single worker runs the backtests in the current process.
+    periods : `int`, optional
+        The number of periods per year used for annualising statistics.
+    share_burn_in : `Boolean`, optional
+        Whether to simulate the 'burn in' period once, using the first
+        parameter combination, with every backtest resuming from a
+        snapshot of the warmed up signals and broker. Only valid when
+        the parameters do not affect the signals or the burn in date.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        param_grid,
+        data_handler=None,
+        workers=None,
+        periods=252,
+        share_burn_in=False
+    ):
+        self.session_factory = session_factory
+        self.param_grid = expand_parameter_grid(param_grid)
+        self.data_handler = data_handler
+        self.workers = self._check_set_workers(workers)
+        self.periods = periods
+        self.share_burn_in = share_burn_in
+
+        self.burn_in_snapshot = None
+        self.equity_curves = {}
+        self.results = None
+
+    def _check_set_workers(self, workers):
+        """
+        Checks and sets the number of backtesting worker processes.
+
+        Parameters
+        ----------
+        workers : `int` or None
+            The number of worker processes, or None for one per CPU.
+
+        Returns
+        -------
+        `int`
+            The number of worker processes.
+        """
+        if workers is None:
+            return multiprocessing.cpu_count()
+        if workers < 1:
+            raise ValueError(
+                "Number of sweep workers '%s' provided to the parameter "
+                "sweep must be a positive integer." % workers
+            )
+        return int(workers)
+
+    def _run_backtest(self, run_id):
+        """
+        Create and run the backtest trading session of a single
+        parameter combination.
+
+        Parameters
+        ----------
+        run_id : `int`
+            The index of the parameter combination to backtest.
+
+        Returns
+        -------
+        `tuple(int, pd.DataFrame)`
+            The run index and its equity curve.
+        """
+        session = self.session_factory(
+            self.param_grid[run_id], self.data_handler
+        )
+        session.run(results=False, resume_from=self.burn_in_snapshot)
+        return run_id, session.get_equity_curve()
+
+    def _create_burn_in_snapshot(self):
+        """
+        Simulate the 'burn in' period of the first parameter
+        combination and snapshot the resulting state.
+
+        Returns
+        -------
+        `bytes`
+            The serialised backtest checkpoint state.
+        """
+        session = self.session_factory(self.param_grid[0], self.data_handler)
+        return session.create_burn_in_snapshot()
+
+    def _create_executor(self, num_runs):
+        """
+        Create the worker process pool, forking the workers from the
+        current process where the platform supports it.
+
+        Parameters
+        ----------
+        num_runs : `int`
+            The number of backtests to carry out.
+
+        Returns
+        -------
+        `ProcessPoolExecutor`
+            The worker process pool.
+        """
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+        else:
+            mp_context = None
+        return ProcessPoolExecutor(
+            max_workers=min(self.workers, num_runs),
+            mp_context=mp_context,
+            initializer=_init_sweep_worker,
+            initargs=(self,)
+        )
+
+    def _run_all_backtests(self):
+        """
+        Run the backtests of every parameter combination, fanning the
+        work out across the process pool if more than one worker
+        is requested.
+
+        Returns
+        -------
+        `iterator(tuple(int, pd.DataFrame))`
+            The run indices and equity curves, in parameter grid order.
+        """
+        run_ids = range(len(self.param_grid))
+        if self.workers == 1 or len(run_ids) < 2:
+            return map(self._run_backtest, run_ids)
+
+        with self._create_executor(len(run_ids)) as executor:
+            return list(executor.map(_run_backtest_in_worker, run_ids))
+
+    def run(self):
+        """
+        Carry out the backtests of all parameter combinations.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The results table, containing the parameters and summary
+            statistics of each backtest, indexed by run.
+        """
+        if settings.PRINT_EVENTS:
+            print(
+                "Running parameter sweep of %s backtests..." % len(self.param_grid)
+            )
+
+        # The snapshot is created prior to the workers being
+        # started, so that it is shared with each of them
+        if self.share_burn_in:
+            self.burn_in_snapshot = self._create_burn_in_snapshot()
+
+        rows = []
+        self.equity_curves = {}
+        for run_id, equity_curve in self._run_all_backtests():
+            self.equity_curves[run_id] = equity_curve
+            row = dict(self.param_grid[run_id])
+            row.update(calculate_equity_statistics(equity_curve, self.periods))
+            rows.append(row)
+        self.results = pd.DataFrame(
+            rows, index=pd.RangeIndex(len(rows), name='Run')
+        )
+
+        if settings.PRINT_EVENTS:
+            print("Parameter sweep complete.")
+        return self.results
+
+    def get_equity_curves(self):
+        """
+        Returns the equity curves of all backtests as a single
+        Pandas DataFrame with a column per run.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The date-indexed equity curves of the backtests.
+        """
+        return pd.concat(
+            [
+                self.equity_curves[run_id]['Equity'].rename(run_id)
+                for run_id in sorted(self.equity_curves)
+            ],
+            axis=1
+        )
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    A bounded, per-instance least recently used (LRU) cache.
+
+    Unlike a method decorated with `functools.lru_cache`, which is
+    shared by all instances of a class and keeps each instance alive,
+    an LRUCache is owned by a single object and is discarded along
+    with it. Hit, miss and eviction counts are tracked in order to
+    tune the capacity.
+
+    Parameters
+    ----------
+    capacity : `int`
+        The maximum number of entries held. A capacity of zero
+        disables caching entirely.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = self._check_capacity(capacity)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _check_capacity(self, capacity):
+        """
+        Check that the capacity is a non-negative integer.
+
+        Parameters
+        ----------
+        capacity : `int`
+            The maximum number of entries held.
+
+        Returns
+        -------
+        `int`
+            The maximum number of entries held.
+        """
+        if capacity < 0:
+            raise ValueError(
+                "LRU cache capacity '%s' must be a non-negative "
+                "integer." % capacity
+            )
+        return int(capacity)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Obtain a cached value, marking it as the most recently used.
+
+        Parameters
+        ----------
+        key : `hashable`
+            The cache key.
+        default : `object`, optional
+            The value returned if the key is not cached.
+
+        Returns
+        -------
+        `object`
+            The cached value, or the default on a miss.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Cache a value, evicting the least recently used entry if the
+        capacity is exceeded.
+
+        Parameters
+        ----------
+        key : `hashable`
+            The cache key.
+        value : `object`
+            The value to cache.
+        """
+        if self.capacity == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all cached entries and reset the statistics.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        """
+        Obtain the cache usage statistics.
+
+        Returns
+        -------
+        `dict`
+            The hits, misses, evictions, current size and capacity.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'capacity': self.capacity
+        }
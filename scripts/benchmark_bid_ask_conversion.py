@@ -0,0 +1,124 @@
+import time
+
+import click
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.data.daily_bar_csv import convert_bar_frame_into_bid_ask_df
+
+
+def legacy_convert_bar_frame_into_bid_ask_df(bar_df, adjust_prices):
+    """
+    The previous unstack-based open/close timeline construction,
+    retained here solely as the benchmark baseline.
+
+    Parameters
+    ----------
+    bar_df : `pd.DataFrame`
+        The daily 'bar' OHLCV DataFrame.
+    adjust_prices : `Boolean`
+        Whether to adjust the open/close prices for corporate actions.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The individually-timestamped open/closing prices.
+    """
+    bar_df = bar_df.sort_index()
+    if adjust_prices:
+        oc_df = bar_df.loc[:, ['Open', 'Close', 'Adj Close']]
+        oc_df['Adj Open'] = (oc_df['Adj Close'] / oc_df['Close']) * oc_df['Open']
+        oc_df = oc_df.loc[:, ['Adj Open', 'Adj Close']]
+        oc_df.columns = ['Open', 'Close']
+    else:
+        oc_df = bar_df.loc[:, ['Open', 'Close']]
+
+    seq_oc_df = oc_df.T.unstack(level=0).reset_index()
+    seq_oc_df.columns = ['Date', 'Market', 'Price']
+    seq_oc_df.loc[seq_oc_df['Market'] == 'Open', 'Date'] += pd.Timedelta(hours=14, minutes=30)
+    seq_oc_df.loc[seq_oc_df['Market'] == 'Close', 'Date'] += pd.Timedelta(hours=21, minutes=00)
+
+    dp_df = seq_oc_df[['Date', 'Price']].copy()
+    dp_df['Bid'] = dp_df['Price']
+    dp_df['Ask'] = dp_df['Price']
+    dp_df = dp_df.loc[:, ['Date', 'Bid', 'Ask']].fillna(method='ffill').set_index('Date').sort_index()
+    return dp_df
+
+
+def generate_bar_frame(dates, rng):
+    """
+    Generate a synthetic daily bar DataFrame following a
+    geometric random walk, with occasional missing prices.
+
+    Parameters
+    ----------
+    dates : `pd.DatetimeIndex`
+        The (UTC) business days of the bars.
+    rng : `np.random.Generator`
+        The random number generator.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The synthetic daily bar DataFrame.
+    """
+    num_bars = len(dates)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, num_bars)))
+    opens = closes * np.exp(rng.normal(0.0, 0.005, num_bars))
+    closes[rng.random(num_bars) < 0.001] = np.nan
+    return pd.DataFrame(
+        {
+            'Open': opens,
+            'Close': closes,
+            'Adj Close': closes * 0.95
+        },
+        index=pd.Index(dates, name='Date')
+    )
+
+
+@click.command()
+@click.option('--years', 'years', default=30, help='Number of years of daily bars per symbol')
+@click.option('--symbols', 'symbols', default=5000, help='Number of symbols to convert')
+@click.option('--seed', 'seed', default=42, help='Random seed for the synthetic prices')
+def cli(years, symbols, seed):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(
+        end='2020-12-31', periods=years * 252, tz=pytz.UTC
+    )
+    bar_df = generate_bar_frame(dates, rng)
+
+    # Ensure both paths produce identical results prior to timing
+    pd.testing.assert_frame_equal(
+        convert_bar_frame_into_bid_ask_df(bar_df, True),
+        legacy_convert_bar_frame_into_bid_ask_df(bar_df, True)
+    )
+
+    print(
+        "Converting %s symbols of %s daily bars (%s years)..." % (
+            symbols, len(dates), years
+        )
+    )
+    timings = {}
+    for name, convert in (
+        ('unstack (legacy)', legacy_convert_bar_frame_into_bid_ask_df),
+        ('interleaved', convert_bar_frame_into_bid_ask_df)
+    ):
+        start = time.perf_counter()
+        for _ in range(symbols):
+            convert(bar_df, True)
+        timings[name] = time.perf_counter() - start
+        print(
+            "%s: %0.2fs total, %0.3fms per symbol" % (
+                name, timings[name], 1000.0 * timings[name] / symbols
+            )
+        )
+    print(
+        "Speedup: %0.1fx" % (
+            timings['unstack (legacy)'] / timings['interleaved']
+        )
+    )
+
+
+if __name__ == "__main__":
+    cli()
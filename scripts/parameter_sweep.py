@@ -0,0 +1,127 @@
+import ast
+import importlib
+import os
+import sys
+
+import click
+
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.trading.sweep import ParameterSweep
+
+
+def obtain_session_factory(factory):
+    """
+    Imports the session factory from the provided command-line
+    'module:function' string.
+
+    Parameters
+    ----------
+    factory : `str`
+        The session factory import string, i.e. "my_strategy:create_session".
+
+    Returns
+    -------
+    `callable`
+        The session factory.
+    """
+    try:
+        module_name, func_name = factory.split(':')
+        return getattr(importlib.import_module(module_name), func_name)
+    except Exception:
+        print(
+            "Could not import the session factory from the provided "
+            "factory string. Terminating."
+        )
+        sys.exit()
+
+
+def parse_parameter_value(value):
+    """
+    Converts a command-line parameter value into a Python literal,
+    falling back to the raw string.
+
+    Parameters
+    ----------
+    value : `str`
+        The parameter value string.
+
+    Returns
+    -------
+    `object`
+        The parameter value.
+    """
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def obtain_parameter_grid(params):
+    """
+    Converts the provided command-line parameter strings
+    into a parameter grid dictionary.
+
+    Parameters
+    ----------
+    params : `list[str]`
+        The parameter strings, i.e. ["lookback=63,126", "top_n=2,3"].
+
+    Returns
+    -------
+    `dict{str: list}`
+        The parameter grid dictionary.
+    """
+    param_grid = {}
+    try:
+        for param in params:
+            name, values = param.split('=')
+            param_grid[name.strip()] = [
+                parse_parameter_value(value.strip()) for value in values.split(',')
+            ]
+    except Exception:
+        print(
+            "Could not determine the parameter grid from the provided "
+            "parameter strings. Terminating."
+        )
+        sys.exit()
+    else:
+        return param_grid
+
+
+@click.command()
+@click.option('--factory', 'factory', required=True, help='Session factory, i.e. "my_strategy:create_session"')
+@click.option('--param', 'params', multiple=True, help='Parameter values, i.e. "lookback=63,126" (repeatable)')
+@click.option('--symbols', 'symbols', default=None, help='Symbols to load, i.e. "SPY,AGG" (defaults to all CSVs)')
+@click.option('--workers', 'workers', default=None, type=int, help='Number of worker processes (defaults to one per CPU)')
+@click.option('--output', 'output', default='sweep_results.csv', help='Results table CSV filename')
+@click.option('--equity-output', 'equity_output', default=None, help='Optional equity curves CSV filename')
+@click.option('--share-burn-in/--no-share-burn-in', 'share_burn_in', default=False, help='Simulate the burn in period once and share it across all backtests')
+def cli(factory, params, symbols, workers, output, equity_output, share_burn_in):
+    csv_dir = os.environ.get('QSTRADER_CSV_DATA_DIR', '.')
+
+    session_factory = obtain_session_factory(factory)
+    param_grid = obtain_parameter_grid(params)
+
+    # Load the CSV data once, to be shared by every backtest
+    csv_symbols = None if symbols is None else symbols.split(',')
+    data_source = CSVDailyBarDataSource(csv_dir, Equity, csv_symbols=csv_symbols)
+    universe = StaticUniverse(data_source.asset_symbols)
+    data_handler = BacktestDataHandler(universe, data_sources=[data_source])
+
+    sweep = ParameterSweep(
+        session_factory, param_grid, data_handler=data_handler,
+        workers=workers, share_burn_in=share_burn_in
+    )
+    results = sweep.run()
+    results.to_csv(output)
+    print(results.to_string())
+
+    if equity_output is not None:
+        sweep.get_equity_curves().to_csv(equity_output)
+
+
+if __name__ == "__main__":
+    cli()
@@ -9,6 +9,12 @@ import pytest
 
 from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
 from qstrader.asset.universe.static import StaticUniverse
+from qstrader.asset.equity import Equity
+from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.exchange.calendar.rules import NYSETradingCalendar
+from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
 from qstrader.trading.backtest import BacktestTradingSession
 
 
@@ -133,3 +139,107 @@ def test_backtest_long_short_leveraged(etf_filepath):
 
     pd.testing.assert_frame_equal(history_df, expected_df)
     assert portfolio_dict == expected_dict
+
+
+def run_identity_backtest(etf_filepath, session_kwargs, data_source_kwargs):
+    """
+    Run a weekly rebalanced long/short leveraged backtest with fees
+    and a burn-in period, returning the results compared by the
+    identity tests below.
+    """
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    alpha_model = FixedSignalsAlphaModel({'EQ:ABC': 1.0, 'EQ:DEF': -0.7})
+    start_dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+    data_source = CSVDailyBarDataSource(
+        etf_filepath, Equity, **data_source_kwargs
+    )
+
+    backtest = BacktestTradingSession(
+        start_dt,
+        end_dt,
+        universe,
+        alpha_model,
+        rebalance='weekly',
+        rebalance_weekday='WED',
+        long_only=False,
+        gross_leverage=2.0,
+        fee_model=PercentFeeModel(commission_pct=0.001, tax_pct=0.005),
+        burn_in_dt=pd.Timestamp('2019-01-08 00:00:00', tz=pytz.UTC),
+        data_handler=BacktestDataHandler(universe, data_sources=[data_source]),
+        sim_engine=DailyBusinessDaySimulationEngine(start_dt, end_dt),
+        **session_kwargs
+    )
+    backtest.run(results=False)
+    portfolio = backtest.broker.portfolios['000001']
+    return (
+        backtest.get_equity_curve(),
+        portfolio.history_to_df(),
+        portfolio.portfolio_to_dict(),
+        portfolio.total_pnl
+    )
+
+
+@pytest.mark.parametrize(
+    'session_kwargs,data_source_kwargs',
+    [
+        ({'fast_forward': True}, {}),
+        ({'columnar_positions': True}, {}),
+        ({'batch_execution': True}, {}),
+        ({'batch_execution': True}, {'lazy': True, 'max_resident_symbols': 1})
+    ]
+)
+def test_backtest_options_identical(
+    etf_filepath, session_kwargs, data_source_kwargs
+):
+    """
+    Ensures that each performance option produces identical results
+    to the default backtest, namely fast forwarding past
+    non-actionable events, holding the positions in a columnar
+    position book, filling the orders of each rebalance in a single
+    batch and lazily loading the price data with fewer symbols
+    resident at once than are traded.
+    """
+    expected = run_identity_backtest(etf_filepath, {}, {})
+    actual = run_identity_backtest(
+        etf_filepath, session_kwargs, data_source_kwargs
+    )
+
+    pd.testing.assert_frame_equal(actual[0], expected[0])
+    pd.testing.assert_frame_equal(actual[1], expected[1])
+    assert actual[2] == expected[2]
+    assert actual[3] == expected[3]
+
+
+def test_backtest_buy_and_hold_holiday_start(etf_filepath):
+    """
+    Ensures that a buy and hold backtest starting on an exchange
+    holiday rebalances on the next trading day, rather than on
+    the previous trading day prior to the start of the backtest.
+    """
+    os.environ['QSTRADER_CSV_DATA_DIR'] = etf_filepath
+
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    alpha_model = FixedSignalsAlphaModel({'EQ:ABC': 0.6, 'EQ:DEF': 0.4})
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+
+    backtest = BacktestTradingSession(
+        start_dt,
+        end_dt,
+        universe,
+        alpha_model,
+        rebalance='buy_and_hold',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        calendar=NYSETradingCalendar()
+    )
+    assert backtest.rebalance_schedule == [
+        pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    ]
+    backtest.run(results=False)
+
+    portfolio = backtest.broker.portfolios['000001']
+    assert sorted(portfolio.portfolio_to_dict().keys()) == ['EQ:ABC', 'EQ:DEF']
+    equity = backtest.get_equity_curve()['Equity']
+    assert equity.nunique() > 1
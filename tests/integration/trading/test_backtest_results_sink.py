@@ -0,0 +1,84 @@
+import os
+
+import pandas as pd
+import pytz
+import pytest
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.statistics.json_statistics import JSONStatistics
+from qstrader.statistics.results_sink import (
+    CSVResultsSink, JSONLinesResultsSink
+)
+from qstrader.trading.backtest import BacktestTradingSession
+
+
+def create_backtest(etf_filepath, results_sink=None):
+    """
+    Create a weekly rebalanced fixed weight backtest,
+    optionally streaming its results to a results sink.
+    """
+    os.environ['QSTRADER_CSV_DATA_DIR'] = etf_filepath
+    return BacktestTradingSession(
+        pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC),
+        pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC),
+        StaticUniverse(['EQ:ABC', 'EQ:DEF']),
+        FixedSignalsAlphaModel({'EQ:ABC': 0.6, 'EQ:DEF': 0.4}),
+        portfolio_id='000001',
+        rebalance='weekly',
+        rebalance_weekday='WED',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        results_sink=results_sink
+    )
+
+
+@pytest.mark.parametrize('sink_class', [CSVResultsSink, JSONLinesResultsSink])
+def test_backtest_results_sink(etf_filepath, tmp_path, sink_class):
+    """
+    Checks that a backtest streaming its results to a results sink
+    produces identical results to one holding them in memory.
+    """
+    expected = create_backtest(etf_filepath)
+    expected.run(results=False)
+
+    results_sink = sink_class(str(tmp_path / 'results'), chunk_size=3)
+    backtest = create_backtest(etf_filepath, results_sink=results_sink)
+    backtest.run(results=False)
+
+    pd.testing.assert_frame_equal(
+        backtest.get_equity_curve(), expected.get_equity_curve()
+    )
+    pd.testing.assert_frame_equal(
+        backtest.get_target_allocations(), expected.get_target_allocations()
+    )
+    portfolio = backtest.broker.portfolios['000001']
+    expected_portfolio = expected.broker.portfolios['000001']
+    assert portfolio.history == expected_portfolio.history
+    pd.testing.assert_frame_equal(
+        portfolio.history_to_df(), expected_portfolio.history_to_df()
+    )
+
+    expected_stats = JSONStatistics(
+        expected.get_equity_curve(),
+        expected.get_target_allocations(),
+        output_filename=str(tmp_path / 'expected.json')
+    )
+    stats = JSONStatistics.from_results_sink(
+        results_sink, output_filename=str(tmp_path / 'statistics.json')
+    )
+    assert stats.statistics == expected_stats.statistics
+
+
+def test_backtest_results_sink_checkpoint(etf_filepath, tmp_path):
+    """
+    Checks that a backtest streaming its results to a
+    results sink cannot be checkpointed.
+    """
+    backtest = create_backtest(
+        etf_filepath, results_sink=CSVResultsSink(str(tmp_path / 'results'))
+    )
+    with pytest.raises(ValueError):
+        backtest.run(
+            results=False, checkpoint_path=str(tmp_path / 'backtest.ckpt')
+        )
@@ -0,0 +1,160 @@
+import os
+
+import pandas as pd
+import pytz
+import pytest
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.trading.backtest import BacktestTradingSession
+
+
+START_DT = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+END_DT = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+
+
+class FailingSimulationEngine(object):
+    """
+    Generates the daily business day events, failing
+    after the provided number of events.
+    """
+
+    def __init__(self, fail_after):
+        self.sim_engine = DailyBusinessDaySimulationEngine(
+            START_DT, END_DT, pre_market=False, post_market=False
+        )
+        self.fail_after = fail_after
+
+    def __iter__(self):
+        for event_index, event in enumerate(self.sim_engine):
+            if event_index == self.fail_after:
+                raise RuntimeError("Simulated failure")
+            yield event
+
+
+def create_backtest(
+    etf_filepath, sim_engine=None, burn_in_dt=None, abc_weight=0.6
+):
+    """
+    Create a weekly rebalanced fixed weight backtest
+    with a momentum signal.
+    """
+    os.environ['QSTRADER_CSV_DATA_DIR'] = etf_filepath
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = StaticUniverse(assets)
+    backtest = BacktestTradingSession(
+        START_DT,
+        END_DT,
+        universe,
+        FixedSignalsAlphaModel(
+            {'EQ:ABC': abc_weight, 'EQ:DEF': 1.0 - abc_weight}
+        ),
+        portfolio_id='000001',
+        rebalance='weekly',
+        rebalance_weekday='WED',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        burn_in_dt=burn_in_dt,
+        sim_engine=sim_engine
+    )
+    momentum = MomentumSignal(START_DT, universe, lookbacks=[5])
+    backtest.signals = SignalsCollection(
+        {'momentum': momentum}, backtest.data_handler
+    )
+    return backtest
+
+
+def assert_backtests_equal(backtest, expected):
+    """
+    Checks that two run backtests have identical state and results.
+    """
+    portfolio = backtest.broker.portfolios['000001']
+    expected_portfolio = expected.broker.portfolios['000001']
+    assert portfolio.portfolio_to_dict() == expected_portfolio.portfolio_to_dict()
+    assert portfolio.cash == expected_portfolio.cash
+    assert portfolio.history == expected_portfolio.history
+    pd.testing.assert_frame_equal(
+        backtest.get_equity_curve(), expected.get_equity_curve()
+    )
+    pd.testing.assert_frame_equal(
+        backtest.get_target_allocations(), expected.get_target_allocations()
+    )
+    assert backtest.signals.warmup == expected.signals.warmup
+    assert backtest.signals['momentum']('EQ:ABC', 5) == expected.signals['momentum']('EQ:ABC', 5)
+
+
+@pytest.mark.parametrize('fail_after', [12, 21, 40])
+def test_resume_from_checkpoint(etf_filepath, tmp_path, fail_after):
+    """
+    Checks that a backtest failing part way through can be resumed
+    from its latest periodic checkpoint by a new session, producing
+    identical results to an uninterrupted backtest.
+    """
+    checkpoint_path = str(tmp_path / 'backtest.ckpt')
+
+    expected = create_backtest(etf_filepath)
+    expected.run()
+
+    failing = create_backtest(
+        etf_filepath, sim_engine=FailingSimulationEngine(fail_after)
+    )
+    with pytest.raises(RuntimeError):
+        failing.run(checkpoint_path=checkpoint_path, checkpoint_every=8)
+
+    resumed = create_backtest(etf_filepath)
+    resumed.run(resume_from=checkpoint_path)
+    assert_backtests_equal(resumed, expected)
+
+
+def test_resume_from_checkpoint_mismatched_events(etf_filepath, tmp_path):
+    """
+    Checks that resuming from a checkpoint taken with differing
+    simulation events raises a ValueError.
+    """
+    checkpoint_path = str(tmp_path / 'backtest.ckpt')
+    create_backtest(etf_filepath).run(checkpoint_path=checkpoint_path)
+
+    shorter = create_backtest(
+        etf_filepath,
+        sim_engine=DailyBusinessDaySimulationEngine(
+            START_DT, pd.Timestamp('2019-01-15 23:59:00', tz=pytz.UTC),
+            pre_market=False, post_market=False
+        )
+    )
+    with pytest.raises(ValueError):
+        shorter.run(resume_from=checkpoint_path)
+
+
+def test_resume_from_burn_in_snapshot(etf_filepath):
+    """
+    Checks that strategy variants resuming from a shared burn in
+    snapshot produce identical results to separately run backtests.
+    """
+    burn_in_dt = pd.Timestamp('2019-01-14 14:30:00', tz=pytz.UTC)
+    warmup = create_backtest(etf_filepath, burn_in_dt=burn_in_dt)
+    snapshot = warmup.create_burn_in_snapshot()
+    assert len(warmup.equity_curve) == 0
+    assert warmup.last_event_dt < burn_in_dt
+
+    for abc_weight in (0.3, 0.6, 0.9):
+        expected = create_backtest(
+            etf_filepath, burn_in_dt=burn_in_dt, abc_weight=abc_weight
+        )
+        expected.run()
+        variant = create_backtest(
+            etf_filepath, burn_in_dt=burn_in_dt, abc_weight=abc_weight
+        )
+        variant.run(resume_from=snapshot)
+        assert_backtests_equal(variant, expected)
+
+
+def test_create_burn_in_snapshot_without_burn_in(etf_filepath):
+    """
+    Checks that a burn in snapshot cannot be created
+    without a burn in date.
+    """
+    with pytest.raises(ValueError):
+        create_backtest(etf_filepath).create_burn_in_snapshot()
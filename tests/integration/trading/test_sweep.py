@@ -0,0 +1,151 @@
+import pandas as pd
+import pytz
+import pytest
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.trading.backtest import BacktestTradingSession
+from qstrader.statistics.json_statistics import JSONStatistics
+from qstrader.trading.sweep import (
+    ParameterSweep, calculate_equity_statistics, expand_parameter_grid
+)
+
+
+ASSETS = ['EQ:ABC', 'EQ:DEF']
+
+
+def create_session(params, data_handler):
+    """
+    Create a weekly rebalanced fixed weight backtest
+    for the provided parameters.
+    """
+    burn_in_dt = params.get('burn_in_dt')
+    if burn_in_dt is not None:
+        burn_in_dt = pd.Timestamp(burn_in_dt, tz=pytz.UTC)
+    alpha_model = FixedSignalsAlphaModel(
+        {'EQ:ABC': params['weight'], 'EQ:DEF': 1.0 - params['weight']}
+    )
+    return BacktestTradingSession(
+        pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC),
+        pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC),
+        StaticUniverse(ASSETS),
+        alpha_model,
+        rebalance='weekly',
+        rebalance_weekday=params['weekday'],
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        burn_in_dt=burn_in_dt,
+        data_handler=data_handler
+    )
+
+
+@pytest.mark.parametrize(
+    'param_grid,expected',
+    [
+        (
+            {'a': [1, 2], 'b': ['x', 'y']},
+            [
+                {'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'},
+                {'a': 2, 'b': 'x'}, {'a': 2, 'b': 'y'}
+            ]
+        ),
+        ([{'a': 1}, {'a': 3}], [{'a': 1}, {'a': 3}])
+    ]
+)
+def test_expand_parameter_grid(param_grid, expected):
+    """
+    Checks that a parameter grid is expanded into
+    all of its parameter combinations.
+    """
+    assert expand_parameter_grid(param_grid) == expected
+
+
+def test_equity_statistics_match_json_statistics(tmp_path):
+    """
+    Checks that the summary statistics of a sweep agree with
+    those of the JSON statistics for the same equity curve.
+    """
+    dates = pd.date_range('2020-01-01', periods=6, freq='B')
+    equity_curve = pd.DataFrame(
+        {'Equity': [100.0, 102.0, 99.0, 101.0, 97.0, 104.0]}, index=dates
+    )
+    stats = calculate_equity_statistics(equity_curve.copy(), periods=252)
+    expected = JSONStatistics(
+        equity_curve.copy(), pd.DataFrame(index=dates), periods=252,
+        output_filename=str(tmp_path / 'statistics.json')
+    ).statistics['strategy']
+
+    for key in (
+        'cagr', 'annualised_vol', 'sharpe', 'sortino',
+        'max_drawdown', 'max_drawdown_duration'
+    ):
+        assert stats[key] == expected[key]
+    assert stats['final_equity'] == 104.0
+    assert stats['total_return'] == pytest.approx(0.04)
+
+
+def test_parameter_sweep_parallel_matches_serial(etf_filepath):
+    """
+    Checks that a parameter sweep across worker processes produces
+    identical results to the same sweep in the current process,
+    along with the results and equity curves of each separate run.
+    """
+    data_source = CSVDailyBarDataSource(etf_filepath, Equity)
+    data_handler = BacktestDataHandler(
+        StaticUniverse(ASSETS), data_sources=[data_source]
+    )
+    param_grid = {'weight': [0.4, 0.6], 'weekday': ['MON', 'WED']}
+
+    serial = ParameterSweep(
+        create_session, param_grid, data_handler=data_handler, workers=1
+    )
+    serial_results = serial.run()
+    parallel = ParameterSweep(
+        create_session, param_grid, data_handler=data_handler, workers=2
+    )
+    parallel_results = parallel.run()
+
+    pd.testing.assert_frame_equal(serial_results, parallel_results)
+    pd.testing.assert_frame_equal(
+        serial.get_equity_curves(), parallel.get_equity_curves()
+    )
+    assert list(serial_results['weight']) == [0.4, 0.4, 0.6, 0.6]
+    assert list(serial_results['weekday']) == ['MON', 'WED', 'MON', 'WED']
+    assert list(serial.get_equity_curves().columns) == [0, 1, 2, 3]
+
+    backtest = create_session({'weight': 0.6, 'weekday': 'WED'}, data_handler)
+    backtest.run()
+    equity_curve = backtest.get_equity_curve()
+    pd.testing.assert_series_equal(
+        serial.get_equity_curves()[3], equity_curve['Equity'].rename(3)
+    )
+    assert serial_results.loc[3, 'final_equity'] == equity_curve['Equity'].iloc[-1]
+
+
+def test_parameter_sweep_shared_burn_in(etf_filepath):
+    """
+    Checks that a parameter sweep resuming every backtest from a
+    shared burn in snapshot matches the sweep simulating the burn
+    in period within each backtest.
+    """
+    data_source = CSVDailyBarDataSource(etf_filepath, Equity)
+    data_handler = BacktestDataHandler(
+        StaticUniverse(ASSETS), data_sources=[data_source]
+    )
+    param_grid = {
+        'weight': [0.4, 0.6], 'weekday': ['MON', 'WED'],
+        'burn_in_dt': ['2019-01-10 14:30:00']
+    }
+
+    expected = ParameterSweep(
+        create_session, param_grid, data_handler=data_handler, workers=1
+    ).run()
+    shared = ParameterSweep(
+        create_session, param_grid, data_handler=data_handler, workers=2,
+        share_burn_in=True
+    )
+    pd.testing.assert_frame_equal(shared.run(), expected)
+    assert shared.burn_in_snapshot is not None
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
@@ -39,3 +40,25 @@ def test_percent_commission(
     assert pfm._calc_commission(asset, quantity, consideration, broker=broker) == expected_commission
     assert pfm._calc_tax(asset, quantity, consideration, broker=broker) == expected_tax
     assert pfm.calc_total_cost(asset, quantity, consideration, broker=broker) == expected_total
+
+
+def test_percent_commission_batch_matches_single_trades():
+    """
+    Tests that the vectorised total cost of a batch of trades
+    is identical to the total cost of each trade separately.
+    """
+    pfm = PercentFeeModel(commission_pct=0.002, tax_pct=0.0025)
+    broker = BrokerMock()
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    quantities = np.array([100.0, -50.0, 37.0])
+    considerations = np.array([1000.0, -8542.0, 4321.17])
+
+    total_costs = pfm.calc_total_costs(
+        assets, quantities, considerations, broker=broker
+    )
+    assert total_costs.tolist() == [
+        pfm.calc_total_cost(asset, quantity, consideration, broker=broker)
+        for asset, quantity, consideration in zip(
+            assets, quantities.tolist(), considerations.tolist()
+        )
+    ]
@@ -1,3 +1,5 @@
+import numpy as np
+
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 
 
@@ -25,3 +27,17 @@ def test_commission_is_zero_uniformly():
     assert zbc._calc_commission(asset, quantity, consideration, broker=broker) == 0.0
     assert zbc._calc_tax(asset, quantity, consideration, broker=broker) == 0.0
     assert zbc.calc_total_cost(asset, quantity, consideration, broker=broker) == 0.0
+
+
+def test_commission_is_zero_for_batch():
+    """
+    Tests that the total cost of every trade in a batch is zero.
+    """
+    zbc = ZeroFeeModel()
+    quantities = np.array([100.0, -50.0])
+    considerations = np.array([1000.0, -500.0])
+
+    total_costs = zbc.calc_total_costs(
+        ['EQ:ABC', 'EQ:DEF'], quantities, considerations, broker=BrokerMock()
+    )
+    assert total_costs.tolist() == [0.0, 0.0]
@@ -394,3 +394,29 @@ def test_history_to_df_empty():
     assert sorted(test_df.columns) == sorted(hist_df.columns)
     assert len(test_df) == len(hist_df)
     assert len(hist_df) == 0
+
+
+def test_update_market_values():
+    """
+    Test update_market_values revalues all held assets
+    and rejects negative prices.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
+    port = Portfolio(start_dt)
+    port.subscribe_funds(start_dt, 100000.0)
+    port.transact_asset(
+        Transaction('EQ:AAA', 100, start_dt, 567.0, 1, commission=15.78)
+    )
+    port.transact_asset(
+        Transaction('EQ:BBB', 200, start_dt, 123.0, 2, commission=7.43)
+    )
+
+    port.update_market_values(
+        {'EQ:AAA': 570.0, 'EQ:BBB': 121.5, 'EQ:CCC': 10.0}, later_dt
+    )
+    assert port.total_market_value == 570.0 * 100 + 121.5 * 200
+    assert port.portfolio_to_dict()['EQ:BBB']['market_value'] == 121.5 * 200
+
+    with pytest.raises(ValueError):
+        port.update_market_values({'EQ:AAA': -1.0, 'EQ:BBB': 121.5}, later_dt)
@@ -0,0 +1,144 @@
+from collections import OrderedDict
+
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.broker.portfolio.position_book import PositionBook, PositionView
+from qstrader.broker.portfolio.position_handler import PositionHandler
+from qstrader.broker.transaction.transaction import Transaction
+
+
+POSITION_ATTRIBUTES = [
+    'current_price', 'current_dt', 'buy_quantity', 'sell_quantity',
+    'avg_bought', 'avg_sold', 'buy_commission', 'sell_commission',
+    'direction', 'market_value', 'avg_price', 'net_quantity',
+    'total_bought', 'total_sold', 'net_total', 'commission',
+    'net_incl_commission', 'realised_pnl', 'unrealised_pnl', 'total_pnl'
+]
+
+
+def create_transactions():
+    """
+    Create a sequence of transactions opening, adding to,
+    partially closing, fully closing and reopening positions
+    on both the long and short side.
+    """
+    dts = pd.date_range('2015-05-06 15:00:00', periods=4, freq='D', tz=pytz.UTC)
+    return [
+        Transaction('EQ:AMZN', 100, dts[0], 960.0, 1, commission=26.83),
+        Transaction('EQ:MSFT', -250, dts[0], 142.58, 2, commission=8.35),
+        Transaction('EQ:AAPL', 120, dts[0], 125.01, 3, commission=3.12),
+        Transaction('EQ:AMZN', 200, dts[1], 990.0, 4, commission=18.53),
+        Transaction('EQ:MSFT', 100, dts[1], 140.12, 5, commission=4.27),
+        Transaction('EQ:AAPL', -120, dts[2], 127.34, 6, commission=3.18),
+        Transaction('EQ:AMZN', -50, dts[2], 1001.5, 7, commission=6.42),
+        Transaction('EQ:AAPL', -40, dts[3], 128.02, 8, commission=1.97)
+    ]
+
+
+def test_position_book_matches_position_handler():
+    """
+    Tests that the position book produces identical positions
+    and totals to the position handler for the same transactions.
+    """
+    book = PositionBook(capacity=1)
+    ph = PositionHandler()
+    for transaction in create_transactions():
+        book.transact_position(transaction)
+        ph.transact_position(transaction)
+
+        assert list(book.positions.keys()) == list(ph.positions.keys())
+        for asset, position in ph.positions.items():
+            view = book.positions[asset]
+            assert isinstance(view, PositionView)
+            for attribute in POSITION_ATTRIBUTES:
+                assert getattr(view, attribute) == getattr(position, attribute)
+
+        assert book.total_market_value() == ph.total_market_value()
+        assert book.total_unrealised_pnl() == ph.total_unrealised_pnl()
+        assert book.total_realised_pnl() == ph.total_realised_pnl()
+        assert book.total_pnl() == ph.total_pnl()
+
+    assert book.held_assets() == ['EQ:AMZN', 'EQ:MSFT', 'EQ:AAPL']
+
+
+def test_position_book_update_current_prices():
+    """
+    Tests that the vectorised revaluation of the position book
+    matches updating the price of each position view separately.
+    """
+    book = PositionBook()
+    expected_book = PositionBook()
+    for transaction in create_transactions():
+        book.transact_position(transaction)
+        expected_book.transact_position(transaction)
+
+    dt = pd.Timestamp('2015-05-12 15:00:00', tz=pytz.UTC)
+    prices = {'EQ:AMZN': 1010.25, 'EQ:MSFT': 139.8, 'EQ:AAPL': 129.5}
+    book.update_current_prices(prices, dt)
+    for asset, position in expected_book.positions.items():
+        position.update_current_price(prices[asset], dt)
+
+    assert book.total_market_value() == expected_book.total_market_value()
+    assert book.total_pnl() == expected_book.total_pnl()
+    assert book.positions['EQ:MSFT'].current_price == 139.8
+    assert book.positions['EQ:MSFT'].current_dt == dt
+
+    with pytest.raises(ValueError):
+        book.update_current_prices({**prices, 'EQ:AAPL': -1.0}, dt)
+    with pytest.raises(ValueError):
+        book.update_current_prices(
+            prices, pd.Timestamp('2015-05-01 15:00:00', tz=pytz.UTC)
+        )
+
+
+def test_position_book_close_all_positions():
+    """
+    Tests that closing every position leaves an empty
+    position book with zero totals.
+    """
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    book = PositionBook()
+    book.transact_position(
+        Transaction('EQ:AMZN', 100, dt, 960.0, 1, commission=26.83)
+    )
+    book.transact_position(
+        Transaction('EQ:AMZN', -100, dt, 980.0, 2, commission=18.53)
+    )
+    assert book.positions == OrderedDict()
+    assert book.held_assets() == []
+    assert book.total_market_value() == 0.0
+    assert book.total_pnl() == 0.0
+
+
+def test_position_book_invalid_capacity():
+    """
+    Tests that a non-positive capacity raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        PositionBook(capacity=0)
+
+
+def test_position_book_view_and_single_price_update():
+    """
+    Tests that the read-only view and the single position price
+    update of the position book match the position handler.
+    """
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    new_dt = pd.Timestamp('2015-05-07 15:00:00', tz=pytz.UTC)
+    book = PositionBook()
+    ph = PositionHandler()
+    for handler in (book, ph):
+        handler.transact_position(
+            Transaction('EQ:AMZN', 75, dt, 483.45, 1, commission=15.97)
+        )
+        handler.update_current_price('EQ:AMZN', 491.2, new_dt)
+
+    positions = book.view_positions()
+    assert list(positions.keys()) == ['EQ:AMZN']
+    assert positions['EQ:AMZN'].current_price == 491.2
+    assert positions['EQ:AMZN'].current_dt == new_dt
+    with pytest.raises(TypeError):
+        positions['EQ:MSFT'] = positions['EQ:AMZN']
+    assert book.total_market_value() == ph.total_market_value()
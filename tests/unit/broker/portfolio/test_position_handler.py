@@ -2,6 +2,7 @@ from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
+import pytest
 import pytz
 
 from qstrader.broker.portfolio.position_handler import PositionHandler
@@ -171,3 +172,101 @@ def test_total_values_for_two_separate_transactions():
     assert np.isclose(ph.total_unrealised_pnl(), -24.31999999999971)
     assert ph.total_realised_pnl() == 0.0
     assert np.isclose(ph.total_pnl(), -24.31999999999971)
+
+
+def test_update_current_prices_matches_per_position_update():
+    """
+    Tests that 'update_current_prices' revalues all positions
+    identically to updating the current price of each
+    position separately.
+    """
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    new_dt = pd.Timestamp('2015-05-07 15:00:00', tz=pytz.UTC)
+    transactions = [
+        Transaction('EQ:AMZN', 75, dt, 483.45, 1, commission=15.97),
+        Transaction('EQ:MSFT', -250, dt, 142.58, 2, commission=8.35),
+        Transaction('EQ:AAPL', 120, dt, 125.01, 3, commission=3.12)
+    ]
+    prices = {'EQ:AMZN': 491.2, 'EQ:MSFT': 139.8, 'EQ:AAPL': 127.45}
+
+    ph = PositionHandler()
+    expected_ph = PositionHandler()
+    for transaction in transactions:
+        ph.transact_position(transaction)
+        expected_ph.transact_position(transaction)
+
+    ph.update_current_prices(prices, new_dt)
+    for asset, price in prices.items():
+        expected_ph.positions[asset].update_current_price(price, new_dt)
+
+    assert ph.total_market_value() == expected_ph.total_market_value()
+    assert ph.total_unrealised_pnl() == expected_ph.total_unrealised_pnl()
+    assert ph.total_pnl() == expected_ph.total_pnl()
+    for asset, price in prices.items():
+        assert ph.positions[asset].current_price == price
+        assert ph.positions[asset].current_dt == new_dt
+
+
+def test_update_current_prices_non_positive_price():
+    """
+    Tests that 'update_current_prices' raises a ValueError
+    for a non-positive price of a held asset.
+    """
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    ph = PositionHandler()
+    ph.transact_position(
+        Transaction('EQ:AMZN', 75, dt, 483.45, 1, commission=15.97)
+    )
+    with pytest.raises(ValueError):
+        ph.update_current_prices({'EQ:AMZN': 0.0}, dt)
+
+
+def test_update_current_prices_earlier_date():
+    """
+    Tests that 'update_current_prices' raises a ValueError
+    for a timestamp earlier than that of a held position.
+    """
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    earlier_dt = pd.Timestamp('2015-05-05 15:00:00', tz=pytz.UTC)
+    ph = PositionHandler()
+    ph.transact_position(
+        Transaction('EQ:AMZN', 75, dt, 483.45, 1, commission=15.97)
+    )
+    with pytest.raises(ValueError):
+        ph.update_current_prices({'EQ:AMZN': 490.0}, earlier_dt)
+
+
+def test_view_positions_does_not_rebuild_arrays():
+    """
+    Tests that reading the positions via the read-only view,
+    or marking a single position to market, does not require
+    the aligned arrays to be rebuilt.
+    """
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    new_dt = pd.Timestamp('2015-05-07 15:00:00', tz=pytz.UTC)
+    ph = PositionHandler()
+    ph.transact_position(
+        Transaction('EQ:AMZN', 75, dt, 483.45, 1, commission=15.97)
+    )
+    ph.transact_position(
+        Transaction('EQ:MSFT', -250, dt, 142.58, 2, commission=8.35)
+    )
+    ph.update_current_prices({'EQ:AMZN': 491.2, 'EQ:MSFT': 139.8}, new_dt)
+    assert not ph._arrays_stale
+
+    positions = ph.view_positions()
+    assert list(positions.keys()) == ['EQ:AMZN', 'EQ:MSFT']
+    assert positions['EQ:AMZN'].current_price == 491.2
+    assert not ph._arrays_stale
+    with pytest.raises(TypeError):
+        positions['EQ:AAPL'] = positions['EQ:AMZN']
+
+    ph.update_current_price('EQ:MSFT', 140.5, new_dt)
+    assert not ph._arrays_stale
+    assert ph.total_market_value() == 491.2 * 75 + 140.5 * -250
+    assert positions['EQ:MSFT'].current_price == 140.5
+
+    # Handing out the mutable positions requires a rebuild
+    ph.positions['EQ:MSFT'].update_current_price(141.0, new_dt)
+    assert ph._arrays_stale
+    assert ph.total_market_value() == 491.2 * 75 + 141.0 * -250
@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader import settings
+from qstrader.broker.portfolio.portfolio import Portfolio
+from qstrader.broker.portfolio.position_totals import PositionTotals
+from qstrader.broker.transaction.transaction import Transaction
+
+
+class PositionValues(object):
+    """
+    Holds the market value of each position, counting the
+    number of full recalculations and rebuilds.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.recalculations = 0
+        self.rebuilds = 0
+
+    def recalculate(self, key):
+        self.recalculations += 1
+        return sum(self.values.values())
+
+    def contributions(self, asset):
+        if asset not in self.values:
+            return {}
+        return {'market_value': self.values[asset]}
+
+    def all_contributions(self):
+        self.rebuilds += 1
+        return {'market_value': dict(self.values)}
+
+    def totals(self):
+        return PositionTotals(
+            self.contributions, self.all_contributions, self.recalculate
+        )
+
+
+def test_position_totals_rebuilt_once_per_invalidation():
+    """
+    Tests that after an invalidation the totals are rebuilt from
+    all positions once, with subsequent reads and updates not
+    revisiting the other positions.
+    """
+    positions = PositionValues()
+    totals = positions.totals()
+    positions.values['EQ:AAA'] = 100.0
+    positions.values['EQ:BBB'] = 50.0
+
+    totals.invalidate()
+    assert totals.get('market_value') == 150.0
+    assert totals.get('market_value') == 150.0
+    assert positions.rebuilds == 1
+
+    positions.values['EQ:AAA'] = 150.0
+    totals.mark_position('EQ:AAA')
+    assert totals.get('market_value') == 200.0
+    assert positions.rebuilds == 1
+    assert positions.recalculations == 0
+
+
+def test_position_totals_maintained_contributions():
+    """
+    Tests that the running totals apply the change in contribution
+    of each position as positions are opened, marked to market and
+    closed, without revisiting the other positions.
+    """
+    positions = PositionValues()
+    totals = positions.totals()
+
+    for asset, value in [('EQ:AAA', 0.1), ('EQ:BBB', 0.2), ('EQ:CCC', 0.3)]:
+        positions.values[asset] = value
+        totals.update_position(asset)
+    assert totals.get('market_value') == 0.1 + 0.2 + 0.3
+
+    positions.values['EQ:AAA'] = 100.0
+    totals.mark_position('EQ:AAA')
+    assert totals.get('market_value') == pytest.approx(100.5)
+
+    del positions.values['EQ:BBB']
+    totals.update_position('EQ:BBB')
+    positions.values['EQ:BBB'] = -50.0
+    totals.update_position('EQ:BBB')
+    assert totals.get('market_value') == pytest.approx(50.3)
+    assert totals.get('unknown') == 0.0
+
+    # Closing every position returns the total to exactly zero
+    for asset in list(positions.values.keys()):
+        del positions.values[asset]
+        totals.update_position(asset)
+    assert totals.get('market_value') == 0.0
+    assert positions.rebuilds == 0
+    assert positions.recalculations == 0
+
+
+def test_position_totals_revalued_positions():
+    """
+    Tests that a batch revaluation applies the change in contribution
+    of every position from a single snapshot, rather than
+    invalidating the totals.
+    """
+    positions = PositionValues()
+    totals = positions.totals()
+    positions.values['EQ:AAA'] = 100.0
+    positions.values['EQ:BBB'] = 50.0
+    totals.update_position('EQ:AAA')
+    totals.update_position('EQ:BBB')
+
+    positions.values['EQ:AAA'] = 110.0
+    positions.values['EQ:BBB'] = 40.0
+    totals.revalue_positions()
+    assert not totals.stale
+    assert totals.get('market_value') == 150.0
+    assert positions.rebuilds == 1
+    assert positions.recalculations == 0
+
+
+def test_position_totals_non_finite_contributions():
+    """
+    Tests that a non-finite contribution is reflected in the total
+    without corrupting the running sum once it becomes finite.
+    """
+    positions = PositionValues()
+    totals = positions.totals()
+    positions.values['EQ:AAA'] = 0.1
+    positions.values['EQ:BBB'] = np.nan
+    totals.invalidate()
+    assert np.isnan(totals.get('market_value'))
+
+    positions.values['EQ:BBB'] = 0.2
+    totals.mark_position('EQ:BBB')
+    assert totals.get('market_value') == 0.1 + 0.2
+
+    positions.values['EQ:AAA'] = np.inf
+    totals.mark_position('EQ:AAA')
+    assert totals.get('market_value') == np.inf
+
+    positions.values['EQ:AAA'] = 0.3
+    totals.mark_position('EQ:AAA')
+    assert totals.get('market_value') == 0.2 + 0.3
+
+
+def test_position_totals_debug_cross_check():
+    """
+    Tests that the debug mode detects a maintained total
+    which differs from a full recalculation.
+    """
+    positions = PositionValues()
+    totals = positions.totals()
+    positions.values['EQ:AAA'] = 100.0
+    totals.update_position('EQ:AAA')
+    assert totals.get('market_value') == 100.0
+
+    # Modify the position without notifying the totals
+    positions.values['EQ:AAA'] = 200.0
+    settings.set_debug_totals(True)
+    try:
+        with pytest.raises(ValueError):
+            totals.get('market_value')
+    finally:
+        settings.set_debug_totals(False)
+
+
+@pytest.mark.parametrize('columnar_positions', [False, True])
+def test_portfolio_totals_maintained(columnar_positions):
+    """
+    Tests that the maintained portfolio totals reflect transactions,
+    updated market values and positions modified directly.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
+    port = Portfolio(start_dt, columnar_positions=columnar_positions)
+    port.subscribe_funds(start_dt, 100000.0)
+    port.transact_asset(
+        Transaction('EQ:AAA', 100, start_dt, 567.0, 1, commission=15.78)
+    )
+    assert port.total_market_value == 56700.0
+
+    port.update_market_value_of_asset('EQ:AAA', 570.0, later_dt)
+    assert port.total_market_value == 57000.0
+    assert port.total_unrealised_pnl == port.pos_handler.total_unrealised_pnl()
+
+    port.update_market_values({'EQ:AAA': 580.0}, later_dt)
+    assert not port.totals.stale
+    assert port.total_market_value == 58000.0
+    assert port.total_equity == 58000.0 + port.cash
+
+    # Positions handed out for modification invalidate the totals
+    port.pos_handler.positions['EQ:AAA'].update_current_price(600.0, later_dt)
+    assert port.total_market_value == 60000.0
+    assert port.total_unrealised_pnl == port.pos_handler.total_unrealised_pnl()
@@ -0,0 +1,66 @@
+import pytest
+
+from qstrader.broker.order_book import OrderBook
+
+
+class OrderMock(object):
+    def __init__(self, order_id, quantity=100):
+        self.order_id = order_id
+        self.quantity = quantity
+
+
+def test_submit_and_drain_orders():
+    """
+    Tests that orders are drained at once in order of submission,
+    leaving the order book empty.
+    """
+    book = OrderBook()
+    first = OrderMock('a')
+    book.submit_order(first)
+    book.submit_orders([OrderMock('b'), OrderMock('c')])
+
+    assert len(book) == 3
+    assert 'b' in book
+    assert [order.order_id for order in book] == ['a', 'b', 'c']
+
+    orders = book.drain()
+    assert orders[0] is first
+    assert [order.order_id for order in orders] == ['a', 'b', 'c']
+    assert len(book) == 0
+    assert book.drain() == []
+
+
+def test_submit_duplicate_order_id_raises():
+    """
+    Tests that an order cannot be submitted with the
+    ID of an order that is already open.
+    """
+    book = OrderBook()
+    book.submit_order(OrderMock('a'))
+    with pytest.raises(ValueError):
+        book.submit_order(OrderMock('a'))
+
+    # Once drained the order ID can be reused
+    book.drain()
+    book.submit_order(OrderMock('a'))
+    assert len(book) == 1
+
+
+def test_get_and_cancel_order():
+    """
+    Tests that open orders can be looked up and cancelled
+    by order ID, retaining the order of the remainder.
+    """
+    book = OrderBook()
+    book.submit_orders([OrderMock('a'), OrderMock('b', 50), OrderMock('c')])
+
+    assert book.get_order('b').quantity == 50
+    with pytest.raises(KeyError):
+        book.get_order('d')
+
+    cancelled = book.cancel_order('b')
+    assert cancelled.order_id == 'b'
+    assert 'b' not in book
+    with pytest.raises(KeyError):
+        book.cancel_order('b')
+    assert [order.order_id for order in book.drain()] == ['a', 'c']
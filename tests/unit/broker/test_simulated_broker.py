@@ -1,12 +1,12 @@
-import queue
-
 import numpy as np
 import pandas as pd
 import pytest
 import pytz
 
+from qstrader.broker.order_book import OrderBook
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader import settings
 
@@ -39,6 +39,12 @@ class DataHandlerMock(object):
     def get_asset_latest_mid_price(self, dt, asset):
         return np.NaN
 
+    def get_assets_latest_mid_prices(self, dt, assets):
+        return {asset: np.NaN for asset in assets}
+
+    def get_assets_latest_bid_ask_prices(self, dt, assets):
+        return {asset: (np.NaN, np.NaN) for asset in assets}
+
 
 class DataHandlerMockPrice(object):
     def get_asset_latest_bid_ask_price(self, dt, asset):
@@ -47,6 +53,24 @@ class DataHandlerMockPrice(object):
     def get_asset_latest_mid_price(self, dt, asset):
         return (53.47 - 53.45) / 2.0
 
+    def get_assets_latest_mid_prices(self, dt, assets):
+        return {asset: (53.47 - 53.45) / 2.0 for asset in assets}
+
+    def get_assets_latest_bid_ask_prices(self, dt, assets):
+        return {asset: (53.45, 53.47) for asset in assets}
+
+
+class DataHandlerMockMissingPrice(object):
+    """
+    Provides missing prices as computed NaN values, which are
+    not the np.NaN object itself.
+    """
+    def get_asset_latest_bid_ask_price(self, dt, asset):
+        return (float('nan'), float('nan'))
+
+    def get_assets_latest_bid_ask_prices(self, dt, assets):
+        return {asset: (float('nan'), float('nan')) for asset in assets}
+
 
 class OrderMock(object):
     def __init__(self, asset, quantity, order_id=None):
@@ -406,7 +430,7 @@ def test_create_portfolio():
     assert "1234" in sb.portfolios
     assert isinstance(sb.portfolios["1234"], Portfolio)
     assert "1234" in sb.open_orders
-    assert isinstance(sb.open_orders["1234"], queue.Queue)
+    assert isinstance(sb.open_orders["1234"], OrderBook)
 
     # If portfolio is already in the dictionary
     # then raise ValueError
@@ -642,6 +666,86 @@ def test_submit_order():
     assert port.pos_handler.positions[asset].net_quantity == -1000
 
 
+def test_batch_execution_matches_order_execution():
+    """
+    Tests that filling all pending orders in a single batch
+    produces identical portfolios to executing each order
+    separately, and that both raise a ValueError if any
+    ordered asset has no price.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+
+    # Raises ValueError if bid/ask are both NaN
+    for data_handler in (DataHandlerMock(), DataHandlerMockMissingPrice()):
+        for batch_execution in (False, True):
+            sbnp = SimulatedBroker(
+                start_dt, ExchangeMockPrice(), data_handler,
+                batch_execution=batch_execution
+            )
+            sbnp.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
+            sbnp.submit_order("1234", OrderMock('EQ:RDSB', 100))
+            with pytest.raises(ValueError):
+                sbnp.update(start_dt)
+
+    brokers = []
+    for batch_execution in (False, True):
+        sb = SimulatedBroker(
+            start_dt, ExchangeMockPrice(), DataHandlerMockPrice(),
+            fee_model=PercentFeeModel(commission_pct=0.002, tax_pct=0.005),
+            batch_execution=batch_execution
+        )
+        sb.subscribe_funds_to_account(300000.0)
+        for portfolio_id in (1234, 5678):
+            sb.create_portfolio(portfolio_id=portfolio_id)
+            sb.subscribe_funds_to_portfolio(str(portfolio_id), 100000.0)
+        sb.submit_order("1234", OrderMock('EQ:RDSB', 1000, order_id=1))
+        sb.submit_order("1234", OrderMock('EQ:BP', -750, order_id=2))
+        sb.submit_order("5678", OrderMock('EQ:RDSB', -300, order_id=3))
+        sb.submit_order("5678", OrderMock('EQ:HSBA', 2500, order_id=4))
+        sb.update(start_dt)
+        brokers.append(sb)
+
+    for portfolio_id in ("1234", "5678"):
+        port = brokers[0].portfolios[portfolio_id]
+        batch_port = brokers[1].portfolios[portfolio_id]
+        assert batch_port.cash == port.cash
+        assert batch_port.total_market_value == port.total_market_value
+        assert batch_port.portfolio_to_dict() == port.portfolio_to_dict()
+        assert [pe.to_dict() for pe in batch_port.history] == [
+            pe.to_dict() for pe in port.history
+        ]
+    assert not brokers[1].has_open_orders()
+
+
+def test_submit_and_cancel_orders():
+    """
+    Tests that many orders can be submitted at once and that
+    a cancelled order is not executed on update.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), DataHandlerMockPrice())
+    sb.create_portfolio(portfolio_id=1234)
+    sb.subscribe_funds_to_account(100000.0)
+    sb.subscribe_funds_to_portfolio("1234", 100000.0)
+    sb.submit_orders(
+        "1234", [
+            OrderMock('EQ:RDSB', 100, order_id=1),
+            OrderMock('EQ:BP', 200, order_id=2)
+        ]
+    )
+
+    with pytest.raises(KeyError):
+        sb.cancel_order("5678", 1)
+    with pytest.raises(KeyError):
+        sb.cancel_order("1234", 3)
+    assert sb.cancel_order("1234", 2).asset == 'EQ:BP'
+    assert sb.has_open_orders()
+
+    sb.update(start_dt)
+    assert not sb.has_open_orders()
+    assert list(sb.portfolios["1234"].portfolio_to_dict().keys()) == ['EQ:RDSB']
+
+
 def test_update_sets_correct_time():
     """
     Tests that the update method sets the current
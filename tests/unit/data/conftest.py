@@ -0,0 +1,26 @@
+import os
+import shutil
+
+import pytest
+
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'integration', 'trading', 'fixtures'
+)
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """
+    A temporary directory containing copies of the ABC and DEF
+    daily bar CSV fixtures.
+    """
+    csv_dir = tmp_path / 'csv'
+    csv_dir.mkdir()
+    for symbol in ('ABC', 'DEF'):
+        shutil.copy(
+            os.path.join(FIXTURES_DIR, '%s.csv' % symbol),
+            str(csv_dir / ('%s.csv' % symbol))
+        )
+    return str(csv_dir)
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+class SingleAssetDataSourceMock(object):
+    """
+    A data source without batch methods, pricing a single asset.
+    """
+    def get_bid(self, dt, asset):
+        if asset != 'EQ:XYZ':
+            raise KeyError(asset)
+        return 42.0
+
+    def get_ask(self, dt, asset):
+        return self.get_bid(dt, asset)
+
+
+def test_batch_prices_match_single_asset_prices(csv_dir):
+    """
+    Checks that the batch price methods agree with the single asset
+    methods, including falling back to a data source without batch
+    methods and returning NaN for assets no data source provides.
+    """
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:XYZ', 'EQ:MISSING']
+    data_handler = BacktestDataHandler(
+        StaticUniverse(assets),
+        data_sources=[
+            CSVDailyBarDataSource(csv_dir, Equity),
+            SingleAssetDataSourceMock()
+        ]
+    )
+
+    for dt in (
+        pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC),
+        pd.Timestamp('2019-01-15 21:00:00', tz=pytz.UTC),
+        pd.Timestamp('1990-01-01 14:30:00', tz=pytz.UTC)
+    ):
+        bids = data_handler.get_assets_latest_bid_prices(dt, assets)
+        asks = data_handler.get_assets_latest_ask_prices(dt, assets)
+        bid_asks = data_handler.get_assets_latest_bid_ask_prices(dt, assets)
+        mids = data_handler.get_assets_latest_mid_prices(dt, assets)
+        assert list(mids.keys()) == assets
+        for asset in assets:
+            np.testing.assert_equal(
+                bids[asset], data_handler.get_asset_latest_bid_price(dt, asset)
+            )
+            np.testing.assert_equal(
+                asks[asset], data_handler.get_asset_latest_ask_price(dt, asset)
+            )
+            np.testing.assert_equal(
+                bid_asks[asset],
+                data_handler.get_asset_latest_bid_ask_price(dt, asset)
+            )
+            np.testing.assert_equal(
+                mids[asset], data_handler.get_asset_latest_mid_price(dt, asset)
+            )
+    assert mids['EQ:XYZ'] == 42.0
+    assert np.isnan(mids['EQ:MISSING'])
+
+
+class IndexedDataSourceMock(object):
+    """
+    A data source listing its asset symbols, which records the
+    assets it has been queried for.
+    """
+    def __init__(self, prices):
+        self.prices = prices
+        self.asset_symbols = list(prices.keys())
+        self.queried = []
+
+    def get_bid(self, dt, asset):
+        self.queried.append(asset)
+        return self.prices[asset]
+
+    def get_ask(self, dt, asset):
+        return self.get_bid(dt, asset)
+
+
+@pytest.mark.parametrize(
+    'source_precedence,expected_price',
+    [('first', 1.0), ('last', 2.0)]
+)
+def test_symbol_routing_precedence(source_precedence, expected_price):
+    """
+    Checks that symbols are only routed to the data sources that
+    provide them, preferring data sources by the precedence policy
+    and falling back to the next data source on a missing price.
+    """
+    first_ds = IndexedDataSourceMock({'EQ:ABC': 1.0, 'EQ:DEF': np.NaN})
+    last_ds = IndexedDataSourceMock({'EQ:ABC': 2.0, 'EQ:DEF': 3.0, 'EUR': 1.1})
+    data_handler = BacktestDataHandler(
+        StaticUniverse(['EQ:ABC', 'EQ:DEF']),
+        data_sources=[first_ds, last_ds],
+        source_precedence=source_precedence
+    )
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+
+    assert data_handler.get_asset_latest_bid_price(dt, 'EQ:ABC') == expected_price
+    assert data_handler.get_asset_latest_bid_price(dt, 'EQ:DEF') == 3.0
+    assert data_handler.get_asset_latest_bid_price(dt, 'EUR') == 1.1
+    assert 'EUR' not in first_ds.queried
+    assert np.isnan(data_handler.get_asset_latest_bid_price(dt, 'EQ:XYZ'))
+
+    bids = data_handler.get_assets_latest_bid_prices(
+        dt, ['EQ:ABC', 'EQ:DEF', 'EUR', 'EQ:XYZ']
+    )
+    assert bids['EQ:ABC'] == expected_price
+    assert bids['EQ:DEF'] == 3.0
+    assert bids['EUR'] == 1.1
+    assert np.isnan(bids['EQ:XYZ'])
+
+
+def test_invalid_source_precedence():
+    """
+    Checks that an unsupported precedence policy raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        BacktestDataHandler(
+            StaticUniverse([]), data_sources=[], source_precedence='random'
+        )
+
+
+class UnindexedBatchDataSourceMock(SingleAssetDataSourceMock):
+    """
+    A data source not listing its asset symbols, whose batch
+    methods raise if any requested asset is not provided.
+    """
+    def get_bids(self, dt, assets):
+        return np.array([self.get_bid(dt, asset) for asset in assets])
+
+    def get_asks(self, dt, assets):
+        return self.get_bids(dt, assets)
+
+
+def test_batch_prices_mixing_known_and_unknown_assets():
+    """
+    Checks that an unindexed data source raising for an unknown asset
+    does not prevent the other assets of the batch being priced.
+    """
+    data_handler = BacktestDataHandler(
+        StaticUniverse(['EQ:XYZ', 'EQ:MISSING']),
+        data_sources=[UnindexedBatchDataSourceMock()]
+    )
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    assets = ['EQ:MISSING', 'EQ:XYZ']
+
+    for prices in (
+        data_handler.get_assets_latest_bid_prices(dt, assets),
+        data_handler.get_assets_latest_ask_prices(dt, assets)
+    ):
+        assert prices['EQ:XYZ'] == 42.0
+        assert np.isnan(prices['EQ:MISSING'])
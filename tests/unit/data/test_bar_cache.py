@@ -0,0 +1,119 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.asset.equity import Equity
+from qstrader.data.bar_cache import BarFrameCache
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+def test_cache_round_trip(csv_dir, tmp_path):
+    """
+    Checks that a data source loaded from the on-disk cache produces
+    identical frames to one loaded directly from the CSV files.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    uncached_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    first_ds = CSVDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+
+    cache = BarFrameCache(cache_dir)
+    assert cache.load(os.path.join(csv_dir, 'ABC.csv'), True) is not None
+    assert cache.load(os.path.join(csv_dir, 'ABC.csv'), False) is None
+
+    cached_ds = CSVDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+    for ds in (first_ds, cached_ds):
+        for asset in ('EQ:ABC', 'EQ:DEF'):
+            pd.testing.assert_frame_equal(
+                ds.asset_bar_frames[asset],
+                uncached_ds.asset_bar_frames[asset]
+            )
+            pd.testing.assert_frame_equal(
+                ds.asset_bid_ask_frames[asset],
+                uncached_ds.asset_bid_ask_frames[asset]
+            )
+
+    dt = pd.Timestamp('2019-01-15 21:00:00', tz='UTC')
+    assert cached_ds.get_bid(dt, 'EQ:ABC') == uncached_ds.get_bid(dt, 'EQ:ABC')
+
+
+def test_cache_invalidated_on_modification(csv_dir, tmp_path):
+    """
+    Checks that modifying a CSV file results in a cache miss.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    csv_path = os.path.join(csv_dir, 'ABC.csv')
+    CSVDailyBarDataSource(csv_dir, Equity, csv_symbols=['ABC'], cache_dir=cache_dir)
+
+    cache = BarFrameCache(cache_dir)
+    assert cache.load(csv_path, True) is not None
+
+    with open(csv_path, 'a') as csv_file:
+        csv_file.write('2019-02-01,130.0,131.0,131.0\n')
+    assert cache.load(csv_path, True) is None
+
+
+def test_cache_load_is_memory_mapped(csv_dir, tmp_path):
+    """
+    Checks that the frames loaded from a large cached entry, along
+    with their indices, are views onto its memory mapped data file.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    CSVDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+    cache = BarFrameCache(cache_dir, mmap_min_bytes=0)
+    bar_df, bid_ask_df = cache.load(os.path.join(csv_dir, 'ABC.csv'), True)
+
+    def is_memory_mapped(values):
+        while values is not None:
+            if isinstance(values, np.memmap):
+                return True
+            values = values.base
+        return False
+
+    for df in (bar_df, bid_ask_df):
+        assert all(is_memory_mapped(block.values) for block in df._mgr.blocks)
+        assert is_memory_mapped(df.index.asi8)
+        assert str(df.index.tz) == 'UTC'
+
+
+def test_cache_load_wide_universe(csv_dir, tmp_path):
+    """
+    Checks that loading a wide universe from the cache holds at most a
+    single file open per memory mapped symbol, and none for small
+    entries, such that it succeeds under a low open file limit.
+    """
+    resource = pytest.importorskip('resource')
+    fd_dir = '/proc/self/fd'
+    if not os.path.isdir(fd_dir):
+        pytest.skip('Open file descriptors cannot be counted')
+
+    wide_dir = tmp_path / 'wide'
+    wide_dir.mkdir()
+    symbols = ['S%03d' % i for i in range(300)]
+    for symbol in symbols:
+        shutil.copy(
+            os.path.join(csv_dir, 'ABC.csv'), str(wide_dir / ('%s.csv' % symbol))
+        )
+    cache_dir = str(tmp_path / 'cache')
+    CSVDailyBarDataSource(str(wide_dir), Equity, cache_dir=cache_dir)
+
+    soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+    open_fds = len(os.listdir(fd_dir))
+    resource.setrlimit(resource.RLIMIT_NOFILE, (open_fds + 64, hard_limit))
+    try:
+        ds = CSVDailyBarDataSource(str(wide_dir), Equity, cache_dir=cache_dir)
+        assert len(ds.asset_bar_frames) == len(symbols)
+        assert len(os.listdir(fd_dir)) <= open_fds + 1
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft_limit, hard_limit))
+
+    cache = BarFrameCache(cache_dir, mmap_min_bytes=0)
+    open_fds = len(os.listdir(fd_dir))
+    frames = [
+        cache.load(str(wide_dir / ('%s.csv' % symbol)), True)
+        for symbol in symbols
+    ]
+    assert len(os.listdir(fd_dir)) <= open_fds + len(frames) + 1
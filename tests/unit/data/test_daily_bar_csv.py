@@ -0,0 +1,237 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.asset.equity import Equity
+from qstrader.data.daily_bar_csv import (
+    CSVDailyBarDataSource, interleave_open_close_prices
+)
+
+
+def test_interleave_open_close_prices():
+    """
+    Checks that daily opening and closing prices are interleaved at
+    the market open and close offsets, with missing prices
+    forward-filled from the latest available price.
+    """
+    dates = pd.DatetimeIndex(['2020-01-02', '2020-01-03'], tz='UTC').asi8
+    timestamps, prices = interleave_open_close_prices(
+        dates, np.array([np.NaN, 11.0]), np.array([10.5, np.NaN])
+    )
+    expected_timestamps = pd.DatetimeIndex(
+        [
+            '2020-01-02 14:30:00', '2020-01-02 21:00:00',
+            '2020-01-03 14:30:00', '2020-01-03 21:00:00'
+        ],
+        tz='UTC'
+    ).asi8
+    np.testing.assert_array_equal(timestamps, expected_timestamps)
+    np.testing.assert_array_equal(prices, [np.NaN, 10.5, 11.0, 11.0])
+
+
+def test_parallel_load_matches_serial(csv_dir):
+    """
+    Checks that loading the CSV files across a process pool
+    produces identical frames to a serial load.
+    """
+    serial_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    parallel_ds = CSVDailyBarDataSource(csv_dir, Equity, workers=2)
+
+    assert sorted(parallel_ds.asset_bar_frames.keys()) == ['EQ:ABC', 'EQ:DEF']
+    for asset in ('EQ:ABC', 'EQ:DEF'):
+        pd.testing.assert_frame_equal(
+            parallel_ds.asset_bar_frames[asset],
+            serial_ds.asset_bar_frames[asset]
+        )
+        pd.testing.assert_frame_equal(
+            parallel_ds.asset_bid_ask_frames[asset],
+            serial_ds.asset_bid_ask_frames[asset]
+        )
+
+
+def test_invalid_workers(csv_dir):
+    """
+    Checks that a non-positive number of workers raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        CSVDailyBarDataSource(csv_dir, Equity, workers=0)
+
+
+def test_lazy_load(csv_dir):
+    """
+    Checks that lazily loaded symbols are only parsed when first
+    requested, that the least recently used symbol is discarded
+    beyond the resident limit and that prices are unaffected.
+    """
+    eager_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    lazy_ds = CSVDailyBarDataSource(
+        csv_dir, Equity, lazy=True, max_resident_symbols=1
+    )
+    assert sorted(lazy_ds.asset_csv_files.keys()) == ['EQ:ABC', 'EQ:DEF']
+    assert len(lazy_ds.asset_bid_ask_frames) == 0
+
+    dt = pd.Timestamp('2019-01-15 21:00:00', tz='UTC')
+    assert lazy_ds.get_bid(dt, 'EQ:ABC') == eager_ds.get_bid(dt, 'EQ:ABC')
+    assert list(lazy_ds.asset_bid_ask_frames.keys()) == ['EQ:ABC']
+
+    assert lazy_ds.get_ask(dt, 'EQ:DEF') == eager_ds.get_ask(dt, 'EQ:DEF')
+    assert list(lazy_ds.asset_bid_ask_frames.keys()) == ['EQ:DEF']
+    assert 'EQ:ABC' not in lazy_ds.price_store
+
+    start_dt = pd.Timestamp('2019-01-01', tz='UTC')
+    pd.testing.assert_frame_equal(
+        lazy_ds.get_assets_historical_closes(start_dt, dt, ['EQ:ABC', 'EQ:DEF']),
+        eager_ds.get_assets_historical_closes(start_dt, dt, ['EQ:ABC', 'EQ:DEF'])
+    )
+
+    with pytest.raises(KeyError):
+        lazy_ds.get_bid(dt, 'EQ:XYZ')
+
+
+def test_lazy_batch_larger_than_resident_limit(csv_dir):
+    """
+    Checks that a batch price lookup of more symbols than may be
+    resident at once prices each symbol in turn, matching the eagerly
+    loaded prices without exceeding the resident limit, as do batches
+    within the limit.
+    """
+    eager_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    lazy_ds = CSVDailyBarDataSource(
+        csv_dir, Equity, lazy=True, max_resident_symbols=1
+    )
+    dt = pd.Timestamp('2019-01-15 21:00:00', tz='UTC')
+    assets = ['EQ:ABC', 'EQ:XYZ', 'EQ:DEF', 'EQ:ABC']
+
+    np.testing.assert_array_equal(
+        lazy_ds.get_bids(dt, assets), eager_ds.get_bids(dt, assets)
+    )
+    np.testing.assert_array_equal(
+        lazy_ds.get_asks(dt, assets), eager_ds.get_asks(dt, assets)
+    )
+    assert len(lazy_ds.asset_bid_ask_frames) == 1
+
+    # Repeated and unprovided symbols do not count towards the limit
+    np.testing.assert_array_equal(
+        lazy_ds.get_bids(dt, ['EQ:DEF', 'EQ:XYZ', 'EQ:DEF']),
+        eager_ds.get_bids(dt, ['EQ:DEF', 'EQ:XYZ', 'EQ:DEF'])
+    )
+    np.testing.assert_array_equal(
+        lazy_ds.get_asks(dt, ['EQ:ABC']), eager_ds.get_asks(dt, ['EQ:ABC'])
+    )
+
+
+def test_max_resident_symbols_requires_lazy(csv_dir):
+    """
+    Checks that a resident symbol limit is rejected for eager loading.
+    """
+    with pytest.raises(ValueError):
+        CSVDailyBarDataSource(csv_dir, Equity, max_resident_symbols=10)
+
+
+def test_price_cache_is_per_instance(csv_dir):
+    """
+    Checks that each data source owns a bounded price cache.
+    """
+    first_ds = CSVDailyBarDataSource(csv_dir, Equity, price_cache_size=1)
+    second_ds = CSVDailyBarDataSource(csv_dir, Equity)
+
+    dt = pd.Timestamp('2019-01-15 21:00:00', tz='UTC')
+    later_dt = pd.Timestamp('2019-01-16 21:00:00', tz='UTC')
+    bid = first_ds.get_bid(dt, 'EQ:ABC')
+    assert first_ds.get_bid(dt, 'EQ:ABC') == bid
+    first_ds.get_bid(later_dt, 'EQ:ABC')
+    assert first_ds.bid_cache.stats == {
+        'hits': 1, 'misses': 2, 'evictions': 1, 'size': 1, 'capacity': 1
+    }
+    assert len(second_ds.bid_cache) == 0
+
+    first_ds.clear_price_caches()
+    assert len(first_ds.bid_cache) == 0
+
+
+def test_compact_storage(csv_dir):
+    """
+    Checks that compact float32 storage retains only the needed
+    columns, stores a single mid price column and produces prices
+    matching the full precision data source.
+    """
+    full_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    compact_ds = CSVDailyBarDataSource(
+        csv_dir, Equity, compact=True, price_dtype='float32'
+    )
+
+    bar_df = compact_ds.asset_bar_frames['EQ:ABC']
+    assert list(bar_df.columns) == ['Open', 'Close', 'Adj Close']
+    assert all(dtype == np.float32 for dtype in bar_df.dtypes)
+    bid_ask_df = compact_ds.asset_bid_ask_frames['EQ:ABC']
+    assert list(bid_ask_df.columns) == ['Mid']
+    assert (
+        compact_ds.price_store.bids['EQ:ABC'] is
+        compact_ds.price_store.asks['EQ:ABC']
+    )
+
+    dt = pd.Timestamp('2019-01-15 21:00:00', tz='UTC')
+    bid = compact_ds.get_bid(dt, 'EQ:ABC')
+    assert isinstance(bid, np.float64)
+    assert bid == pytest.approx(full_ds.get_bid(dt, 'EQ:ABC'), rel=1e-6)
+    assert compact_ds.get_ask(dt, 'EQ:ABC') == bid
+
+    with pytest.raises(ValueError):
+        CSVDailyBarDataSource(csv_dir, Equity, price_dtype='int32')
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_historical_closes_match_joined_closes(csv_dir, lazy):
+    """
+    Checks that the closing prices sliced from the aligned close
+    panel match those of joining each asset's closing prices, for
+    misaligned dates, asset subsets and date windows.
+    """
+    with open(os.path.join(csv_dir, 'GHI.csv'), 'w') as csv_file:
+        csv_file.write(
+            'Date,Open,Close,Adj Close\n'
+            '2018-12-28,10.0,10.5,10.5\n'
+            '2019-01-03,11.0,,\n'
+            '2019-01-05,12.0,12.5,12.5\n'
+        )
+    ds = CSVDailyBarDataSource(csv_dir, Equity, lazy=lazy)
+
+    for assets in (
+        ['EQ:ABC', 'EQ:DEF', 'EQ:GHI'], ['EQ:GHI'],
+        ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+    ):
+        for start_dt, end_dt in (
+            (pd.Timestamp('2018-01-01', tz='UTC'), pd.Timestamp('2020-01-01', tz='UTC')),
+            (pd.Timestamp('2019-01-03', tz='UTC'), pd.Timestamp('2019-01-05', tz='UTC')),
+            (pd.Timestamp('2019-01-04', tz='UTC'), pd.Timestamp('2019-01-04', tz='UTC'))
+        ):
+            pd.testing.assert_frame_equal(
+                ds.get_assets_historical_closes(start_dt, end_dt, assets),
+                ds._concat_historical_closes(start_dt, end_dt, assets)
+            )
+
+
+def test_historical_closes_are_writable_copies(csv_dir):
+    """
+    Checks that the historical closes sliced from the aligned close
+    panel are always writable copies, whether or not the assets are
+    evenly spaced, such that modifying them leaves the panel intact.
+    """
+    ds = CSVDailyBarDataSource(csv_dir, Equity)
+    start_dt = pd.Timestamp('2019-01-02', tz='UTC')
+    end_dt = pd.Timestamp('2019-06-28', tz='UTC')
+    assets = list(ds.asset_bar_frames.keys())
+
+    for subset in (assets, assets[:1], assets[::-1], [assets[0], assets[0]]):
+        expected = ds._concat_historical_closes(start_dt, end_dt, subset)
+        closes = ds.get_assets_historical_closes(start_dt, end_dt, subset)
+        assert not np.shares_memory(closes.to_numpy(), ds.close_panel['closes'])
+        pd.testing.assert_frame_equal(closes, expected)
+
+        closes.iloc[0, 0] = 1.0
+        closes[subset[-1]] *= 2.0
+        pd.testing.assert_frame_equal(
+            ds.get_assets_historical_closes(start_dt, end_dt, subset), expected
+        )
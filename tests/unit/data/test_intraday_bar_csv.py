@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.asset.equity import Equity
+from qstrader.data.intraday_bar_csv import CSVIntradayBarDataSource
+
+
+@pytest.fixture
+def intraday_csv_dir(tmp_path):
+    """
+    A temporary directory containing a CSV file of five minute bars
+    over two sessions, with a missing closing price.
+    """
+    csv_dir = tmp_path / 'intraday'
+    csv_dir.mkdir()
+    with open(str(csv_dir / 'ABC.csv'), 'w') as csv_file:
+        csv_file.write(
+            'Date,Open,High,Low,Close,Volume\n'
+            '2020-01-02 14:30:00,100.0,101.0,99.0,100.5,1000\n'
+            '2020-01-02 14:35:00,100.6,101.0,99.0,,1000\n'
+            '2020-01-02 14:40:00,100.8,101.0,99.0,100.9,1000\n'
+            '2020-01-03 14:30:00,102.0,103.0,101.0,102.5,1000\n'
+        )
+    return str(csv_dir)
+
+
+@pytest.mark.parametrize(
+    'dt,expected',
+    [
+        ('2020-01-02 14:29:00', np.NaN),
+        ('2020-01-02 14:30:00', 100.0),
+        ('2020-01-02 14:35:00', 100.5),
+        ('2020-01-02 14:40:00', 100.5),
+        ('2020-01-02 14:45:00', 100.9),
+        ('2020-01-03 14:30:00', 102.0),
+        ('2020-01-03 14:35:00', 102.5)
+    ]
+)
+def test_intraday_prices(intraday_csv_dir, dt, expected):
+    """
+    Checks that each bar's closing price is available at the end of
+    the bar and the opening price only at the start of a session.
+    """
+    ds = CSVIntradayBarDataSource(intraday_csv_dir, Equity, bar_frequency='5min')
+    ts = pd.Timestamp(dt, tz='UTC')
+    np.testing.assert_equal(ds.get_bid(ts, 'EQ:ABC'), expected)
+    np.testing.assert_equal(ds.get_ask(ts, 'EQ:ABC'), expected)
+
+
+def test_intraday_cache_variant(intraday_csv_dir, tmp_path):
+    """
+    Checks that intraday conversions of differing bar frequencies
+    are cached separately.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    CSVIntradayBarDataSource(
+        intraday_csv_dir, Equity, bar_frequency='5min', cache_dir=cache_dir
+    )
+    ds = CSVIntradayBarDataSource(
+        intraday_csv_dir, Equity, bar_frequency='1min', cache_dir=cache_dir
+    )
+    assert len(os.listdir(cache_dir)) == 2
+    ts = pd.Timestamp('2020-01-02 14:31:00', tz='UTC')
+    assert ds.get_bid(ts, 'EQ:ABC') == 100.5
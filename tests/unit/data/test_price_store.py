@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.price_store import ArrayPriceStore
+
+
+@pytest.fixture
+def price_store():
+    index = pd.DatetimeIndex(
+        [
+            '2020-01-02 14:30:00', '2020-01-02 21:00:00',
+            '2020-01-03 14:30:00', '2020-01-03 21:00:00'
+        ],
+        tz=pytz.UTC
+    )
+    bid_ask_df = pd.DataFrame(
+        {
+            'Bid': [100.0, 101.0, 102.0, 103.0],
+            'Ask': [100.5, 101.5, 102.5, 103.5]
+        },
+        index=index
+    )
+    store = ArrayPriceStore()
+    store.add_bid_ask_frame('EQ:ABC', bid_ask_df)
+    return store
+
+
+@pytest.mark.parametrize(
+    'dt,expected_bid,expected_ask',
+    [
+        ('2020-01-01 00:00:00', np.NaN, np.NaN),
+        ('2020-01-02 14:29:59', np.NaN, np.NaN),
+        ('2020-01-02 14:30:00', 100.0, 100.5),
+        ('2020-01-02 18:00:00', 100.0, 100.5),
+        ('2020-01-02 21:00:00', 101.0, 101.5),
+        ('2020-01-03 21:00:00', 103.0, 103.5),
+        ('2020-01-10 21:00:00', 103.0, 103.5)
+    ]
+)
+def test_get_bid_ask(price_store, dt, expected_bid, expected_ask):
+    """
+    Checks that the latest bid and ask prices are returned as of
+    the provided timestamp, with NaN prior to the first price.
+    """
+    ts = pd.Timestamp(dt, tz=pytz.UTC)
+    np.testing.assert_equal(price_store.get_bid(ts, 'EQ:ABC'), expected_bid)
+    np.testing.assert_equal(price_store.get_ask(ts, 'EQ:ABC'), expected_ask)
+
+
+def test_add_remove_asset(price_store):
+    """
+    Checks that assets can be added with shared bid/ask arrays
+    and subsequently removed from the store.
+    """
+    ts = pd.Timestamp('2020-01-02 21:00:00', tz=pytz.UTC)
+    price_store.add_asset('EQ:DEF', np.array([ts.value]), np.array([50.0]))
+    assert price_store.assets == ['EQ:ABC', 'EQ:DEF']
+    assert price_store.get_ask(ts, 'EQ:DEF') == 50.0
+
+    price_store.remove_asset('EQ:DEF')
+    assert 'EQ:DEF' not in price_store
+    with pytest.raises(KeyError):
+        price_store.get_bid(ts, 'EQ:DEF')
+
+
+def test_add_asset_mismatched_lengths():
+    """
+    Checks that a ValueError is raised if the pricing arrays
+    are of differing lengths.
+    """
+    store = ArrayPriceStore()
+    with pytest.raises(ValueError):
+        store.add_asset('EQ:ABC', np.array([1, 2]), np.array([1.0]))
@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.exchange.calendar.rules import (
+    LSETradingCalendar, NYSETradingCalendar
+)
+from qstrader.exchange.calendar.static import StaticHolidayTradingCalendar
+from qstrader.exchange.calendar.weekday import WeekdayTradingCalendar
+
+
+@pytest.mark.parametrize(
+    'calendar,date,expected',
+    [
+        (WeekdayTradingCalendar(), '2020-12-25', True),
+        (WeekdayTradingCalendar(), '2020-12-26', False),
+        (NYSETradingCalendar(), '2020-12-25', False),
+        (NYSETradingCalendar(), '2021-07-05', False),
+        (NYSETradingCalendar(), '2021-12-31', True),
+        (NYSETradingCalendar(), '2012-10-29', False),
+        (NYSETradingCalendar(), '2020-08-31', True),
+        (LSETradingCalendar(), '2020-08-31', False),
+        (LSETradingCalendar(), '2020-05-04', True),
+        (LSETradingCalendar(), '2020-05-08', False),
+        (LSETradingCalendar(), '2021-12-28', False),
+        (StaticHolidayTradingCalendar(['2020-01-02']), '2020-01-02', False),
+        (StaticHolidayTradingCalendar(['2020-01-02']), '2020-01-03', True)
+    ]
+)
+def test_is_trading_day(calendar, date, expected):
+    """
+    Checks whether dates are trading days for each of the calendars.
+    """
+    dt = pd.Timestamp('%s 14:30:00' % date, tz=pytz.UTC)
+    assert calendar.is_trading_day(dt) == expected
+    assert calendar.trading_day_mask(pd.DatetimeIndex([dt]))[0] == expected
+
+
+def test_previous_trading_datetime():
+    """
+    Checks that timestamps on holidays are rolled back to the same
+    time of day on the previous trading day.
+    """
+    calendar = NYSETradingCalendar()
+    assert calendar.previous_trading_datetime(
+        pd.Timestamp('2021-05-31 21:00:00', tz=pytz.UTC)
+    ) == pd.Timestamp('2021-05-28 21:00:00', tz=pytz.UTC)
+
+
+def test_next_trading_datetime():
+    """
+    Checks that timestamps on holidays are rolled forward to the
+    same time of day on the next trading day.
+    """
+    calendar = NYSETradingCalendar()
+    assert calendar.next_trading_datetime(
+        pd.Timestamp('2021-05-29 21:00:00', tz=pytz.UTC)
+    ) == pd.Timestamp('2021-06-01 21:00:00', tz=pytz.UTC)
+
+
+def test_roll_to_trading_datetimes():
+    """
+    Checks that holiday timestamps are rolled back, unless this
+    would precede the start of the range, and that rolled
+    timestamps outside of the range are discarded.
+    """
+    calendar = NYSETradingCalendar()
+    start_dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-12-31 23:59:00', tz=pytz.UTC)
+    assert calendar.roll_to_trading_datetimes(
+        [
+            pd.Timestamp('2018-12-30 21:00:00', tz=pytz.UTC),
+            pd.Timestamp('2019-01-01 21:00:00', tz=pytz.UTC),
+            pd.Timestamp('2019-05-27 21:00:00', tz=pytz.UTC),
+            pd.Timestamp('2019-05-24 21:00:00', tz=pytz.UTC),
+            pd.Timestamp('2020-01-01 21:00:00', tz=pytz.UTC),
+            pd.Timestamp('2020-01-02 21:00:00', tz=pytz.UTC)
+        ],
+        start_dt, end_dt
+    ) == [
+        pd.Timestamp('2019-01-02 21:00:00', tz=pytz.UTC),
+        pd.Timestamp('2019-05-24 21:00:00', tz=pytz.UTC),
+        pd.Timestamp('2019-12-31 21:00:00', tz=pytz.UTC)
+    ]
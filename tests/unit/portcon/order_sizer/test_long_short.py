@@ -179,7 +179,8 @@ def test_call(total_equity, gross_leverage, weights, asset_prices, expected):
     broker.fee_model.calc_total_cost.return_value = 0.0
 
     data_handler = Mock()
-    data_handler.get_asset_latest_ask_price.side_effect = lambda self, x: asset_prices[x]
+    data_handler.get_assets_latest_ask_prices.side_effect = \
+        lambda dt, assets: {asset: asset_prices[asset] for asset in assets}
 
     order_sizer = LongShortLeveragedOrderSizer(
         broker, broker_portfolio_id, data_handler, gross_leverage
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 import pytz
 
+from qstrader.exchange.calendar.rules import NYSETradingCalendar
 from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
 from qstrader.simulation.event import SimulationEvent
 
@@ -67,3 +68,36 @@ def test_daily_rebalance(
         calculated_event = sim_events[0]
         expected_event = SimulationEvent(pd.Timestamp(sim_events[1][0], tz=pytz.UTC), sim_events[1][1])
         assert calculated_event == expected_event
+
+
+def test_event_schedule_arrays():
+    """
+    Checks that the precomputed event schedule uses the calendar date
+    of each business day irrespective of the starting time of day and
+    that the event type codes align with the event timestamps.
+    """
+    sd = pd.Timestamp('2020-01-03 14:30:00', tz=pytz.UTC)
+    ed = pd.Timestamp('2020-01-06 14:30:00', tz=pytz.UTC)
+    sim_engine = DailyBusinessDaySimulationEngine(sd, ed, post_market=False)
+
+    assert len(sim_engine) == 6
+    assert list(sim_engine.event_codes) == [0, 1, 2, 0, 1, 2]
+    assert sim_engine.event_times[3] == pd.Timestamp('2020-01-06', tz=pytz.UTC)
+    assert [event.event_type for event in sim_engine] == [
+        'pre_market', 'market_open', 'market_close'
+    ] * 2
+
+
+def test_trading_calendar_holidays_produce_no_events():
+    """
+    Checks that no events are produced on trading calendar holidays.
+    """
+    sd = pd.Timestamp('2020-12-23', tz=pytz.UTC)
+    ed = pd.Timestamp('2020-12-29', tz=pytz.UTC)
+    sim_engine = DailyBusinessDaySimulationEngine(
+        sd, ed, calendar=NYSETradingCalendar()
+    )
+    event_dates = sorted(set(event.ts.date() for event in sim_engine))
+    assert [str(date) for date in event_dates] == [
+        '2020-12-23', '2020-12-24', '2020-12-28', '2020-12-29'
+    ]
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.simulation.intraday_bar import IntradayBarSimulationEngine
+
+
+def test_intraday_bar_events():
+    """
+    Checks that the intraday bar events are generated at the bar
+    frequency within market hours on business days only.
+    """
+    sd = pd.Timestamp('2020-01-03', tz=pytz.UTC)
+    ed = pd.Timestamp('2020-01-06', tz=pytz.UTC)
+    sim_engine = IntradayBarSimulationEngine(
+        sd, ed, bar_frequency='2h', market_open='14:30', market_close='21:00'
+    )
+
+    events = [(str(event.ts), event.event_type) for event in sim_engine]
+    expected_day = [
+        ('14:30:00', 'market_open'),
+        ('16:30:00', 'market_bar'),
+        ('18:30:00', 'market_bar'),
+        ('20:30:00', 'market_bar'),
+        ('21:00:00', 'market_close')
+    ]
+    expected = [
+        ('%s %s+00:00' % (day, time), event_type)
+        for day in ('2020-01-03', '2020-01-06')
+        for time, event_type in expected_day
+    ]
+    assert events == expected
+    assert len(sim_engine) == len(expected)
+
+
+def test_intraday_bar_invalid_hours():
+    """
+    Checks that a market close prior to the market open raises
+    a ValueError.
+    """
+    sd = pd.Timestamp('2020-01-03', tz=pytz.UTC)
+    with pytest.raises(ValueError):
+        IntradayBarSimulationEngine(
+            sd, sd, market_open='21:00', market_close='14:30'
+        )
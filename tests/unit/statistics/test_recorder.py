@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytz
+import pytest
+
+from qstrader.statistics.recorder import (
+    EquityCurveRecorder, TargetAllocationRecorder
+)
+
+
+DATES = pd.date_range('2020-01-01 21:00:00', periods=5, freq='B', tz=pytz.UTC)
+
+
+def test_equity_curve_recorder_grows_and_matches_list():
+    """
+    Checks that the equity curve recorder grows beyond its initial
+    capacity and produces the same DataFrame as a list of tuples.
+    """
+    equity_curve = [(dt, 100.0 + i) for i, dt in enumerate(DATES)]
+    recorder = EquityCurveRecorder(capacity=2)
+    for item in equity_curve:
+        recorder.append(item)
+
+    assert len(recorder) == 5
+    assert list(recorder) == equity_curve
+    pd.testing.assert_frame_equal(
+        recorder.to_frame(),
+        pd.DataFrame(equity_curve, columns=['Date', 'Equity']).set_index('Date')
+    )
+
+
+def test_target_allocation_recorder_grows_and_matches_list():
+    """
+    Checks that the target allocation recorder grows beyond its
+    initial capacity in both rebalances and assets, recording NaN
+    for missing assets, and produces the same DataFrame as a list
+    of allocation dictionaries.
+    """
+    allocations = [
+        {'Date': DATES[0], 'EQ:A': 0.5, 'EQ:B': 0.5},
+        {'Date': DATES[1], 'EQ:B': 0.2, 'EQ:C': 0.8},
+        {'Date': DATES[2], 'EQ:A': 0.1, 'EQ:C': 0.3, 'EQ:D': 0.6},
+        {'Date': DATES[3], 'EQ:D': 1.0}
+    ]
+    recorder = TargetAllocationRecorder(capacity=1)
+    for alloc_dict in allocations:
+        recorder.append(alloc_dict)
+
+    assert len(recorder) == 4
+    alloc_df = recorder.to_frame()
+    pd.testing.assert_frame_equal(
+        alloc_df, pd.DataFrame(allocations).set_index('Date')
+    )
+    assert np.isnan(alloc_df.loc[DATES[3], 'EQ:A'])
+
+
+def test_recorder_empty_and_invalid_capacity():
+    """
+    Checks that empty recorders produce empty DataFrames and that
+    a non-positive capacity raises a ValueError.
+    """
+    assert EquityCurveRecorder().to_frame().empty
+    assert TargetAllocationRecorder().to_frame().empty
+    with pytest.raises(ValueError):
+        EquityCurveRecorder(capacity=0)
+    with pytest.raises(ValueError):
+        TargetAllocationRecorder(capacity=-1)
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pytz
+import pytest
+
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.statistics.json_statistics import JSONStatistics
+from qstrader.statistics.recorder import (
+    EquityCurveRecorder, TargetAllocationRecorder
+)
+from qstrader.statistics.results_sink import (
+    CSVResultsSink,
+    JSONLinesResultsSink,
+    StreamingEquityCurveRecorder,
+    StreamingPortfolioHistory,
+    StreamingTargetAllocationRecorder
+)
+from qstrader.statistics.tearsheet import TearsheetStatistics
+
+
+DATES = pd.date_range('2020-01-01 21:00:00', periods=5, freq='B', tz=pytz.UTC)
+
+
+@pytest.fixture(params=[CSVResultsSink, JSONLinesResultsSink])
+def results_sink(request, tmp_path):
+    return request.param(str(tmp_path), chunk_size=2)
+
+
+def test_streaming_equity_curve_matches_recorder(results_sink):
+    """
+    Checks that the streamed equity curve is read back identically
+    to the in-memory equity curve recorder, including full
+    floating point precision.
+    """
+    streaming = StreamingEquityCurveRecorder(results_sink)
+    recorder = EquityCurveRecorder()
+    assert streaming.to_frame().empty
+    for i, dt in enumerate(DATES):
+        streaming.record(dt, 1e6 / 3.0 + i)
+        recorder.record(dt, 1e6 / 3.0 + i)
+
+    assert len(streaming) == 5
+    pd.testing.assert_frame_equal(streaming.to_frame(), recorder.to_frame())
+    assert list(streaming) == list(recorder)
+
+
+def test_streaming_target_allocations_match_recorder(results_sink):
+    """
+    Checks that the streamed target allocations, with rebalances
+    split across chunks, are read back identically to the in-memory
+    target allocation recorder.
+    """
+    allocations = [
+        {'Date': DATES[0], 'EQ:B': 0.5, 'EQ:A': 0.5},
+        {'Date': DATES[1], 'EQ:B': 0.2, 'EQ:C': 0.8},
+        {'Date': DATES[2], 'EQ:A': 0.1, 'EQ:C': 0.3, 'EQ:D': 0.6}
+    ]
+    streaming = StreamingTargetAllocationRecorder(results_sink)
+    recorder = TargetAllocationRecorder()
+    for alloc_dict in allocations:
+        streaming.append(alloc_dict)
+        recorder.append(alloc_dict)
+
+    assert len(streaming) == 3
+    alloc_df = streaming.to_frame()
+    pd.testing.assert_frame_equal(alloc_df, recorder.to_frame())
+    assert np.isnan(alloc_df.loc[DATES[0], 'EQ:C'])
+
+
+def test_results_sink_incremental_readers(results_sink):
+    """
+    Checks that the equity curve and target allocations are read
+    back one chunk at a time, with burn-in equity discarded and each
+    rebalance yielded whole.
+    """
+    equity = StreamingEquityCurveRecorder(results_sink)
+    for i, dt in enumerate(DATES):
+        equity.record(dt, 100.0 + i)
+    equity_dfs = list(results_sink.iter_equity_curve())
+    assert [len(equity_df) for equity_df in equity_dfs] == [2, 2, 1]
+    equity_dfs = list(results_sink.iter_equity_curve(start_dt=DATES[3]))
+    assert [list(equity_df['Equity']) for equity_df in equity_dfs] == [
+        [103.0], [104.0]
+    ]
+
+    allocations = StreamingTargetAllocationRecorder(results_sink)
+    allocations.record(DATES[0], {'EQ:A': 0.2, 'EQ:B': 0.3, 'EQ:C': 0.5})
+    allocations.record(DATES[1], {'EQ:A': 1.0})
+    alloc_dfs = list(results_sink.iter_target_allocations())
+    assert [list(alloc_df.index) for alloc_df in alloc_dfs] == [
+        [DATES[0]], [DATES[1]]
+    ]
+    assert list(alloc_dfs[0].columns) == ['EQ:A', 'EQ:B', 'EQ:C']
+
+
+def test_statistics_from_results_sink_burn_in(results_sink, tmp_path):
+    """
+    Checks that the statistics created from a results sink
+    discard the results prior to the burn-in period.
+    """
+    equity = StreamingEquityCurveRecorder(results_sink)
+    allocations = StreamingTargetAllocationRecorder(results_sink)
+    allocations.record(DATES[0], {'EQ:A': 1.0})
+    for i, dt in enumerate(DATES):
+        equity.record(dt, 100.0 * (1.0 + i))
+
+    burn_in_dates = [dt.date() for dt in DATES[2:]]
+    tearsheet = TearsheetStatistics.from_results_sink(
+        results_sink, burn_in_dt=DATES[2]
+    )
+    assert list(tearsheet.strategy_equity.index) == burn_in_dates
+
+    stats = JSONStatistics.from_results_sink(
+        results_sink, burn_in_dt=DATES[2],
+        output_filename=str(tmp_path / 'statistics.json')
+    )
+    assert list(stats.equity_curve.index) == burn_in_dates
+    assert list(stats.target_allocations['EQ:A']) == [1.0, 1.0, 1.0]
+
+
+def test_streaming_portfolio_history(results_sink):
+    """
+    Checks that the streamed portfolio events of each portfolio
+    are read back identically.
+    """
+    events = [
+        PortfolioEvent.create_subscription(DATES[0], 1e6, 1e6),
+        PortfolioEvent(DATES[1], 'asset_transaction', 'LONG 100 EQ:A', 1234.5678, 0.0, 998765.4322),
+        PortfolioEvent.create_withdrawal(DATES[2], 1000.0, 997765.43)
+    ]
+    history = StreamingPortfolioHistory(results_sink, '000001', events=events[:1])
+    other_history = StreamingPortfolioHistory(results_sink, '000002')
+    for event in events[1:]:
+        history.append(event)
+    other_history.append(events[0])
+
+    assert len(history) == 3
+    assert history == events
+    assert list(other_history) == events[:1]
+
+
+def test_results_sink_invalid_chunk_size(tmp_path):
+    """
+    Checks that a non-positive chunk size raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        CSVResultsSink(str(tmp_path), chunk_size=0)
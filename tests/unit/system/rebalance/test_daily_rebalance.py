@@ -40,3 +40,27 @@ def test_daily_rebalance(
     ]
 
     assert actual_datetimes == expected_datetimes
+
+
+def test_is_rebalance_event():
+    """
+    Checks that the hashed rebalance schedule agrees with the list
+    of rebalance timestamps, including after it has been replaced
+    or modified in place.
+    """
+    sd = pd.Timestamp('2020-01-01', tz=pytz.UTC)
+    ed = pd.Timestamp('2020-01-10', tz=pytz.UTC)
+    reb = DailyRebalance(start_date=sd, end_date=ed)
+
+    assert reb.is_rebalance_event(pd.Timestamp('2020-01-02 21:00:00', tz=pytz.UTC))
+    assert not reb.is_rebalance_event(pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC))
+    assert not reb.is_rebalance_event(pd.Timestamp('2020-01-04 21:00:00', tz=pytz.UTC))
+    assert list(reb.rebalance_nanos) == [ts.value for ts in reb.rebalances]
+
+    reb.rebalances = reb.rebalances[:1]
+    assert not reb.is_rebalance_event(pd.Timestamp('2020-01-02 21:00:00', tz=pytz.UTC))
+
+    saturday = pd.Timestamp('2020-01-04 21:00:00', tz=pytz.UTC)
+    reb.rebalances.append(saturday)
+    assert reb.is_rebalance_event(saturday)
+    assert list(reb.rebalance_nanos) == [ts.value for ts in reb.rebalances]
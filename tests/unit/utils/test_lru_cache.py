@@ -0,0 +1,39 @@
+import pytest
+
+from qstrader.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """
+    Checks that the least recently used entry is evicted once the
+    capacity is exceeded and that the statistics are tracked.
+    """
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.stats == {
+        'hits': 2, 'misses': 1, 'evictions': 1, 'size': 2, 'capacity': 2
+    }
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats['hits'] == 0
+
+
+def test_lru_cache_zero_capacity():
+    """
+    Checks that a zero capacity cache never stores entries and that
+    a negative capacity raises a ValueError.
+    """
+    cache = LRUCache(0)
+    cache.put('a', 1)
+    assert cache.get('a', 'missing') == 'missing'
+
+    with pytest.raises(ValueError):
+        LRUCache(-1)
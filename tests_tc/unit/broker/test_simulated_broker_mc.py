@@ -1,8 +1,6 @@
 import sys
 sys.path.append('T:\Projects_Code\_My_Work\_Strategy_Analysis\qstrader')
 
-import queue
-
 import numpy as np
 import pandas as pd
 import pytest
@@ -10,6 +8,7 @@ import pytz
 
 
 from qstrader.asset.universe_mc.static_mc import StaticUniverse_MC
+from qstrader.broker.order_book import OrderBook
 from qstrader.broker.portfolio_mc.portfolio_mc import Portfolio_MC
 from qstrader.broker.simulated_broker_mc import SimulatedBroker_MC
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
@@ -485,7 +484,7 @@ def test_create_portfolio():
     assert "1234" in sb.portfolios
     assert isinstance(sb.portfolios["1234"], Portfolio_MC)
     assert "1234" in sb.open_orders
-    assert isinstance(sb.open_orders["1234"], queue.Queue)
+    assert isinstance(sb.open_orders["1234"], OrderBook)
 
     # If portfolio is already in the dictionary
     # then raise ValueError